@@ -6,10 +6,11 @@ different sources using semantic similarity and structural analysis.
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List, Optional
 from collections import defaultdict
 
-from .. import queries
+from .. import queries, references
 from ..exceptions import ConfigurationError
 from .config import ensure_ai_enabled
 from .embeddings import embed_text, cosine_similarity
@@ -317,30 +318,39 @@ def _generate_combined_summary(summaries: List[str]) -> str:
     return longest
 
 
+# Canonical book ids (bce.references) -> corpus source ids.
+_BOOK_SOURCES = {40: "matthew", 41: "mark", 42: "luke", 43: "john", 44: "acts"}
+# Romans (45) through Philemon (57); simplified for now.
+_PAULINE_BOOK_IDS = range(45, 58)
+
+
+# Leading book name of a reference the parser rejects as a whole
+# ("John 3:16 (NRSV)", "Matthew 27:3-10; Acts 1:18", a bare "Mark").
+_LEADING_BOOK_RE = re.compile(r"^\s*((?:[1-3]\s*)?[^\d:;,(]+)")
+
+
+def _reference_book_id(reference: str) -> Optional[int]:
+    ref = references.parse_reference(reference)
+    if ref is not None:
+        return ref.book_id
+    match = _LEADING_BOOK_RE.match(reference)
+    book = references.lookup_book(match.group(1).strip().rstrip(".")) if match else None
+    return book.id if book is not None else None
+
+
 def _parse_source_from_reference(reference: str) -> Optional[str]:
-    """Extract source ID from scripture reference."""
-    # Handle empty or whitespace-only references
-    if not reference or not reference.strip():
+    """Extract source ID from scripture reference.
+
+    Annotated or multi-book references are attributed by their leading book.
+    """
+    book_id = _reference_book_id(reference) if reference and reference.strip() else None
+    if book_id is None:
         return None
 
-    # Common patterns
-    gospels = ["Mark", "Matthew", "Luke", "John"]
-    for gospel in gospels:
-        if reference.startswith(gospel):
-            return gospel.lower()
-
-    if reference.startswith("Acts"):
-        return "acts"
-
-    # Pauline epistles
-    pauline = [
-        "Romans", "1 Corinthians", "2 Corinthians", "Galatians",
-        "Ephesians", "Philippians", "Colossians", "1 Thessalonians",
-        "2 Thessalonians", "1 Timothy", "2 Timothy", "Titus", "Philemon"
-    ]
-    for letter in pauline:
-        if reference.startswith(letter):
-            return "paul_undisputed"  # Simplified for now
+    if book_id in _BOOK_SOURCES:
+        return _BOOK_SOURCES[book_id]
+    if book_id in _PAULINE_BOOK_IDS:
+        return "paul_undisputed"
 
     return None
 
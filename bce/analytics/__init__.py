@@ -1,15 +1,30 @@
 """Analytics helpers built on the BCE graph snapshot."""
 
+from .csr import CSRGraph
+from .disagreement import DisagreementMatrix, compute_source_disagreement
 from .network import (
+    COMMUNITY_METHODS,
+    GRAPH_METRICS,
+    GraphAnalytics,
     build_networkx_graph,
     compute_betweenness_centrality,
     compute_degree_centrality,
     compute_eigenvector_centrality,
     detect_communities,
+    get_graph_analytics,
+    louvain_communities,
     shortest_path,
 )
 
 __all__ = [
+    "CSRGraph",
+    "DisagreementMatrix",
+    "compute_source_disagreement",
+    "COMMUNITY_METHODS",
+    "GRAPH_METRICS",
+    "GraphAnalytics",
+    "get_graph_analytics",
+    "louvain_communities",
     "build_networkx_graph",
     "compute_degree_centrality",
     "compute_betweenness_centrality",
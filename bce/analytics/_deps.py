@@ -0,0 +1,26 @@
+"""Lazy loaders for optional analytics dependencies."""
+
+from __future__ import annotations
+
+from typing import Any
+
+_np: Any = None
+
+
+def get_numpy() -> Any:
+    """Return the ``numpy`` module, importing it on first use.
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError(
+                "numpy is required for vectorized analytics. "
+                "Install it with: pip install 'codex-azazel[analytics]'"
+            ) from exc
+        _np = numpy
+    return _np
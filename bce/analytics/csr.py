@@ -0,0 +1,526 @@
+"""Compact integer-indexed graph core backed by CSR arrays.
+
+``CSRGraph`` maps string node IDs to dense integers and stores edges as
+compressed sparse row arrays (``indptr``/``indices``) with per-edge type
+codes, costing a few bytes per edge instead of the nested dicts of a
+NetworkX graph. Degree, PageRank, eigenvector centrality, BFS shortest
+paths, (sampled) betweenness and label-propagation communities run as NumPy
+array operations. ``to_networkx`` converts back when an
+algorithm is only available there.
+
+Requires numpy (``pip install 'codex-azazel[analytics]'``).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+
+from bce.export_graph import GraphEdge, GraphElement, GraphNode, GraphSnapshot, iter_graph_elements
+
+from ._deps import get_numpy
+
+
+class CSRGraph:
+    """Directed multigraph stored as CSR arrays over integer node indexes.
+
+    Attributes:
+        node_ids: Node ID for each integer index
+        index: Node ID -> integer index
+        node_types: Node type name per type code
+        node_type_codes: ``int8`` array of node type codes
+        edge_types: Edge type name per type code
+        indptr: ``int64`` array; out-edges of node ``i`` are
+            ``indices[indptr[i]:indptr[i + 1]]``
+        indices: ``int32`` array of edge targets, sorted by source
+        edge_type_codes: ``int8`` array of edge type codes aligned with
+            ``indices``
+        edge_ids: Edge ID aligned with ``indices``
+    """
+
+    __slots__ = (
+        "node_ids",
+        "index",
+        "node_labels",
+        "node_types",
+        "node_type_codes",
+        "edge_types",
+        "indptr",
+        "indices",
+        "edge_type_codes",
+        "edge_ids",
+        "_views",
+    )
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        node_labels: List[str],
+        node_types: List[str],
+        node_type_codes: Any,
+        edge_types: List[str],
+        indptr: Any,
+        indices: Any,
+        edge_type_codes: Any,
+        edge_ids: List[str],
+        index: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.node_ids = node_ids
+        self.index = index if index is not None else {node_id: idx for idx, node_id in enumerate(node_ids)}
+        self.node_labels = node_labels
+        self.node_types = node_types
+        self.node_type_codes = node_type_codes
+        self.edge_types = edge_types
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_type_codes = edge_type_codes
+        self.edge_ids = edge_ids
+        self._views: Dict[str, CSRGraph] = {}
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[GraphElement]) -> "CSRGraph":
+        """Build from a stream of ``GraphNode``/``GraphEdge`` objects.
+
+        Edges may precede their endpoint nodes; endpoints that never appear
+        as nodes are added with an empty type.
+        """
+        np = get_numpy()
+        node_ids: List[str] = []
+        labels: List[str] = []
+        type_names: Dict[str, int] = {}
+        node_codes: List[int] = []
+        index: Dict[str, int] = {}
+        edge_type_names: Dict[str, int] = {}
+        sources: List[str] = []
+        targets: List[str] = []
+        edge_codes: List[int] = []
+        edge_ids: List[str] = []
+
+        for element in elements:
+            if isinstance(element, GraphNode):
+                if element.id in index:
+                    continue
+                index[element.id] = len(node_ids)
+                node_ids.append(element.id)
+                labels.append(element.label)
+                node_codes.append(type_names.setdefault(element.type, len(type_names)))
+            else:
+                sources.append(element.source)
+                targets.append(element.target)
+                edge_codes.append(edge_type_names.setdefault(element.type, len(edge_type_names)))
+                edge_ids.append(element.id)
+
+        for endpoint in (*sources, *targets):
+            if endpoint not in index:
+                index[endpoint] = len(node_ids)
+                node_ids.append(endpoint)
+                labels.append(endpoint)
+                node_codes.append(type_names.setdefault("", len(type_names)))
+
+        n = len(node_ids)
+        rows = np.fromiter((index[s] for s in sources), dtype=np.int64, count=len(sources))
+        cols = np.fromiter((index[t] for t in targets), dtype=np.int32, count=len(targets))
+        codes = np.asarray(edge_codes, dtype=np.int8)
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return cls(
+            node_ids=node_ids,
+            node_labels=labels,
+            node_types=list(type_names),
+            node_type_codes=np.asarray(node_codes, dtype=np.int8),
+            edge_types=list(edge_type_names),
+            indptr=indptr,
+            indices=cols[order],
+            edge_type_codes=codes[order],
+            edge_ids=[edge_ids[i] for i in order],
+            index=index,
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Optional[GraphSnapshot] = None) -> "CSRGraph":
+        """Build from a ``GraphSnapshot``, streaming storage when omitted."""
+        if snapshot is None:
+            return cls.from_elements(iter_graph_elements())
+        return cls.from_elements([*snapshot.nodes, *snapshot.edges])
+
+    @classmethod
+    def from_arrays(cls, num_nodes: int, sources: Any, targets: Any, edge_type: str = "edge") -> "CSRGraph":
+        """Build from integer edge arrays; nodes are named ``"0"``..``"n-1"``."""
+        np = get_numpy()
+        rows = np.asarray(sources, dtype=np.int64)
+        cols = np.asarray(targets, dtype=np.int64)
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+        node_ids = [str(i) for i in range(num_nodes)]
+        return cls(
+            node_ids=node_ids,
+            node_labels=node_ids,
+            node_types=[""],
+            node_type_codes=np.zeros(num_nodes, dtype=np.int8),
+            edge_types=[edge_type],
+            indptr=indptr,
+            indices=cols[order].astype(np.int32),
+            edge_type_codes=np.zeros(rows.shape[0], dtype=np.int8),
+            edge_ids=[f"{edge_type}:{i}" for i in order],
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> "CSRGraph":
+        """Build from any NetworkX graph with ``label``/``type`` attributes."""
+        nodes = (
+            GraphNode(id=n, label=data.get("label", n), type=data.get("type", ""), properties={})
+            for n, data in graph.nodes(data=True)
+        )
+        if graph.is_multigraph():
+            edge_iter = graph.edges(keys=True, data=True)
+        else:
+            edge_iter = ((u, v, f"{u}->{v}", data) for u, v, data in graph.edges(data=True))
+        edges = (
+            GraphEdge(id=str(key), source=u, target=v, type=data.get("type", ""), properties={})
+            for u, v, key, data in edge_iter
+        )
+        return cls.from_elements([*nodes, *edges])
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.indices.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the NumPy arrays (excluding ID strings)."""
+        return int(
+            self.indptr.nbytes + self.indices.nbytes + self.edge_type_codes.nbytes + self.node_type_codes.nbytes
+        )
+
+    def sources(self) -> Any:
+        """Return the source index of every edge, aligned with ``indices``."""
+        np = get_numpy()
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+
+    def neighbors(self, node_id: str) -> List[str]:
+        """Return out-neighbour IDs of ``node_id`` (with repeats for multi-edges)."""
+        idx = self.index[node_id]
+        return [self.node_ids[j] for j in self.indices[self.indptr[idx]:self.indptr[idx + 1]]]
+
+    def _with_edges(self, rows: Any, cols: Any, codes: Any, edge_ids: List[str]) -> "CSRGraph":
+        np = get_numpy()
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.num_nodes), out=indptr[1:])
+        return CSRGraph(
+            node_ids=self.node_ids,
+            node_labels=self.node_labels,
+            node_types=self.node_types,
+            node_type_codes=self.node_type_codes,
+            edge_types=self.edge_types,
+            indptr=indptr,
+            indices=cols[order].astype(np.int32),
+            edge_type_codes=codes[order],
+            edge_ids=[edge_ids[i] for i in order],
+            index=self.index,
+        )
+
+    def simple(self) -> "CSRGraph":
+        """Directed view with parallel edges collapsed (first edge kept)."""
+        view = self._views.get("simple")
+        if view is None:
+            np = get_numpy()
+            keys = self.sources().astype(np.int64) * self.num_nodes + self.indices
+            _, first = np.unique(keys, return_index=True)
+            first.sort()
+            view = self._with_edges(
+                self.sources()[first], self.indices[first], self.edge_type_codes[first],
+                [self.edge_ids[i] for i in first],
+            )
+            self._views["simple"] = view
+        return view
+
+    def undirected(self) -> "CSRGraph":
+        """Symmetric simple view: one ``u -> v`` and ``v -> u`` per adjacent pair."""
+        view = self._views.get("undirected")
+        if view is None:
+            np = get_numpy()
+            src = self.sources()
+            rows = np.concatenate([src, self.indices]).astype(np.int64)
+            cols = np.concatenate([self.indices, src]).astype(np.int64)
+            codes = np.concatenate([self.edge_type_codes, self.edge_type_codes])
+            ids = self.edge_ids + self.edge_ids
+            _, first = np.unique(rows * self.num_nodes + cols, return_index=True)
+            view = self._with_edges(rows[first], cols[first], codes[first], [ids[i] for i in first])
+            self._views["undirected"] = view
+        return view
+
+    def out_degree(self) -> Any:
+        np = get_numpy()
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> Any:
+        np = get_numpy()
+        return np.bincount(self.indices, minlength=self.num_nodes)
+
+    def _scores(self, values: Any) -> Dict[str, float]:
+        return {node_id: float(value) for node_id, value in zip(self.node_ids, values)}
+
+    def degree_centrality(self) -> Dict[str, float]:
+        """Return (in + out) degree / (n - 1) over the simple directed view.
+
+        Matches ``networkx.degree_centrality`` on a ``DiGraph``.
+        """
+        simple = self.simple()
+        n = self.num_nodes
+        if n <= 1:
+            return {node_id: 1.0 for node_id in self.node_ids}
+        return self._scores((simple.out_degree() + simple.in_degree()) / (n - 1))
+
+    def pagerank(self, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6) -> Dict[str, float]:
+        """Return PageRank over the simple directed view by power iteration.
+
+        Dangling nodes redistribute their rank uniformly, as in
+        ``networkx.pagerank``.
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: If ``max_iter`` is reached
+        """
+        np = get_numpy()
+        simple = self.simple()
+        n = self.num_nodes
+        if n == 0:
+            return {}
+        out_degree = simple.out_degree().astype(np.float64)
+        dangling = out_degree == 0
+        src = simple.sources()
+        inv = np.zeros(n)
+        inv[~dangling] = 1.0 / out_degree[~dangling]
+        x = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            last = x
+            spread = np.bincount(simple.indices, weights=last[src] * inv[src], minlength=n)
+            x = alpha * (spread + last[dangling].sum() / n) + (1.0 - alpha) / n
+            if np.abs(x - last).sum() < n * tol:
+                return self._scores(x)
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    def eigenvector_centrality(self, max_iter: int = 1000, tol: float = 1.0e-6) -> Dict[str, float]:
+        """Return eigenvector centrality over the undirected view.
+
+        Uses the same shifted power iteration (``x <- x + A x``) and stopping
+        rule as ``networkx.eigenvector_centrality``.
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: If ``max_iter`` is reached
+        """
+        np = get_numpy()
+        und = self.undirected()
+        n = self.num_nodes
+        if n == 0:
+            return {}
+        src = und.sources()
+        x = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            last = x
+            x = last + np.bincount(und.indices, weights=last[src], minlength=n)
+            norm = np.sqrt((x * x).sum()) or 1.0
+            x = x / norm
+            if np.abs(x - last).sum() < n * tol:
+                return self._scores(x)
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    def _out_edges(self, frontier: Any) -> Tuple[Any, Any]:
+        """Return (source, target) index arrays for all out-edges of ``frontier``."""
+        np = get_numpy()
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        owners = np.repeat(frontier, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+        return owners, self.indices[offsets].astype(np.int64)
+
+    def _bfs(self, source: int, target: Optional[int] = None) -> Tuple[Any, Any]:
+        """Level-synchronous BFS; returns (distance, parent) arrays (-1 = unreached)."""
+        np = get_numpy()
+        dist = np.full(self.num_nodes, -1, dtype=np.int64)
+        parent = np.full(self.num_nodes, -1, dtype=np.int64)
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while frontier.size and (target is None or dist[target] < 0):
+            owners, nbrs = self._out_edges(frontier)
+            fresh = dist[nbrs] < 0
+            nbrs, first = np.unique(nbrs[fresh], return_index=True)
+            level += 1
+            dist[nbrs] = level
+            parent[nbrs] = owners[fresh][first]
+            frontier = nbrs
+        return dist, parent
+
+    def bfs_distances(self, source: str) -> Dict[str, int]:
+        """Return hop counts from ``source`` to every reachable node.
+
+        Raises:
+            KeyError: If ``source`` is not a node
+        """
+        dist, _ = self._bfs(self.index[source])
+        return {self.node_ids[i]: int(d) for i, d in enumerate(dist) if d >= 0}
+
+    def shortest_path(self, source: str, target: str) -> List[str]:
+        """Return an unweighted shortest path from ``source`` to ``target``.
+
+        Raises:
+            networkx.NodeNotFound: If either endpoint is not a node
+            networkx.NetworkXNoPath: If ``target`` is unreachable
+        """
+        for node_id in (source, target):
+            if node_id not in self.index:
+                raise nx.NodeNotFound(f"Node {node_id} not in graph")
+        src, dst = self.index[source], self.index[target]
+        _, parent = self._bfs(src, dst)
+        if src != dst and parent[dst] < 0:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        path = [dst]
+        while path[-1] != src:
+            path.append(int(parent[path[-1]]))
+        return [self.node_ids[i] for i in reversed(path)]
+
+    def betweenness_centrality(
+        self,
+        k: Optional[int] = None,
+        seed: Optional[int] = None,
+        normalized: bool = True,
+    ) -> Dict[str, float]:
+        """Return betweenness centrality over the simple directed view.
+
+        Runs Brandes' accumulation from every node, or from ``k`` pivots
+        drawn with ``seed`` for an unbiased estimate in ``O(k * m)``
+        instead of ``O(n * m)``. Scaling follows
+        ``networkx.betweenness_centrality`` (endpoints excluded), so exact
+        results match it.
+        """
+        np = get_numpy()
+        simple = self.simple()
+        n = self.num_nodes
+        if k is None or k >= n:
+            pivots = np.arange(n, dtype=np.int64)
+            sampled = False
+        else:
+            if k < 1:
+                raise ValueError("k must be at least 1")
+            pivots = np.random.default_rng(seed).choice(n, size=k, replace=False).astype(np.int64)
+            sampled = True
+
+        scores = np.zeros(n)
+        for pivot in pivots:
+            dist = np.full(n, -1, dtype=np.int64)
+            sigma = np.zeros(n)
+            dist[pivot] = 0
+            sigma[pivot] = 1.0
+            frontier = np.array([pivot], dtype=np.int64)
+            levels: List[Tuple[Any, Any]] = []
+            level = 0
+            while frontier.size:
+                owners, nbrs = simple._out_edges(frontier)
+                new = np.unique(nbrs[dist[nbrs] < 0])
+                dist[new] = level + 1
+                on_path = dist[nbrs] == level + 1
+                owners, nbrs = owners[on_path], nbrs[on_path]
+                np.add.at(sigma, nbrs, sigma[owners])
+                levels.append((owners, nbrs))
+                frontier = new
+                level += 1
+            delta = np.zeros(n)
+            for owners, nbrs in reversed(levels):
+                np.add.at(delta, owners, sigma[owners] / sigma[nbrs] * (1.0 + delta[nbrs]))
+            delta[pivot] = 0.0
+            scores += delta
+
+        pairs = n - 1
+        if pairs >= 2:
+            if not sampled:
+                scores *= 1.0 / (pairs * (pairs - 1)) if normalized else 1.0
+            else:
+                k_used = len(pivots)
+                per_pair = 1.0 / (pairs - 1) if normalized else float(pairs)
+                is_pivot = np.zeros(n, dtype=bool)
+                is_pivot[pivots] = True
+                scores[~is_pivot] *= per_pair / k_used
+                scores[is_pivot] *= per_pair / (k_used - 1) if k_used > 1 else 0.0
+        return self._scores(scores)
+
+    def label_propagation_communities(
+        self,
+        seed: Optional[int] = None,
+        max_iter: int = 100,
+        time_budget: Optional[float] = None,
+    ) -> List[Set[str]]:
+        """Detect communities by label propagation on the undirected view.
+
+        Each round, a random half of the nodes adopt the label most common
+        among their neighbours (ties broken at random); updating only half
+        avoids the oscillation of fully synchronous updates. Stops when no
+        label changes, after ``max_iter`` rounds, or once ``time_budget``
+        seconds have elapsed. An early stop returns the labels as they
+        stand after the last round, which may not be converged. Cost per
+        round is ``O(m log m)``.
+        """
+        np = get_numpy()
+        und = self.undirected()
+        n = self.num_nodes
+        if n == 0:
+            return []
+        rng = np.random.default_rng(seed)
+        labels = np.arange(n, dtype=np.int64)
+        src = und.sources().astype(np.int64)
+        dst = und.indices.astype(np.int64)
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        has_neighbors = np.diff(und.indptr) > 0
+
+        for _ in range(max_iter):
+            keys, counts = np.unique(src * n + labels[dst], return_counts=True)
+            owners, candidates = keys // n, keys % n
+            order = np.lexsort((rng.random(keys.shape[0]), -counts, owners))
+            first = np.ones(order.shape[0], dtype=bool)
+            first[1:] = owners[order][1:] != owners[order][:-1]
+            best = labels.copy()
+            best[owners[order][first]] = candidates[order][first]
+            update = has_neighbors & (rng.random(n) < 0.5) & (best != labels)
+            if not update.any():
+                # Confirm convergence against every node, not just this half.
+                if not (has_neighbors & (best != labels)).any():
+                    break
+            labels[update] = best[update]
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        groups: Dict[int, Set[str]] = {}
+        for node_id, label in zip(self.node_ids, labels):
+            groups.setdefault(int(label), set()).add(node_id)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def to_networkx(self) -> nx.MultiDiGraph:
+        """Export to a ``MultiDiGraph`` carrying node label/type and edge type.
+
+        Properties beyond those are not stored in the CSR core; use
+        ``network.build_networkx_graph`` for the full attribute set.
+        """
+        graph = nx.MultiDiGraph()
+        for idx, node_id in enumerate(self.node_ids):
+            graph.add_node(
+                node_id,
+                label=self.node_labels[idx],
+                type=self.node_types[self.node_type_codes[idx]],
+            )
+        for pos, (u, v) in enumerate(zip(self.sources(), self.indices)):
+            graph.add_edge(
+                self.node_ids[u],
+                self.node_ids[v],
+                key=self.edge_ids[pos],
+                type=self.edge_types[self.edge_type_codes[pos]],
+            )
+        return graph
@@ -0,0 +1,187 @@
+"""Cross-source agreement/disagreement matrices over character traits.
+
+Every ``(character, trait)`` pair becomes one row of an integer matrix whose
+columns are sources and whose cells hold an interned value ID (0 meaning the
+source is silent). Pairwise agreement and co-attestation counts for all
+sources are then computed with NumPy in one pass over the rows, optionally
+split by the ``ClaimType`` inferred for each trait.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from bce import queries
+from bce.claim_graph import ClaimType, _classify_claim_type
+from bce.models import Character
+
+from ._deps import get_numpy
+
+# Rows compared per vectorized block; bounds the (rows x S x S) temporary.
+_BLOCK_ROWS = 2048
+
+
+@dataclass(slots=True)
+class DisagreementMatrix:
+    """Pairwise source comparison counts over shared trait attestations.
+
+    ``co_attested[i][j]`` counts traits reported by both ``sources[i]`` and
+    ``sources[j]``; ``agreements`` and ``disagreements`` split that count by
+    whether the two values are identical.
+    """
+
+    sources: List[str]
+    co_attested: Any
+    agreements: Any
+    disagreements: Any
+
+    def disagreement_rates(self) -> List[List[Optional[float]]]:
+        """Return disagreements / co-attestations, or None where nothing is shared."""
+        np = get_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = self.disagreements / self.co_attested
+        return [
+            [None if np.isnan(value) else round(float(value), 4) for value in row]
+            for row in rates
+        ]
+
+    def top_pairs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return distinct source pairs ordered by disagreement count."""
+        np = get_numpy()
+        rows, cols = np.triu_indices(len(self.sources), k=1)
+        shared = self.co_attested[rows, cols]
+        keep = shared > 0
+        rows, cols = rows[keep], cols[keep]
+        disagreements = self.disagreements[rows, cols]
+        order = np.lexsort((-shared[keep], -disagreements))
+        if limit is not None:
+            order = order[:limit]
+        return [
+            {
+                "source_a": self.sources[rows[k]],
+                "source_b": self.sources[cols[k]],
+                "co_attested": int(self.co_attested[rows[k], cols[k]]),
+                "agreements": int(self.agreements[rows[k], cols[k]]),
+                "disagreements": int(disagreements[k]),
+                "disagreement_rate": round(
+                    float(disagreements[k]) / float(self.co_attested[rows[k], cols[k]]), 4
+                ),
+            }
+            for k in order
+        ]
+
+    def to_dict(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """Return a JSON-serializable, heatmap-ready representation.
+
+        ``matrix`` holds disagreement rates with rows/columns ordered as
+        ``sources``, suitable for direct use as heatmap cells.
+        """
+        return {
+            "sources": list(self.sources),
+            "matrix": self.disagreement_rates(),
+            "co_attested": self.co_attested.tolist(),
+            "agreements": self.agreements.tolist(),
+            "disagreements": self.disagreements.tolist(),
+            "pairs": self.top_pairs(top),
+        }
+
+
+def _pairwise_counts(values: Any, num_sources: int) -> tuple[Any, Any]:
+    """Return (co_attested, agreements) matrices for an (items x sources) array."""
+    np = get_numpy()
+    present = values > 0
+    weights = present.astype(np.int64)
+    co_attested = weights.T @ weights
+    agreements = np.zeros((num_sources, num_sources), dtype=np.int64)
+    for start in range(0, values.shape[0], _BLOCK_ROWS):
+        block = values[start:start + _BLOCK_ROWS]
+        mask = present[start:start + _BLOCK_ROWS]
+        equal = (block[:, :, None] == block[:, None, :]) & mask[:, :, None] & mask[:, None, :]
+        agreements += equal.sum(axis=0)
+    return co_attested, agreements
+
+
+def _matrix_from_rows(values: Any, sources: List[str]) -> DisagreementMatrix:
+    co_attested, agreements = _pairwise_counts(values, len(sources))
+    disagreements = co_attested - agreements
+    return DisagreementMatrix(
+        sources=sources,
+        co_attested=co_attested,
+        agreements=agreements,
+        disagreements=disagreements,
+    )
+
+
+def compute_source_disagreement(
+    characters: Optional[Iterable[Character]] = None,
+    sources: Optional[List[str]] = None,
+    by_claim_type: bool = False,
+) -> Dict[str, Any]:
+    """Compute source x source trait agreement/disagreement matrices.
+
+    Parameters
+    ----------
+    characters : iterable of Character, optional
+        Characters to analyze. Defaults to the whole corpus.
+    sources : list of str, optional
+        Restrict (and order) the matrix to these source IDs. Defaults to
+        every source with at least one trait, sorted.
+    by_claim_type : bool
+        When True, also return one matrix per ``ClaimType`` inferred from
+        the trait name.
+
+    Returns
+    -------
+    dict
+        ``{"overall": DisagreementMatrix, "by_claim_type": {type: matrix}}``;
+        ``by_claim_type`` is empty unless requested.
+    """
+    np = get_numpy()
+    if characters is None:
+        characters = queries.list_all_characters()
+
+    # Flatten to (row, source, value) triples; later profiles for the same
+    # source override earlier ones, matching compare_character_sources.
+    rows: List[Dict[str, str]] = []
+    row_types: List[ClaimType] = []
+    for character in characters:
+        trait_map: Dict[str, Dict[str, str]] = {}
+        for profile in character.source_profiles:
+            for trait, value in profile.traits.items():
+                trait_map.setdefault(trait, {})[profile.source_id] = value
+        for trait, per_source in trait_map.items():
+            rows.append(per_source)
+            row_types.append(_classify_claim_type(trait)[0])
+
+    if sources is None:
+        sources = sorted({source_id for per_source in rows for source_id, value in per_source.items() if value})
+    source_index = {source_id: idx for idx, source_id in enumerate(sources)}
+
+    value_ids: Dict[str, int] = {}
+    row_idx: List[int] = []
+    col_idx: List[int] = []
+    cell_values: List[int] = []
+    for r, per_source in enumerate(rows):
+        for source_id, value in per_source.items():
+            col = source_index.get(source_id)
+            if col is None or not value:
+                continue
+            row_idx.append(r)
+            col_idx.append(col)
+            cell_values.append(value_ids.setdefault(value, len(value_ids) + 1))
+
+    values = np.zeros((len(rows), len(sources)), dtype=np.int32)
+    values[np.asarray(row_idx, dtype=np.intp), np.asarray(col_idx, dtype=np.intp)] = cell_values
+
+    result: Dict[str, Any] = {
+        "overall": _matrix_from_rows(values, sources),
+        "by_claim_type": {},
+    }
+    if by_claim_type and rows:
+        type_codes = np.array([list(ClaimType).index(t) for t in row_types])
+        for code, claim_type in enumerate(ClaimType):
+            selected = values[type_codes == code]
+            if selected.shape[0]:
+                result["by_claim_type"][claim_type.value] = _matrix_from_rows(selected, sources)
+    return result
@@ -0,0 +1,185 @@
+"""Server-side force-directed graph layout.
+
+``force_layout`` runs a vectorized Fruchterman-Reingold simulation over a
+``CSRGraph`` so browsers can draw the graph at final positions instead of
+running a full force simulation on every page load. ``get_graph_layout``
+caches the corpus layout per graph version, and ``graph_payload_json``
+serves the ``/api/graph`` payload with positions as ``x``/``y`` node
+properties.
+
+Requires numpy (``pip install 'codex-azazel[analytics]'``); scipy, when
+installed, is used for the sparse spectral starting layout.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from bce.export_graph import get_default_graph_cache
+
+from ._deps import get_numpy
+from .csr import CSRGraph
+
+# Rows of the pairwise repulsion computed at once; bounds the
+# (rows x n x 2) temporary for large graphs.
+_BLOCK_ROWS = 512
+# Without scipy the spectral start needs a dense n x n eigendecomposition,
+# which is only worth it for small graphs.
+_DENSE_SPECTRAL_LIMIT = 300
+
+
+def _sparse_spectral_vectors(csr: CSRGraph, rng: Any) -> Optional[Any]:
+    """Two smallest non-trivial Laplacian eigenvectors via ``scipy.sparse``.
+
+    Returns None when scipy is not installed or ARPACK does not converge.
+    """
+    np = get_numpy()
+    try:
+        from scipy import sparse
+        from scipy.sparse.linalg import eigsh
+    except ImportError:
+        return None
+    n = csr.num_nodes
+    und = csr.undirected()
+    adjacency = sparse.csr_matrix(
+        (np.ones(len(und.indices)), (und.sources(), und.indices)), shape=(n, n)
+    )
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    # shift*I - L has L's smallest eigenvalues as its largest, which ARPACK
+    # finds far more reliably than the smallest of L itself.
+    shift = 2.0 * degree.max() + 1.0
+    shifted = sparse.diags(shift - degree) + adjacency
+    try:
+        values, vectors = eigsh(shifted, k=3, which="LA", v0=rng.uniform(0.5, 1.5, n), tol=1e-6)
+    except Exception:
+        return None
+    order = np.argsort(-values)
+    return vectors[:, order[1:3]]
+
+
+def _spectral_start(csr: CSRGraph, rng: Any, dense_limit: int = _DENSE_SPECTRAL_LIMIT) -> Optional[Any]:
+    """Initial positions along the two smallest non-trivial Laplacian eigenvectors.
+
+    Uses a sparse eigensolver when scipy is installed and a dense one for
+    graphs up to ``dense_limit`` nodes otherwise; returns None when neither
+    applies.
+    """
+    np = get_numpy()
+    n = csr.num_nodes
+    if n <= 2:
+        return rng.uniform(-1.0, 1.0, (n, 2))
+    start = _sparse_spectral_vectors(csr, rng) if n > 3 else None
+    if start is None:
+        if n > dense_limit:
+            return None
+        und = csr.undirected()
+        adjacency = np.zeros((n, n))
+        adjacency[und.sources(), und.indices] = 1.0
+        laplacian = np.diag(adjacency.sum(axis=1)) - adjacency
+        _, vectors = np.linalg.eigh(laplacian)
+        start = vectors[:, 1:3]
+    return start + rng.normal(scale=1e-3, size=(n, 2))
+
+
+def force_layout(
+    csr: CSRGraph,
+    iterations: int = 100,
+    seed: int = 0,
+    spectral_limit: int = 2000,
+    gravity: float = 1.0,
+) -> Any:
+    """Return an ``(n, 2)`` array of positions scaled to ``[-1, 1]``.
+
+    Parameters
+    ----------
+    csr : CSRGraph
+        Graph to lay out; edges are treated as undirected.
+    iterations : int
+        Simulation steps; the step size cools linearly to zero.
+    seed : int
+        Seed for the jitter and (for large graphs) random start, so the
+        same graph always gets the same layout.
+    spectral_limit : int
+        Graphs up to this many nodes start from a spectral embedding
+        (sparse eigensolver with scipy; without it, dense and only up to
+        300 nodes); larger ones start at random.
+    gravity : float
+        Pull toward the origin, which keeps disconnected components from
+        drifting apart.
+    """
+    np = get_numpy()
+    n = csr.num_nodes
+    if n == 0:
+        return np.zeros((0, 2))
+    if n == 1:
+        return np.zeros((1, 2))
+
+    rng = np.random.default_rng(seed)
+    pos = _spectral_start(csr, rng) if n <= spectral_limit else None
+    if pos is None:
+        pos = rng.uniform(-1.0, 1.0, (n, 2))
+    pos = pos / (np.abs(pos).max() or 1.0)
+
+    und = csr.undirected()
+    src, dst = und.sources(), und.indices
+    k = np.sqrt(1.0 / n)
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        disp = np.zeros((n, 2))
+        for start in range(0, n, _BLOCK_ROWS):
+            delta = pos[start:start + _BLOCK_ROWS, None, :] - pos[None, :, :]
+            dist2 = np.maximum((delta * delta).sum(axis=2), 1e-4)
+            disp[start:start + _BLOCK_ROWS] = (delta * (k * k / dist2)[:, :, None]).sum(axis=1)
+        # Each undirected edge appears once per direction in ``und``.
+        delta = pos[src] - pos[dst]
+        dist = np.maximum(np.sqrt((delta * delta).sum(axis=1)), 1e-2)
+        pull = delta * (dist / k)[:, None]
+        np.subtract.at(disp, src, pull)
+        disp -= gravity * pos
+        length = np.maximum(np.sqrt((disp * disp).sum(axis=1)), 1e-9)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    pos -= pos.mean(axis=0)
+    return pos / (np.abs(pos).max() or 1.0)
+
+
+def compute_layout(csr: CSRGraph, iterations: int = 100, seed: int = 0) -> Dict[str, Tuple[float, float]]:
+    """Return ``{node_id: (x, y)}`` from ``force_layout``, rounded for transport."""
+    pos = force_layout(csr, iterations=iterations, seed=seed)
+    return {
+        node_id: (round(float(x), 4), round(float(y), 4))
+        for node_id, (x, y) in zip(csr.node_ids, pos)
+    }
+
+
+def get_graph_layout(iterations: Optional[int] = None) -> Dict[str, Tuple[float, float]]:
+    """Return the corpus graph layout, computed once per graph version."""
+    cache = get_default_graph_cache()
+    steps = 100 if iterations is None else iterations
+    return cache.derived(
+        f"layout:{steps}",
+        lambda: compute_layout(CSRGraph.from_snapshot(cache.snapshot()), iterations=steps),
+    )
+
+
+def graph_payload_json() -> str:
+    """Return the graph payload with ``x``/``y`` node properties as JSON.
+
+    Cached per graph version alongside the layout. Node dicts are copied
+    with positions added; edge dicts are shared with the plain payload.
+    """
+    cache = get_default_graph_cache()
+
+    def build() -> str:
+        layout = get_graph_layout()
+        payload = cache.payload()
+        nodes = []
+        for node in payload["nodes"]:
+            x, y = layout.get(node["id"], (0.0, 0.0))
+            nodes.append({**node, "properties": {**node["properties"], "x": x, "y": y}})
+        return json.dumps({"nodes": nodes, "edges": payload["edges"]}, ensure_ascii=False)
+
+    return cache.derived("payload_json:layout", build)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import networkx as nx
 
-from bce.export_graph import GraphSnapshot, build_graph_snapshot
+from bce.export_graph import GraphSnapshot, build_graph_snapshot, get_default_graph_cache
+
+from .csr import CSRGraph
+
+GRAPH_METRICS: Tuple[str, ...] = ("degree", "pagerank", "betweenness", "eigenvector", "communities")
+COMMUNITY_METHODS: Tuple[str, ...] = ("greedy", "label_propagation", "louvain")
+
+# Options that change a metric's result, and so form part of its memo key.
+_METRIC_OPTIONS: Dict[str, Tuple[str, ...]] = {
+    "betweenness": ("betweenness_k", "seed"),
+    "communities": ("community_method", "seed", "time_budget"),
+}
 
 
 def build_networkx_graph(snapshot: Optional[GraphSnapshot] = None) -> nx.MultiDiGraph:
@@ -42,39 +55,311 @@ def _as_simple_graph(graph: nx.MultiDiGraph) -> nx.Graph:
     return simple
 
 
+def _pagerank(
+    graph: nx.DiGraph, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6
+) -> Dict[str, float]:
+    """Pure-Python PageRank used when numpy is not installed.
+
+    ``networkx.pagerank`` itself needs numpy and scipy. This is the same
+    power iteration as ``CSRGraph.pagerank`` (dangling nodes redistribute
+    their rank uniformly, same stopping rule) over plain dicts.
+
+    Raises:
+        networkx.PowerIterationFailedConvergence: If ``max_iter`` is reached
+    """
+    n = graph.number_of_nodes()
+    if n == 0:
+        return {}
+    out_degree = dict(graph.out_degree())
+    dangling = [node for node, degree in out_degree.items() if degree == 0]
+    x = dict.fromkeys(graph, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        base = alpha * sum(last[node] for node in dangling) / n + (1.0 - alpha) / n
+        x = dict.fromkeys(graph, base)
+        for node, degree in out_degree.items():
+            if degree:
+                share = alpha * last[node] / degree
+                for target in graph.successors(node):
+                    x[target] += share
+        if sum(abs(x[node] - last[node]) for node in x) < n * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def parse_metrics(spec: Optional[str | Iterable[str]]) -> List[str]:
+    """Normalize a comma-separated or iterable list of metric names.
+
+    Raises:
+        ValueError: If an unknown metric is requested
+    """
+    if spec is None:
+        return list(GRAPH_METRICS)
+    items = spec.split(",") if isinstance(spec, str) else list(spec)
+    metrics = list(dict.fromkeys(item.strip().lower() for item in items if item and item.strip()))
+    unknown = [name for name in metrics if name not in GRAPH_METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown graph metric(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(GRAPH_METRICS)}"
+        )
+    return metrics
+
+
+def louvain_communities(
+    graph: nx.Graph,
+    seed: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> List[Set[str]]:
+    """Run Louvain community detection, stopping once ``time_budget`` elapses.
+
+    Louvain yields one partition per aggregation level; the budget is
+    checked between levels, so the first level always completes. The last
+    completed level is returned, largest community first.
+    """
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    partition: List[Set[str]] = [{node} for node in graph]
+    for level in nx.algorithms.community.louvain_partitions(graph, seed=seed):
+        partition = [set(comm) for comm in level]
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+    return sorted(partition, key=len, reverse=True)
+
+
+class GraphAnalytics:
+    """A built graph plus its simple views and memoized metric results.
+
+    The ``MultiDiGraph`` and its simple directed/undirected copies are built
+    at most once per session, and each metric is computed at most once.
+    When numpy is installed, degree, PageRank, eigenvector centrality and
+    unweighted shortest paths run on the compact ``CSRGraph`` core instead;
+    the NetworkX graph is then only built for the remaining metrics.
+    ``get_graph_analytics`` keeps one session per corpus version, so the
+    module-level helpers and ``api.graph_*`` share results until an entity
+    is saved.
+    """
+
+    def __init__(
+        self,
+        snapshot: Optional[GraphSnapshot] = None,
+        graph: Optional[nx.MultiDiGraph] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        self.version = version
+        self._snapshot = snapshot
+        self._graph = graph
+        self._digraph: Optional[nx.DiGraph] = None
+        self._undirected: Optional[nx.Graph] = None
+        self._csr: Optional[CSRGraph] = None
+        self._csr_checked = False
+        self._results: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def graph(self) -> nx.MultiDiGraph:
+        """The full ``MultiDiGraph``; treat as read-only."""
+        with self._lock:
+            if self._graph is None:
+                self._graph = build_networkx_graph(self._snapshot)
+            return self._graph
+
+    @property
+    def digraph(self) -> nx.DiGraph:
+        """Simple directed view with parallel edges collapsed."""
+        with self._lock:
+            if self._digraph is None:
+                self._digraph = _as_simple_digraph(self.graph)
+            return self._digraph
+
+    @property
+    def undirected(self) -> nx.Graph:
+        """Simple undirected view."""
+        with self._lock:
+            if self._undirected is None:
+                self._undirected = _as_simple_graph(self.graph)
+            return self._undirected
+
+    @property
+    def csr(self) -> Optional[CSRGraph]:
+        """Integer-indexed CSR core, or None when numpy is not installed."""
+        with self._lock:
+            if not self._csr_checked:
+                self._csr_checked = True
+                try:
+                    if self._graph is None:
+                        self._csr = CSRGraph.from_snapshot(self._snapshot or build_graph_snapshot())
+                    else:
+                        self._csr = CSRGraph.from_networkx(self._graph)
+                except ImportError:
+                    self._csr = None
+            return self._csr
+
+    def _compute(self, metric: str, options: Dict[str, Any]) -> Any:
+        csr = self.csr
+        if metric == "degree":
+            return csr.degree_centrality() if csr is not None else nx.degree_centrality(self.digraph)
+        if metric == "pagerank":
+            return csr.pagerank() if csr is not None else _pagerank(self.digraph)
+        if metric == "betweenness":
+            k, seed = options["betweenness_k"], options["seed"]
+            if csr is not None:
+                return csr.betweenness_centrality(k=k, seed=seed)
+            if k is not None and k >= self.digraph.number_of_nodes():
+                k = None
+            return nx.betweenness_centrality(self.digraph, k=k, seed=seed)
+        if metric == "eigenvector":
+            if csr is not None:
+                return csr.eigenvector_centrality(max_iter=1000)
+            if self.undirected.number_of_nodes() == 0:
+                return {}
+            return nx.eigenvector_centrality(self.undirected, max_iter=1000)
+        return self._communities(options["community_method"], options["seed"], options["time_budget"])
+
+    def _communities(self, method: str, seed: Optional[int], time_budget: Optional[float]) -> List[Set[str]]:
+        if method == "label_propagation" and self.csr is not None:
+            return self.csr.label_propagation_communities(seed=seed, time_budget=time_budget)
+        if self.undirected.number_of_nodes() == 0:
+            return []
+        community = nx.algorithms.community
+        if method == "greedy":
+            return [set(comm) for comm in community.greedy_modularity_communities(self.undirected)]
+        if method == "label_propagation":
+            return [set(comm) for comm in community.asyn_lpa_communities(self.undirected, seed=seed)]
+        return louvain_communities(self.undirected, seed=seed, time_budget=time_budget)
+
+    def metric(self, name: str, **options: Any) -> Any:
+        """Return one metric, computing it on first use.
+
+        ``options`` are the keyword arguments accepted by ``compute``.
+        """
+        return self.compute([name], **options)[name]
+
+    def compute(
+        self,
+        metrics: Optional[str | Iterable[str]] = None,
+        betweenness_k: Optional[int] = None,
+        seed: Optional[int] = None,
+        community_method: str = "greedy",
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Return the requested metrics (all by default) in one call.
+
+        Parameters
+        ----------
+        metrics : str or iterable of str, optional
+            Names drawn from ``GRAPH_METRICS``.
+        betweenness_k : int, optional
+            Estimate betweenness from this many sampled pivot nodes instead
+            of all nodes.
+        seed : int, optional
+            Seed for pivot sampling and randomized community detection.
+        community_method : str
+            One of ``COMMUNITY_METHODS``: ``greedy`` (modularity),
+            ``label_propagation`` or ``louvain``.
+        time_budget : float, optional
+            Seconds after which label propagation or Louvain stop and return
+            their current partition.
+
+        Results are memoized per metric and options, so repeated or
+        overlapping requests only pay for what was not computed yet.
+        Returned values are shared with the session and must not be mutated.
+
+        Raises
+        ------
+        ValueError
+            If a metric or community method is unknown.
+        """
+        selected = parse_metrics(metrics)
+        if community_method not in COMMUNITY_METHODS:
+            raise ValueError(
+                f"Unknown community method: {community_method}. "
+                f"Choose from: {', '.join(COMMUNITY_METHODS)}"
+            )
+        options = {
+            "betweenness_k": betweenness_k,
+            "seed": seed,
+            "community_method": community_method,
+            "time_budget": time_budget,
+        }
+        with self._lock:
+            results: Dict[str, Any] = {}
+            for name in selected:
+                key = (name, *(options[opt] for opt in _METRIC_OPTIONS.get(name, ())))
+                if key not in self._results:
+                    self._results[key] = self._compute(name, options)
+                results[name] = self._results[key]
+            return results
+
+    def shortest_path(self, source: str, target: str, weight: Optional[str] = None) -> List[str]:
+        """Find a shortest path between two node IDs on the directed view."""
+        csr = self.csr if weight is None else None
+        if csr is not None:
+            return csr.shortest_path(source, target)
+        return nx.shortest_path(self.digraph, source=source, target=target, weight=weight)
+
+
+_session: Optional[GraphAnalytics] = None
+_session_lock = threading.Lock()
+
+
+def get_graph_analytics() -> GraphAnalytics:
+    """Return the analytics session for the current corpus version."""
+    global _session
+    cache = get_default_graph_cache()
+    with _session_lock:
+        if _session is None or _session.version != cache.version:
+            # snapshot() may (re)build the cache, so read the version after it.
+            snapshot = cache.snapshot()
+            _session = GraphAnalytics(snapshot=snapshot, version=cache.version)
+        return _session
+
+
+def _analytics_for(graph: Optional[nx.MultiDiGraph]) -> GraphAnalytics:
+    return get_graph_analytics() if graph is None else GraphAnalytics(graph=graph)
+
+
 def compute_degree_centrality(graph: Optional[nx.MultiDiGraph] = None) -> Dict[str, float]:
     """Return degree centrality for all nodes."""
 
-    graph = graph or build_networkx_graph()
-    return nx.degree_centrality(_as_simple_digraph(graph))
+    return dict(_analytics_for(graph).metric("degree"))
 
 
-def compute_betweenness_centrality(graph: Optional[nx.MultiDiGraph] = None) -> Dict[str, float]:
-    """Return betweenness centrality for all nodes."""
+def compute_betweenness_centrality(
+    graph: Optional[nx.MultiDiGraph] = None,
+    k: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Dict[str, float]:
+    """Return betweenness centrality for all nodes.
+
+    Pass ``k`` to estimate from ``k`` pivot nodes sampled with ``seed``.
+    """
 
-    graph = graph or build_networkx_graph()
-    return nx.betweenness_centrality(_as_simple_digraph(graph))
+    return dict(_analytics_for(graph).metric("betweenness", betweenness_k=k, seed=seed))
 
 
 def compute_eigenvector_centrality(graph: Optional[nx.MultiDiGraph] = None) -> Dict[str, float]:
     """Return eigenvector centrality for all nodes using an undirected view."""
 
-    graph = graph or build_networkx_graph()
-    undirected = _as_simple_graph(graph)
-    if undirected.number_of_nodes() == 0:
-        return {}
-    return nx.eigenvector_centrality(undirected, max_iter=1000)
-
+    return dict(_analytics_for(graph).metric("eigenvector"))
 
-def detect_communities(graph: Optional[nx.MultiDiGraph] = None) -> List[Set[str]]:
-    """Detect communities using greedy modularity clustering on an undirected view."""
 
-    graph = graph or build_networkx_graph()
-    undirected = _as_simple_graph(graph)
-    if undirected.number_of_nodes() == 0:
-        return []
+def detect_communities(
+    graph: Optional[nx.MultiDiGraph] = None,
+    method: str = "greedy",
+    seed: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> List[Set[str]]:
+    """Detect communities on an undirected view.
+
+    ``method`` is ``greedy`` (modularity clustering), ``label_propagation``
+    or ``louvain``; the latter two accept a ``seed`` and a ``time_budget``
+    in seconds.
+    """
 
-    communities = nx.algorithms.community.greedy_modularity_communities(undirected)
+    communities = _analytics_for(graph).metric(
+        "communities", community_method=method, seed=seed, time_budget=time_budget
+    )
     return [set(comm) for comm in communities]
 
 
@@ -93,12 +378,10 @@ def shortest_path(
     target : str
         Target node identifier (e.g., ``"event:crucifixion"``).
     graph : nx.MultiDiGraph, optional
-        Existing graph to search. If omitted, a new graph is built from
-        ``build_graph_snapshot``.
+        Existing graph to search. If omitted, the cached analytics session
+        for the current corpus is used.
     weight : str, optional
         Optional edge attribute to use as edge weight when computing the path.
     """
 
-    graph = graph or build_networkx_graph()
-    simple = _as_simple_digraph(graph)
-    return nx.shortest_path(simple, source=source, target=target, weight=weight)
+    return _analytics_for(graph).shortest_path(source, target, weight=weight)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from . import (
+    corpus_stats,
     dossiers,
     queries,
     contradictions,
@@ -10,8 +11,10 @@ from . import (
     export,
     export_graph,
     bibles,
+    concordance,
 )
 from .analytics import network as graph_network
+from .exceptions import DataNotFoundError
 
 
 # Core data access
@@ -115,7 +118,7 @@ def list_events() -> List[str]:
 # Dossiers
 
 
-def build_character_dossier(char_id: str) -> Dict[str, Any]:
+def build_character_dossier(char_id: str, hydrate_text: Optional[str] = None) -> Dict[str, Any]:
     """Build a comprehensive JSON-friendly dossier for a character.
 
     A dossier includes the character's identity (name, aliases, roles, tags),
@@ -126,6 +129,9 @@ def build_character_dossier(char_id: str) -> Dict[str, Any]:
     ----------
     char_id : str
         Character identifier
+    hydrate_text : str, optional
+        Translation code; when given, the dossier also carries
+        ``texts_by_source`` with the verse text of every reference
 
     Returns
     -------
@@ -148,7 +154,7 @@ def build_character_dossier(char_id: str) -> Dict[str, Any]:
     dict_keys(['conversion_timeline', 'authority_source'])
     """
 
-    return dossiers.build_character_dossier(char_id)
+    return dossiers.build_character_dossier(char_id, hydrate_text=hydrate_text)
 
 
 def build_event_dossier(event_id: str) -> Dict[str, Any]:
@@ -273,6 +279,33 @@ def summarize_event_conflicts(event_id: str) -> Dict[str, Dict[str, Any]]:
     return contradictions.summarize_event_conflicts(event_id)
 
 
+def get_corpus_stats() -> Dict[str, Any]:
+    """Return corpus-wide statistics from the materialized stats view.
+
+    The view is computed on first use and then patched incrementally when
+    characters or events are saved, so repeated calls do not reload the
+    corpus.
+
+    Returns
+    -------
+    dict
+        Counts (``total_characters``, ``total_events``, ``total_tags``),
+        conflict totals (``total_conflicts``, ``conflicts_by_severity``,
+        ``conflicts_by_category``), ``tags`` and ``tag_frequencies``, and
+        ``source_coverage`` mapping each source ID to the number of
+        characters and events it covers.
+
+    Examples
+    --------
+    >>> from bce import api
+    >>> stats = api.get_corpus_stats()
+    >>> stats["source_coverage"]["mark"]["characters"] > 0
+    True
+    """
+
+    return corpus_stats.get_corpus_stats()
+
+
 # Tags and search
 
 
@@ -377,6 +410,50 @@ def export_citations(format: str = "bibtex") -> List[str]:
     return export.export_citations(format=format)
 
 
+def export_graph_bulk(out_dir: str, formats: Optional[str | List[str]] = None) -> Dict[str, List[str]]:
+    """Stream the graph to Neo4j import CSV, GraphML and/or NDJSON files.
+
+    Thin wrapper around ``bce.export_graph_bulk.export_graph_bulk``. Returns
+    the written files per format, relative to ``out_dir``.
+    """
+
+    return export.export_graph_bulk(out_dir, formats=formats)
+
+
+def export_sqlite(output_path: str) -> Dict[str, int]:
+    """Export the corpus to a normalized, indexed SQLite database.
+
+    Thin wrapper around ``bce.export_sqlite.export_sqlite``. Returns the row
+    count per table.
+    """
+
+    return export.export_sqlite(output_path)
+
+
+def export_corpus(
+    out_dir: str,
+    formats: Optional[str | List[str]] = None,
+    jobs: int = 1,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """Export the corpus to several formats in one job.
+
+    Thin wrapper around ``bce.export_pipeline.run_export``. Only outputs
+    whose inputs changed since the last run are rewritten unless ``force``
+    is set. Returns written, skipped and removed files plus per-stage
+    timings in seconds.
+    """
+
+    report = export.run_export(out_dir, formats=formats, jobs=jobs, force=force)
+    return {
+        "out_dir": str(report.out_dir),
+        "outputs": report.outputs,
+        "skipped": report.skipped,
+        "removed": report.removed,
+        "timings": report.timings,
+    }
+
+
 # Graph snapshot
 
 
@@ -389,6 +466,83 @@ def build_graph_snapshot() -> export_graph.GraphSnapshot:
     return export_graph.build_graph_snapshot()
 
 
+def graph_payload_json(with_layout: bool = True) -> str:
+    """Return the graph snapshot serialized as a JSON ``{"nodes", "edges"}`` object.
+
+    The payload is cached and only re-serialized for entities saved since
+    the previous call. With ``with_layout`` (and numpy installed), each
+    node's properties also carry precomputed ``x``/``y`` coordinates in
+    ``[-1, 1]``, computed once per corpus version.
+    """
+
+    if with_layout:
+        try:
+            from .analytics import layout
+
+            return layout.graph_payload_json()
+        except ImportError:
+            pass
+    return export_graph.get_default_graph_cache().payload_json()
+
+
+def graph_neighborhood(
+    node_id: str,
+    hops: int = 1,
+    edge_types: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    positions: bool = False,
+) -> Dict[str, Any]:
+    """Return the ego network around one graph node.
+
+    Parameters
+    ----------
+    node_id : str
+        Namespaced node ID such as ``"character:jesus"``.
+    hops : int
+        Maximum number of edges (in either direction) from ``node_id``.
+    edge_types : list of str, optional
+        Only follow and return edges of these types.
+    limit : int, optional
+        Maximum number of nodes, nearest first; ``truncated`` reports
+        whether nodes were dropped.
+    positions : bool
+        Also return ``positions`` mapping node ID to ``[x, y]`` taken from
+        the cached corpus layout, so clients can render without running a
+        layout. Without numpy the key is omitted and clients lay the graph
+        out themselves.
+
+    Returns
+    -------
+    dict
+        ``center``, ``hops``, ``nodes``, ``edges`` (same shapes as the
+        ``/api/graph`` payload), ``depth`` (node ID -> hop count) and
+        ``truncated``.
+
+    Raises
+    ------
+    DataNotFoundError
+        If ``node_id`` is not in the graph.
+    ValueError
+        If ``hops`` is negative or ``limit`` is below 1.
+    """
+
+    try:
+        result = export_graph.get_default_graph_cache().neighborhood(
+            node_id, hops=hops, edge_types=edge_types, limit=limit
+        )
+    except KeyError:
+        raise DataNotFoundError(f"Graph node not found: {node_id}") from None
+    if positions:
+        try:
+            from .analytics.layout import get_graph_layout
+
+            layout = get_graph_layout()
+        except ImportError:
+            return result
+        result["positions"] = {node: list(layout.get(node, (0.0, 0.0))) for node in result["depth"]}
+    return result
+
+
 def build_networkx_graph():
     """Construct a NetworkX graph from the BCE graph snapshot."""
 
@@ -398,31 +552,148 @@ def build_networkx_graph():
 def graph_degree_centrality() -> dict[str, float]:
     """Compute degree centrality for the BCE graph."""
 
-    return graph_network.compute_degree_centrality()
+    return dict(graph_network.get_graph_analytics().metric("degree"))
+
 
+def graph_betweenness_centrality(k: int | None = None, seed: int | None = None) -> dict[str, float]:
+    """Compute betweenness centrality for the BCE graph.
 
-def graph_betweenness_centrality() -> dict[str, float]:
-    """Compute betweenness centrality for the BCE graph."""
+    Pass ``k`` to estimate it from ``k`` pivot nodes sampled with ``seed``.
+    """
 
-    return graph_network.compute_betweenness_centrality()
+    return dict(graph_network.get_graph_analytics().metric("betweenness", betweenness_k=k, seed=seed))
 
 
 def graph_eigenvector_centrality() -> dict[str, float]:
     """Compute eigenvector centrality for the BCE graph."""
 
-    return graph_network.compute_eigenvector_centrality()
+    return dict(graph_network.get_graph_analytics().metric("eigenvector"))
+
 
+def graph_pagerank() -> dict[str, float]:
+    """Compute PageRank for the BCE graph."""
 
-def graph_communities() -> list[set[str]]:
-    """Detect communities within the BCE graph."""
+    return dict(graph_network.get_graph_analytics().metric("pagerank"))
 
-    return graph_network.detect_communities()
+
+def graph_communities(
+    method: str = "greedy",
+    seed: int | None = None,
+    time_budget: float | None = None,
+) -> list[set[str]]:
+    """Detect communities within the BCE graph.
+
+    ``method`` is ``greedy``, ``label_propagation`` or ``louvain``; see
+    ``bce.analytics.network.GraphAnalytics.compute``.
+    """
+
+    communities = graph_network.get_graph_analytics().metric(
+        "communities", community_method=method, seed=seed, time_budget=time_budget
+    )
+    return [set(comm) for comm in communities]
 
 
 def graph_shortest_path(source: str, target: str, weight: str | None = None) -> list[str]:
     """Return a shortest path between two graph node IDs."""
 
-    return graph_network.shortest_path(source=source, target=target, weight=weight)
+    return graph_network.get_graph_analytics().shortest_path(source, target, weight=weight)
+
+
+def graph_metrics(
+    metrics: Optional[str | List[str]] = None,
+    top: Optional[int] = None,
+    betweenness_k: Optional[int] = None,
+    seed: Optional[int] = None,
+    community_method: str = "greedy",
+    time_budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Compute several graph metrics in one call.
+
+    Results are memoized per corpus version, so repeated requests are free
+    until a character or event is saved.
+
+    Parameters
+    ----------
+    metrics : str or list of str, optional
+        Comma-separated string or list drawn from ``degree``, ``pagerank``,
+        ``betweenness``, ``eigenvector`` and ``communities``. Defaults to all.
+    top : int, optional
+        Keep only the ``top`` highest-scoring nodes of each centrality.
+    betweenness_k : int, optional
+        Estimate betweenness from this many sampled pivot nodes.
+    seed : int, optional
+        Seed for pivot sampling and randomized community detection.
+    community_method : str
+        ``greedy``, ``label_propagation`` or ``louvain``.
+    time_budget : float, optional
+        Seconds allowed for label propagation or Louvain.
+
+    Returns
+    -------
+    dict
+        Metric name -> ``{node_id: score}`` ordered by descending score, or
+        for ``communities`` a list of sorted node-ID lists, largest first.
+
+    Raises
+    ------
+    ValueError
+        If an unknown metric or community method is requested.
+    """
+
+    results = graph_network.get_graph_analytics().compute(
+        metrics,
+        betweenness_k=betweenness_k,
+        seed=seed,
+        community_method=community_method,
+        time_budget=time_budget,
+    )
+    payload: Dict[str, Any] = {}
+    for name, value in results.items():
+        if name == "communities":
+            payload[name] = [sorted(comm) for comm in sorted(value, key=lambda c: (-len(c), min(c)))]
+        else:
+            ranked = sorted(value.items(), key=lambda item: (-item[1], item[0]))
+            payload[name] = dict(ranked[:top] if top is not None else ranked)
+    return payload
+
+
+def source_disagreement_matrix(
+    by_claim_type: bool = False,
+    sources: Optional[List[str]] = None,
+    top: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return the source x source trait disagreement matrix.
+
+    Thin wrapper around ``bce.analytics.disagreement.compute_source_disagreement``
+    that returns heatmap-ready dicts. Requires numpy.
+
+    Parameters
+    ----------
+    by_claim_type : bool
+        Also include one matrix per inferred claim type under
+        ``"by_claim_type"``.
+    sources : list of str, optional
+        Restrict (and order) the matrix to these source IDs.
+    top : int, optional
+        Limit the ranked ``pairs`` list in each matrix.
+
+    Returns
+    -------
+    dict
+        ``sources``, ``matrix`` (disagreement rates), ``co_attested``,
+        ``agreements``, ``disagreements`` and ``pairs``, plus
+        ``by_claim_type`` mapping claim type to the same structure.
+    """
+
+    from .analytics import disagreement
+
+    result = disagreement.compute_source_disagreement(sources=sources, by_claim_type=by_claim_type)
+    payload = result["overall"].to_dict(top=top)
+    payload["by_claim_type"] = {
+        claim_type: matrix.to_dict(top=top)
+        for claim_type, matrix in result["by_claim_type"].items()
+    }
+    return payload
 
 
 # Bible text helpers
@@ -434,6 +705,16 @@ def list_bible_translations() -> List[str]:
     return bibles.list_translations()
 
 
+def list_bible_translation_info(language: Optional[str] = None) -> List[Dict[str, Any]]:
+    """List bundled Bible translations with their language and metadata summary.
+
+    ``language`` filters by language directory (e.g. ``"ES-Spanish"``) or
+    metadata language (``"Spanish"``/``"es"``). Only file headers are read.
+    """
+
+    return [info.to_dict() for info in bibles.list_translation_info(language)]
+
+
 def get_verse_text(book: str, chapter: int, verse: int, translation: str = "web") -> str:
     """Return Bible verse text for the given reference and translation."""
 
@@ -451,6 +732,110 @@ def get_parallel_verse_text(
     return bibles.get_parallel(book, chapter, verse, translations=translations)
 
 
+def get_passage_text(
+    book: Union[str, int],
+    start_chapter: int,
+    start_verse: int,
+    end_chapter: int,
+    end_verse: int,
+    translation: str = "web",
+    join: Optional[str] = None,
+    skip_missing: bool = False,
+) -> Union[List[str], str]:
+    """Return the verses of a (possibly cross-chapter) range as a list or joined string."""
+
+    return bibles.get_range(
+        book,
+        start_chapter,
+        start_verse,
+        end_chapter,
+        end_verse,
+        translation=translation,
+        join=join,
+        skip_missing=skip_missing,
+    )
+
+
+def get_parallel_passage_text(
+    book: Union[str, int],
+    start_chapter: int,
+    start_verse: int,
+    end_chapter: int,
+    end_verse: int,
+    translations: List[str],
+    join: Optional[str] = None,
+    skip_missing: bool = False,
+) -> Dict[str, Union[List[str], str]]:
+    """Return a verse range for each translation, keyed by translation code."""
+
+    return bibles.get_parallel_range(
+        book,
+        start_chapter,
+        start_verse,
+        end_chapter,
+        end_verse,
+        translations=translations,
+        join=join,
+        skip_missing=skip_missing,
+    )
+
+
+def search_verses(
+    query: str,
+    translation: str = "web",
+    offset: int = 0,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """Search Bible verse text with the translation's concordance index.
+
+    The index is built on first use and persisted next to the translation.
+
+    Parameters
+    ----------
+    query : str
+        Words (all must match), ``"exact phrases"``, or proximity
+        groups such as ``"scape goote"~3`` (words within 3 of each other,
+        any order). Matching ignores case and accents.
+    translation : str, optional
+        Translation code (see ``list_bible_translations``).
+    offset, limit : int, optional
+        Page of ranked results to return (default: first 20).
+
+    Returns
+    -------
+    dict
+        ``query``, ``translation``, ``total``, ``offset``, ``limit`` and
+        ``results`` (``reference``, ``book``, ``chapter``, ``verse``,
+        ``text``, ``score``), best match first.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the translation does not exist
+    ValueError
+        If ``offset`` is negative or ``limit`` is below 1
+    """
+
+    return concordance.search_verses(query, translation=translation, offset=offset, limit=limit)
+
+
+def get_bible_cache_stats() -> Dict[str, Any]:
+    """Return Bible translation cache metrics.
+
+    Includes the memory budget (``BCE_BIBLE_CACHE_MB``), estimated bytes in
+    use, hit/miss/eviction counts and per-translation size estimates in
+    most-recently-used order.
+    """
+
+    return bibles.cache_stats()
+
+
+def preload_bible_translations(translations: Optional[List[str]] = None) -> List[str]:
+    """Load translations ahead of first use (default: ``BCE_BIBLE_PRELOAD``)."""
+
+    return bibles.preload_translations(translations)
+
+
 # AI-powered features (Phase 6+)
 # These features require enable_ai_features=True in BceConfig
 
@@ -1,12 +1,46 @@
 from __future__ import annotations
 
+import bisect
+import codecs
 import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
-
-
-_BIBLES_ROOT = Path(__file__).resolve().parent / "data" / "bibles" / "EN-English"
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import references
+
+
+_BIBLES_DIR = Path(__file__).resolve().parent / "data" / "bibles"
+# Shared reference data (book name tables, languages) rather than a translation.
+_EXTRAS_DIR_NAME = "Extras"
+_HEADER_CHUNK = 16 * 1024
+
+# Translations are compiled once from JSON into a binary verse store that is
+# read through ``mmap``: lookups are O(1) slot arithmetic and every process
+# shares the OS page cache instead of holding its own parsed copy.
+#
+# Layout (little-endian):
+#   header   magic, format version, slot count, source JSON size and mtime,
+#            then (offset, length) of each section below
+#   metadata the translation's ``metadata`` block as UTF-8 JSON
+#   books    [{"name", "number", "chapters": [[chapter, first_slot, max_verse]]}]
+#   offsets  uint32[slots + 1]; slot i's text is blob[offsets[i]:offsets[i+1]]
+#   present  uint8[slots]; 0 marks a verse number the source skips
+#   text     UTF-8 blob of all verse texts in canonical order
+#
+# Each chapter owns a contiguous run of slots numbered by verse, so a
+# passage is one slice of the blob.
+COMPILED_SUFFIX = ".bcev"
+_MAGIC = b"BCEV"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sIIQQ" + "QQ" * 5)
+_FALLBACK_DIR = Path(tempfile.gettempdir()) / "bce-bibles"
 
 
 def _normalize_book_key(name: str) -> str:
@@ -16,84 +50,640 @@ def _normalize_book_key(name: str) -> str:
 
 
 @dataclass
-class _BibleIndex:
+class _Book:
+    name: str
+    number: int
+    # chapter -> (first slot, highest verse number)
+    chapters: Dict[int, Tuple[int, int]]
+
+
+class _BibleStore:
+    """Read-only, memory-mapped view of one compiled translation."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = _HEADER.unpack_from(self._mm, 0)
+        except struct.error as exc:
+            self._mm.close()
+            raise ValueError(f"Not a compiled Bible store: {path}") from exc
+        if header[0] != _MAGIC or header[1] != _FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a compiled Bible store: {path}")
+
+        self.path = path
+        self.slot_count: int = header[2]
+        self.source_size: int = header[3]
+        self.source_mtime_ns: int = header[4]
+        spans = header[5:]
+        meta_off, meta_len = spans[0], spans[1]
+        books_off, books_len = spans[2], spans[3]
+        self._offsets_off = spans[4]
+        self._present_off = spans[6]
+        self._text_off = spans[8]
+
+        self.metadata: Dict[str, Any] = json.loads(self._mm[meta_off:meta_off + meta_len])
+        self.books: Dict[str, _Book] = {}
+        self.book_keys: Dict[str, str] = {}
+        for entry in json.loads(self._mm[books_off:books_off + books_len]):
+            book = _Book(
+                name=entry["name"],
+                number=entry["number"],
+                chapters={chapter: (first, last) for chapter, first, last in entry["chapters"]},
+            )
+            self.books[book.name] = book
+            self.book_keys.setdefault(_normalize_book_key(book.name), book.name)
+        self._chapter_starts: Optional[List[Tuple[int, str, int]]] = None
+        self._chapter_firsts: List[int] = []
+        # Caches built from this store (e.g. its concordance index), with
+        # their estimated sizes. They are counted in ``size_estimate`` and
+        # released when the translation cache evicts the store.
+        self.derived: Dict[str, Any] = {}
+        self._derived_sizes: Dict[str, int] = {}
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mm)
+
+    @property
+    def size_estimate(self) -> int:
+        """Approximate memory held: the mapping, the parsed book table and derived caches."""
+
+        chapters = sum(len(book.chapters) for book in self.books.values())
+        return self.nbytes + 1024 * len(self.books) + 200 * chapters + sum(self._derived_sizes.values())
+
+    def set_derived(self, key: str, value: Any, size: int) -> None:
+        """Attach a derived cache; call ``_CACHE.resize`` afterwards to re-budget."""
+
+        self.derived[key] = value
+        self._derived_sizes[key] = size
+
+    def release_derived(self) -> None:
+        self.derived.clear()
+        self._derived_sizes.clear()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def find_book(self, name: Union[str, int]) -> Optional[_Book]:
+        """Find a book by name (normalized) or by canonical book number."""
+
+        if isinstance(name, int):
+            return next((book for book in self.books.values() if book.number == name), None)
+        canonical = self.book_keys.get(_normalize_book_key(name))
+        return None if canonical is None else self.books[canonical]
+
+    def slot(self, book: _Book, chapter: int, verse: int) -> Optional[int]:
+        """Return the slot of a verse, or None if the source lacks it."""
+
+        bounds = book.chapters.get(chapter)
+        if bounds is None or not 1 <= verse <= bounds[1]:
+            return None
+        slot = bounds[0] + verse - 1
+        return slot if self._mm[self._present_off + slot] else None
+
+    def locate(self, slot: int) -> Tuple[str, int, int]:
+        """Return the ``(book name, chapter, verse)`` stored in ``slot``."""
+
+        if self._chapter_starts is None:
+            self._chapter_starts = sorted(
+                (first, book.name, chapter)
+                for book in self.books.values()
+                for chapter, (first, _) in book.chapters.items()
+            )
+            self._chapter_firsts = [entry[0] for entry in self._chapter_starts]
+        first, name, chapter = self._chapter_starts[bisect.bisect_right(self._chapter_firsts, slot) - 1]
+        return name, chapter, slot - first + 1
+
+    def reference(self, book: _Book, slot: int) -> Tuple[int, int]:
+        """Return the ``(chapter, verse)`` stored in ``slot`` of ``book``."""
+
+        for chapter, (first, last_verse) in book.chapters.items():
+            if first <= slot < first + last_verse:
+                return chapter, slot - first + 1
+        raise IndexError(slot)
+
+    def texts(self, first: int, last: int) -> List[Optional[str]]:
+        """Return texts for slots ``first``..``last`` inclusive (None where absent)."""
+
+        count = last - first + 1
+        offsets = struct.unpack_from(f"<{count + 1}I", self._mm, self._offsets_off + 4 * first)
+        base = self._text_off + offsets[0]
+        blob = self._mm[base:self._text_off + offsets[-1]]
+        present = self._mm[self._present_off + first:self._present_off + last + 1]
+        start = offsets[0]
+        return [
+            blob[offsets[i] - start:offsets[i + 1] - start].decode("utf-8") if present[i] else None
+            for i in range(count)
+        ]
+
+    def text(self, slot: int) -> str:
+        start, end = struct.unpack_from("<II", self._mm, self._offsets_off + 4 * slot)
+        return self._mm[self._text_off + start:self._text_off + end].decode("utf-8")
+
+
+class _TranslationCache:
+    """LRU cache of open translation stores bounded by estimated memory.
+
+    A store's size estimate is its mapped file (the most it can pin in the
+    page cache) plus its parsed book table. The most recently used store is
+    always kept even if it alone exceeds the budget. Evicted stores drop
+    their derived caches but are not closed explicitly; their mapping is
+    released once no caller still holds a reference.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self._max_bytes = max_bytes
+        self._stores: "OrderedDict[str, _BibleStore]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is None:
+            from .config import get_default_config
+
+            return int(get_default_config().bible_cache_mb * 1024 * 1024)
+        return self._max_bytes
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def __contains__(self, translation: str) -> bool:
+        return translation in self._stores
+
+    def get(self, translation: str) -> Optional[_BibleStore]:
+        with self._lock:
+            store = self._stores.get(translation)
+            if store is None:
+                self.misses += 1
+                return None
+            self._stores.move_to_end(translation)
+            self.hits += 1
+            return store
+
+    def put(self, translation: str, store: _BibleStore) -> None:
+        with self._lock:
+            self._stores[translation] = store
+            self._stores.move_to_end(translation)
+            self._sizes[translation] = store.size_estimate
+            self._evict()
+
+    def resize(self, translation: str) -> None:
+        """Re-estimate a store after its derived caches changed, evicting if over budget."""
+
+        with self._lock:
+            store = self._stores.get(translation)
+            if store is None:
+                return
+            self._sizes[translation] = store.size_estimate
+            self._evict()
+
+    def _evict(self) -> None:
+        budget = self.max_bytes
+        while len(self._stores) > 1 and self.used_bytes > budget:
+            evicted, store = self._stores.popitem(last=False)
+            del self._sizes[evicted]
+            store.release_derived()
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for store in self._stores.values():
+                store.release_derived()
+            self._stores.clear()
+            self._sizes.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "max_bytes": self.max_bytes,
+                "used_bytes": self.used_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "translations": [
+                    {"translation": code, "size_bytes": self._sizes[code]}
+                    for code in reversed(self._stores)
+                ],
+            }
+
+
+_CACHE = _TranslationCache()
+
+
+@dataclass(frozen=True)
+class TranslationInfo:
+    """A bundled translation discovered in a language directory."""
+
+    code: str
+    language_dir: str
+    path: Path
     metadata: Dict[str, Any]
-    books: Dict[str, Dict[int, Dict[int, str]]]
-    book_keys: Dict[str, str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "code": self.code,
+            "language_dir": self.language_dir,
+            "name": self.metadata.get("name"),
+            "shortname": self.metadata.get("shortname"),
+            "lang": self.metadata.get("lang"),
+            "lang_short": self.metadata.get("lang_short"),
+            "year": self.metadata.get("year"),
+        }
+
+
+# path -> (size, mtime_ns, metadata); reparsed only when the file changes.
+_METADATA_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+_METADATA_LOCK = threading.Lock()
+
+
+def _read_metadata_header(path: Path) -> Dict[str, Any]:
+    """Return a translation file's ``metadata`` block without parsing its verses.
+
+    The top-level object is decoded one member at a time from a growing
+    buffer, reading small chunks until the ``metadata`` value closes. The
+    bundled files put ``metadata`` first, so this reads a few kilobytes;
+    members that come before it are skipped by decoding them.
+    """
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    eof = False
+
+    with path.open("rb") as f:
+
+        def more() -> bool:
+            nonlocal buf, eof
+            if eof:
+                return False
+            chunk = f.read(_HEADER_CHUNK)
+            eof = not chunk
+            buf += utf8.decode(chunk, final=eof)
+            return not eof
+
+        def skip(chars: str) -> None:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf):
+                    break
+                if not more():
+                    raise ValueError(f"Unexpected end of Bible JSON file: {path}")
+            if buf[pos] not in chars:
+                raise ValueError(f"Malformed Bible JSON file {path}: expected {chars!r} at {pos}")
+            pos += 1
+
+        def value() -> Any:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                try:
+                    result, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if more():
+                        continue
+                    raise
+                # A bare number may continue past the buffer end.
+                if end == len(buf) and more():
+                    continue
+                pos = end
+                return result
+
+        skip("{")
+        while True:
+            key = value()
+            skip(":")
+            member = value()
+            if key == "metadata":
+                return member if isinstance(member, dict) else {}
+            try:
+                skip(",")
+            except ValueError:
+                return {}
+
+
+def _translation_metadata(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    with _METADATA_LOCK:
+        cached = _METADATA_CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+    metadata = _read_metadata_header(path)
+    with _METADATA_LOCK:
+        _METADATA_CACHE[path] = (stat.st_size, stat.st_mtime_ns, metadata)
+    return metadata
+
+
+def _language_dirs() -> List[Path]:
+    if not _BIBLES_DIR.exists():
+        return []
+    return sorted(
+        p for p in _BIBLES_DIR.iterdir() if p.is_dir() and p.name != _EXTRAS_DIR_NAME
+    )
 
-_CACHE: Dict[str, _BibleIndex] = {}
 
+def _translation_paths() -> Dict[str, Path]:
+    """Map translation code to JSON path across all language directories.
 
-def list_translations() -> List[str]:
-    """Return available translation codes based on JSON files present."""
+    If two directories ship the same code, the first in sorted order wins.
+    """
 
-    if not _BIBLES_ROOT.exists():
-        return []
-    return sorted(p.stem for p in _BIBLES_ROOT.glob("*.json") if p.is_file())
+    paths: Dict[str, Path] = {}
+    for language_dir in _language_dirs():
+        for path in sorted(language_dir.glob("*.json")):
+            if path.is_file():
+                paths.setdefault(path.stem, path)
+    return paths
 
 
-def _load_translation(translation: str) -> _BibleIndex:
-    if translation in _CACHE:
-        return _CACHE[translation]
+def list_translations(language: Optional[str] = None) -> List[str]:
+    """Return available translation codes across all language directories.
 
-    path = _BIBLES_ROOT / f"{translation}.json"
-    if not path.exists():
+    ``language`` filters by language directory (``"ES-Spanish"``) or by the
+    metadata's ``lang``/``lang_short`` (``"Spanish"``, ``"es"``), case-insensitively.
+    """
+
+    if language is None:
+        return sorted(_translation_paths())
+    return [info.code for info in list_translation_info(language)]
+
+
+def list_translation_info(language: Optional[str] = None) -> List[TranslationInfo]:
+    """Return registry entries (code, language directory, metadata) sorted by code."""
+
+    infos = [
+        TranslationInfo(
+            code=code,
+            language_dir=path.parent.name,
+            path=path,
+            metadata=_translation_metadata(path),
+        )
+        for code, path in sorted(_translation_paths().items())
+    ]
+    if language is None:
+        return infos
+    wanted = language.lower()
+    return [
+        info
+        for info in infos
+        if wanted in {
+            info.language_dir.lower(),
+            str(info.metadata.get("lang", "")).lower(),
+            str(info.metadata.get("lang_short", "")).lower(),
+        }
+    ]
+
+
+def _source_path(translation: str) -> Path:
+    path = _translation_paths().get(translation)
+    if path is None:
         raise FileNotFoundError(
-            f"Bible JSON file not found for translation {translation!r}: {path}"
+            f"Bible JSON file not found for translation {translation!r} under {_BIBLES_DIR}"
         )
+    return path
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    metadata = data.get("metadata", {})
-    books: Dict[str, Dict[int, Dict[int, str]]] = {}
-    book_keys: Dict[str, str] = {}
+def compile_translation(source: Path | str, output: Path | str) -> Path:
+    """Compile a translation JSON file into a binary verse store at ``output``.
+
+    The store is written to a temporary file and renamed into place, so
+    concurrent readers never map a partial file.
+    """
+
+    source = Path(source)
+    output = Path(output)
+    stat = source.stat()
+    with source.open("r", encoding="utf-8") as f:
+        data = json.load(f)
 
+    numbers: Dict[str, int] = {}
+    chapters: Dict[str, Dict[int, Dict[int, str]]] = {}
     for verse in data.get("verses", []):
         book_name = verse.get("book_name")
         if not book_name:
             continue
         chapter = int(verse.get("chapter", 0))
         verse_num = int(verse.get("verse", 0))
-        text = verse.get("text", "")
-
         if not chapter or not verse_num:
             continue
+        numbers.setdefault(book_name, int(verse.get("book", 0) or 0))
+        chapters.setdefault(book_name, {}).setdefault(chapter, {})[verse_num] = verse.get("text", "")
+
+    books: List[Dict[str, Any]] = []
+    offsets: List[int] = [0]
+    present = bytearray()
+    blob = bytearray()
+    order = sorted(numbers, key=lambda name: numbers[name] or len(numbers) + 1)
+    for name in order:
+        entry: Dict[str, Any] = {"name": name, "number": numbers[name], "chapters": []}
+        for chapter in sorted(chapters[name]):
+            verses = chapters[name][chapter]
+            last = max(verses)
+            entry["chapters"].append([chapter, len(present), last])
+            for number in range(1, last + 1):
+                text = verses.get(number)
+                present.append(text is not None)
+                if text is not None:
+                    blob += text.encode("utf-8")
+                offsets.append(len(blob))
+        books.append(entry)
+
+    sections = [
+        json.dumps(data.get("metadata", {}), ensure_ascii=False).encode("utf-8"),
+        json.dumps(books, ensure_ascii=False).encode("utf-8"),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        bytes(present),
+        bytes(blob),
+    ]
+    spans: List[int] = []
+    position = _HEADER.size
+    for section in sections:
+        spans += [position, len(section)]
+        position += len(section)
+    header = _HEADER.pack(
+        _MAGIC, _FORMAT_VERSION, len(present), stat.st_size, stat.st_mtime_ns, *spans
+    )
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for section in sections:
+                f.write(section)
+        os.replace(tmp_name, output)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return output
+
+
+def _compiled_paths(source: Path, suffix: str = COMPILED_SUFFIX) -> List[Path]:
+    """Candidate locations for a file derived from ``source``: next to it, then a temp directory."""
+
+    return [
+        source.with_suffix(suffix),
+        _FALLBACK_DIR / source.parent.name / f"{source.stem}{suffix}",
+    ]
+
+
+def _open_fresh(path: Path, source: Path) -> Optional[_BibleStore]:
+    """Open ``path`` if it is a store compiled from the current ``source``."""
+
+    if not path.exists():
+        return None
+    try:
+        store = _BibleStore(path)
+    except (OSError, ValueError):
+        return None
+    stat = source.stat()
+    if store.source_size != stat.st_size or store.source_mtime_ns != stat.st_mtime_ns:
+        store.close()
+        return None
+    return store
+
+
+def _load_translation(translation: str) -> _BibleStore:
+    cached = _CACHE.get(translation)
+    if cached is not None:
+        return cached
+
+    source = _source_path(translation)
+    candidates = _compiled_paths(source)
+    store = next(
+        (s for s in (_open_fresh(path, source) for path in candidates) if s is not None),
+        None,
+    )
+    if store is None:
+        for path in candidates:
+            try:
+                store = _BibleStore(compile_translation(source, path))
+                break
+            except OSError:
+                continue
+        else:
+            raise OSError(f"Could not write a compiled store for translation {translation!r}")
+
+    _CACHE.put(translation, store)
+    return store
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return translation cache usage: budget, hits/misses and per-translation sizes."""
 
-        books.setdefault(book_name, {}).setdefault(chapter, {})[verse_num] = text
+    return _CACHE.stats()
 
-        key = _normalize_book_key(book_name)
-        if key not in book_keys:
-            book_keys[key] = book_name
 
-    index = _BibleIndex(metadata=metadata, books=books, book_keys=book_keys)
-    _CACHE[translation] = index
-    return index
+def clear_cache() -> None:
+    """Drop all cached translation stores and reset the hit/miss counters."""
+
+    _CACHE.clear()
+
+
+def preload_translations(translations: Optional[List[str]] = None) -> List[str]:
+    """Load (and compile if needed) translations ahead of first use.
+
+    Defaults to ``BceConfig.bible_preload`` (``BCE_BIBLE_PRELOAD``). Returns
+    the codes that were loaded; unknown codes are skipped.
+    """
+
+    if translations is None:
+        from .config import get_default_config
+
+        translations = get_default_config().bible_preload
+    loaded: List[str] = []
+    for code in translations:
+        try:
+            _load_translation(code)
+        except FileNotFoundError:
+            continue
+        loaded.append(code)
+    return loaded
 
 
 def get_translation_metadata(translation: str) -> Dict[str, Any]:
-    """Return the metadata block for a translation."""
+    """Return the metadata block for a translation.
 
-    index = _load_translation(translation)
-    return index.metadata
+    Reads only the file's header, so this does not load or compile the
+    translation.
+    """
+
+    return _translation_metadata(_source_path(translation))
+
+
+def _find_book(store: _BibleStore, book: Union[str, int], translation: str) -> _Book:
+    found = store.find_book(book)
+    if found is None:
+        raise KeyError(f"Unknown book name {book!r} for translation {translation!r}")
+    return found
 
 
 def get_verse(book: str, chapter: int, verse: int, translation: str = "web") -> str:
     """Return the verse text for the given reference."""
 
-    index = _load_translation(translation)
-    key = _normalize_book_key(book)
-    canonical = index.book_keys.get(key)
-    if canonical is None:
-        raise KeyError(f"Unknown book name {book!r} for translation {translation!r}")
+    store = _load_translation(translation)
+    slot = store.slot(_find_book(store, book, translation), chapter, verse)
+    if slot is None:
+        raise KeyError(
+            f"Verse not found for {book} {chapter}:{verse} in translation {translation!r}"
+        )
+    return store.text(slot)
 
-    try:
-        return index.books[canonical][chapter][verse]
-    except KeyError as exc:
+
+def get_range(
+    book: Union[str, int],
+    start_chapter: int,
+    start_verse: int,
+    end_chapter: int,
+    end_verse: int,
+    translation: str = "web",
+    join: Optional[str] = None,
+    skip_missing: bool = False,
+) -> Union[List[str], str]:
+    """Return the verses from ``start_chapter:start_verse`` to ``end_chapter:end_verse``.
+
+    A book's verses are stored in canonical order, so the range (including
+    one spanning chapters, e.g. Mark 14:66-15:5) is read as a single slice.
+    ``book`` is a book name or canonical book number (1-66). Both endpoints
+    must exist. Verses the translation omits inside the range raise ``KeyError`` unless ``skip_missing`` is set. With ``join`` the
+    texts are returned as one string joined by that separator.
+    """
+
+    if (end_chapter, end_verse) < (start_chapter, start_verse):
+        raise ValueError("range end must not precede range start")
+    store = _load_translation(translation)
+    found = _find_book(store, book, translation)
+    first = store.slot(found, start_chapter, start_verse)
+    last = store.slot(found, end_chapter, end_verse)
+    if first is None or last is None:
+        chapter, verse = (start_chapter, start_verse) if first is None else (end_chapter, end_verse)
         raise KeyError(
             f"Verse not found for {book} {chapter}:{verse} in translation {translation!r}"
-        ) from exc
+        )
+
+    texts = store.texts(first, last)
+    if not skip_missing:
+        gap = next((i for i, text in enumerate(texts) if text is None), None)
+        if gap is not None:
+            chapter, verse = store.reference(found, first + gap)
+            raise KeyError(
+                f"Verse not found for {book} {chapter}:{verse} in translation {translation!r}"
+            )
+    present = [text for text in texts if text is not None]
+    return present if join is None else join.join(present)
 
 
 def get_passage(
@@ -107,10 +697,51 @@ def get_passage(
 
     if end_verse < start_verse:
         raise ValueError("end_verse must be >= start_verse")
-    return [
-        get_verse(book, chapter, v, translation=translation)
-        for v in range(start_verse, end_verse + 1)
-    ]
+    return get_range(book, chapter, start_verse, chapter, end_verse, translation=translation)  # type: ignore[return-value]
+
+
+def get_parallel_range(
+    book: str,
+    start_chapter: int,
+    start_verse: int,
+    end_chapter: int,
+    end_verse: int,
+    translations: List[str],
+    join: Optional[str] = None,
+    skip_missing: bool = False,
+) -> Dict[str, Union[List[str], str]]:
+    """Return ``get_range`` for each translation, keyed by translation code.
+
+    Translations name books in their own language, so ``book`` is resolved
+    to its canonical number in the first translation that recognizes it and
+    looked up by number in the others.
+    """
+
+    number: Optional[int] = None
+    for code in translations:
+        found = _load_translation(code).find_book(book)
+        if found is not None:
+            number = found.number
+            break
+
+    def book_for(code: str) -> Union[str, int]:
+        if number is None or _load_translation(code).find_book(book) is not None:
+            return book
+        return number
+
+    return {
+        code: get_range(
+            book_for(code),
+            start_chapter,
+            start_verse,
+            end_chapter,
+            end_verse,
+            translation=code,
+            join=join,
+            skip_missing=skip_missing,
+        )
+        for code in translations
+    }
 
 
 def get_parallel(
@@ -125,3 +756,99 @@ def get_parallel(
     for code in translations:
         result[code] = get_verse(book, chapter, verse, translation=code)
     return result
+
+
+# Resolved references live on their store (``store.derived``) so the
+# translation cache budget bounds them and eviction drops them.
+_RESOLVED_KEY = "resolved"
+_RESOLVED_MAX_ENTRIES = 4096
+_RESOLVED_LOCK = threading.Lock()
+
+
+def _resolved_entry_size(ref: str, text: Optional[str]) -> int:
+    return 2 * (len(ref) + len(text or "")) + 120
+
+
+def _reference_spans(store: _BibleStore, text: str) -> Optional[List[Tuple[int, int]]]:
+    """Return the ``(first, last)`` slot span of each part of a reference string."""
+
+    spans: List[Tuple[int, int]] = []
+    for ref in references.parse_references(text):
+        if ref.end < ref.start:
+            # Reversed range ("Mark 14:10-5", "Matthew 7-5").
+            return None
+        book = store.find_book(ref.book_id)
+        start = book.chapters.get(ref.chapter) if book else None
+        end = book.chapters.get(ref.end_chapter) if book else None
+        if start is None or end is None or (ref.verse_start or 1) > start[1]:
+            return None
+        # Whole chapters, and ranges running past a chapter's end, stop at
+        # the last verse the translation has.
+        end_verse = min(ref.verse_end or end[1], end[1])
+        spans.append((start[0] + (ref.verse_start or 1) - 1, end[0] + end_verse - 1))
+    return spans or None
+
+
+def resolve_references(refs: Iterable[str], translation: str = "web") -> Dict[str, Optional[str]]:
+    """Return the verse text for each reference string, keyed by the string.
+
+    References are parsed once with ``bce.references`` (any bundled book
+    name or abbreviation), their slot spans are merged so neighbouring and
+    overlapping passages share one read, and each merged run is read as a
+    single slice. Multi-part references ("Mark 14:10-11, 43-50") join their
+    parts with a space. References that do not parse or that the translation
+    lacks map to None. Results are cached on the translation's store (at
+    most ``_RESOLVED_MAX_ENTRIES``, oldest dropped first) and counted in the
+    translation cache budget.
+    """
+
+    store = _load_translation(translation)
+    with _RESOLVED_LOCK:
+        resolved: Dict[str, Optional[str]] = store.derived.get(_RESOLVED_KEY) or {}
+
+    ordered = list(dict.fromkeys(refs))
+    result: Dict[str, Optional[str]] = {}
+    pending: Dict[str, List[Tuple[int, int]]] = {}
+    for ref in ordered:
+        if ref in resolved:
+            result[ref] = resolved[ref]
+            continue
+        spans = _reference_spans(store, ref)
+        if spans is None:
+            result[ref] = None
+        else:
+            pending[ref] = spans
+
+    if pending:
+        # Slots follow canonical book/chapter order, so sorting the spans
+        # groups them by book and chapter and adjacent runs merge.
+        runs: List[List[int]] = []
+        for first, last in sorted({span for spans in pending.values() for span in spans}):
+            if runs and first <= runs[-1][1] + 1:
+                runs[-1][1] = max(runs[-1][1], last)
+            else:
+                runs.append([first, last])
+        texts: Dict[int, Optional[str]] = {}
+        for first, last in runs:
+            texts.update(zip(range(first, last + 1), store.texts(first, last)))
+
+        for ref, spans in pending.items():
+            parts = [
+                texts[slot]
+                for first, last in spans
+                for slot in range(first, last + 1)
+                if texts[slot] is not None
+            ]
+            result[ref] = " ".join(parts) if parts else None  # type: ignore[arg-type]
+
+    if any(ref not in resolved for ref in ordered):
+        with _RESOLVED_LOCK:
+            # Copy on write: concurrent callers may still be reading ``resolved``.
+            cached = dict(store.derived.get(_RESOLVED_KEY) or {})
+            cached.update((ref, result[ref]) for ref in ordered if ref not in cached)
+            for ref in list(cached)[: max(0, len(cached) - _RESOLVED_MAX_ENTRIES)]:
+                del cached[ref]
+            size = sum(_resolved_entry_size(ref, text) for ref, text in cached.items())
+            store.set_derived(_RESOLVED_KEY, cached, size)
+        _CACHE.resize(translation)
+    return {ref: result[ref] for ref in ordered}
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable, List
+import logging
+from typing import Callable, List, Optional
 
 from .exceptions import CacheError
 
+logger = logging.getLogger(__name__)
+
 
 class CacheRegistry:
     """Registry for cache invalidation callbacks.
@@ -21,9 +24,15 @@ class CacheRegistry:
         >>>
         >>> # Later, when data changes:
         >>> CacheRegistry.invalidate_all()
+
+    Materialized views that can patch themselves for a single changed entity
+    register an *entity listener* instead. Listeners are called with
+    ``(entity_type, entity_id)`` after a save, or with ``(None, None)`` when
+    everything must be rebuilt.
     """
 
     _invalidators: List[Callable[[], None]] = []
+    _entity_listeners: List[Callable[[Optional[str], Optional[str]], None]] = []
 
     @classmethod
     def register(cls, invalidator: Callable[[], None]) -> None:
@@ -56,24 +65,85 @@ class CacheRegistry:
         except ValueError:
             raise CacheError(f"Invalidator {invalidator} was not registered")
 
+    @classmethod
+    def register_entity_listener(
+        cls, listener: Callable[[Optional[str], Optional[str]], None]
+    ) -> None:
+        """Register a callback notified about individual entity changes.
+
+        Parameters:
+            listener: A callable taking ``(entity_type, entity_id)``; both are
+                None when all cached state must be discarded
+
+        Raises:
+            CacheError: If listener is not callable
+        """
+        if not callable(listener):
+            raise CacheError(f"Entity listener must be callable, got {type(listener)}")
+
+        if listener not in cls._entity_listeners:
+            cls._entity_listeners.append(listener)
+
+    @classmethod
+    def unregister_entity_listener(
+        cls, listener: Callable[[Optional[str], Optional[str]], None]
+    ) -> None:
+        """Unregister an entity listener.
+
+        Raises:
+            CacheError: If listener was not registered
+        """
+        try:
+            cls._entity_listeners.remove(listener)
+        except ValueError:
+            raise CacheError(f"Entity listener {listener} was not registered")
+
     @classmethod
     def invalidate_all(cls) -> None:
         """Invalidate all registered caches.
 
-        Calls each registered invalidator in registration order.
+        Calls each registered invalidator in registration order, then tells
+        every entity listener to discard its state.
         If an invalidator fails, the error is propagated and remaining
         invalidators are not called.
         """
         for invalidator in cls._invalidators:
             invalidator()
+        for listener in list(cls._entity_listeners):
+            listener(None, None)
+
+    @classmethod
+    def invalidate_entity(cls, entity_type: str, entity_id: str) -> None:
+        """Invalidate caches after a single character or event changed.
+
+        Plain invalidators are cleared exactly as in ``invalidate_all``;
+        entity listeners receive the changed entity so they can update
+        incrementally instead of rebuilding.
+
+        This runs after the entity was written, so a failing listener is
+        logged and skipped: it must not fail the save or keep the remaining
+        listeners from hearing about the change.
+
+        Parameters:
+            entity_type: ``"character"`` or ``"event"``
+            entity_id: Identifier of the saved entity
+        """
+        for invalidator in cls._invalidators:
+            invalidator()
+        for listener in list(cls._entity_listeners):
+            try:
+                listener(entity_type, entity_id)
+            except Exception as e:
+                logger.error(f"Entity listener {listener} failed for {entity_type} '{entity_id}': {e}", exc_info=True)
 
     @classmethod
     def clear_registry(cls) -> None:
-        """Clear all registered invalidators.
+        """Clear all registered invalidators and entity listeners.
 
         This is primarily useful for testing to reset state between tests.
         """
         cls._invalidators.clear()
+        cls._entity_listeners.clear()
 
     @classmethod
     def count(cls) -> int:
@@ -8,9 +8,11 @@ harmonization suggestions.
 
 from __future__ import annotations
 
+import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from .models import Character, Event
@@ -86,43 +88,82 @@ class ClaimConflict:
         }
 
 
-def _classify_claim_type(name: str, value: Optional[str] = None) -> Tuple[ClaimType, str]:
-    """Infer a claim type and aspect from a predicate/value pair."""
+# Ordered keyword table used to infer claim types from predicate names. The
+# first category whose keyword occurs in the lowered predicate wins.
+_CLAIM_TYPE_KEYWORDS: Tuple[Tuple[ClaimType, Tuple[str, ...]], ...] = (
+    (ClaimType.CHRONOLOGY, ("chronolog", "date", "timeline", "order", "sequence", "reference", "passover")),
+    (
+        ClaimType.THEOLOGY,
+        ("christolog", "theolog", "divine", "messianic", "resurrect", "aton", "salvation", "spirit", "lord", "kingdom"),
+    ),
+    (
+        ClaimType.GEOGRAPHY,
+        ("location", "place", "region", "city", "village", "mount", "sea", "road", "galilee", "jerusalem"),
+    ),
+    (ClaimType.NARRATIVE, ("summary", "story", "narrative", "account", "notes", "plot")),
+    (ClaimType.IDENTITY, ("name", "title", "alias", "role", "identity", "call", "commission")),
+    (ClaimType.TEXTUAL, ("variant", "manuscript", "reading", "textual")),
+)
 
-    lowered = name.lower()
-    aspect = "other"
-    value_lower = value.lower() if isinstance(value, str) else ""
 
-    def _match(tokens: Iterable[str]) -> bool:
-        return any(token in lowered for token in tokens)
+def _compile_claim_type_matcher(
+    table: Tuple[Tuple[ClaimType, Tuple[str, ...]], ...],
+) -> Tuple["re.Pattern[str]", Dict[str, int]]:
+    """Compile the keyword table into a single overlapping-match regex.
 
-    if _match(("chronolog", "date", "timeline", "order", "sequence", "reference", "passover")):
-        aspect = "sequence" if "order" in lowered or "sequence" in lowered else "dating"
-        return ClaimType.CHRONOLOGY, aspect
+    Alternatives are ordered by category priority inside a zero-width
+    lookahead, so scanning every position yields the highest-priority keyword
+    starting there; the minimum rank over all positions is exactly the first
+    category whose keyword occurs anywhere in the predicate.
+    """
 
-    if _match(("christolog", "theolog", "divine", "messianic", "resurrect", "aton", "salvation", "spirit", "lord", "kingdom")):
-        aspect = "christology" if "christolog" in lowered or "messianic" in lowered else "theological_emphasis"
-        return ClaimType.THEOLOGY, aspect
+    rank_by_token: Dict[str, int] = {}
+    for rank, (_claim_type, tokens) in enumerate(table):
+        for token in tokens:
+            rank_by_token.setdefault(token, rank)
+    ordered = sorted(rank_by_token, key=lambda tok: (rank_by_token[tok], -len(tok)))
+    pattern = re.compile("(?=(" + "|".join(re.escape(tok) for tok in ordered) + "))")
+    return pattern, rank_by_token
+
+
+_CLAIM_TYPE_PATTERN, _CLAIM_TYPE_RANKS = _compile_claim_type_matcher(_CLAIM_TYPE_KEYWORDS)
 
-    if _match(("location", "place", "region", "city", "village", "mount", "sea", "road", "galilee", "jerusalem")):
-        aspect = "locale"
-        return ClaimType.GEOGRAPHY, aspect
 
-    if _match(("summary", "story", "narrative", "account", "notes", "plot")):
-        aspect = "narrative_emphasis"
-        return ClaimType.NARRATIVE, aspect
+@lru_cache(maxsize=4096)
+def _classify_predicate(lowered: str, value_mentions_codex: bool) -> Tuple[ClaimType, str]:
+    """Memoized classification for a lowered predicate and value class."""
 
-    if _match(("name", "title", "alias", "role", "identity", "call", "commission")):
-        aspect = "identity"
-        return ClaimType.IDENTITY, aspect
+    ranks = [_CLAIM_TYPE_RANKS[match.group(1)] for match in _CLAIM_TYPE_PATTERN.finditer(lowered)]
+    claim_type = _CLAIM_TYPE_KEYWORDS[min(ranks)][0] if ranks else None
+
+    if claim_type is ClaimType.CHRONOLOGY:
+        return claim_type, "sequence" if "order" in lowered or "sequence" in lowered else "dating"
+    if claim_type is ClaimType.THEOLOGY:
+        aspect = "christology" if "christolog" in lowered or "messianic" in lowered else "theological_emphasis"
+        return claim_type, aspect
+    if claim_type is ClaimType.GEOGRAPHY:
+        return claim_type, "locale"
+    if claim_type is ClaimType.NARRATIVE:
+        return claim_type, "narrative_emphasis"
+    if claim_type is ClaimType.IDENTITY:
+        return claim_type, "identity"
+    if claim_type is ClaimType.TEXTUAL or value_mentions_codex:
+        return ClaimType.TEXTUAL, "textual_variant"
+    return ClaimType.OTHER, "other"
+
+
+def _classify_claim_type(name: str, value: Optional[str] = None) -> Tuple[ClaimType, str]:
+    """Infer a claim type and aspect from a predicate/value pair.
 
-    if _match(("variant", "manuscript", "reading", "textual")) or "codex" in value_lower:
-        aspect = "textual_variant"
-        return ClaimType.TEXTUAL, aspect
+    The value only matters through whether it mentions a codex, so results
+    are memoized per ``(predicate, value class)``.
+    """
 
-    return ClaimType.OTHER, aspect
+    value_mentions_codex = isinstance(value, str) and "codex" in value.lower()
+    return _classify_predicate(name.lower(), value_mentions_codex)
 
 
+@lru_cache(maxsize=4096)
 def _classify_conflict_type(predicate: str, claim_type: ClaimType, aspect: str) -> str:
     """Map a claim type/aspect into a more specific conflict label."""
 
@@ -6,6 +6,10 @@ from typing import Iterable
 
 from .dossiers import build_character_dossier, build_event_dossier
 from .export import dossier_to_markdown
+from .export_graph_bulk import GRAPH_BULK_FORMATS, export_graph_bulk
+from .export_pipeline import EXPORT_FORMATS, run_export
+from .export_site import build_site
+from .export_sqlite import export_sqlite
 from .plugins import PluginManager
 
 
@@ -57,6 +61,42 @@ def main(argv: list[str] | None = None) -> int:
     event_parser.add_argument("dossier_id", help="ID of the event")
     event_parser.add_argument("-f", "--format", choices=["markdown"], default="markdown", help="Output format")
 
+    # Export command
+    export_parser = subparsers.add_parser("export", help="Export the corpus to several formats")
+    export_parser.add_argument(
+        "--formats",
+        default=",".join(EXPORT_FORMATS),
+        help=f"Comma-separated formats (default: {','.join(EXPORT_FORMATS)})",
+    )
+    export_parser.add_argument("--out", required=True, help="Output directory")
+    export_parser.add_argument("--jobs", type=int, default=1, help="Parallel writer processes")
+    export_parser.add_argument(
+        "--force", action="store_true", help="Regenerate every output, ignoring the export manifest"
+    )
+
+    # SQLite export command
+    sqlite_parser = subparsers.add_parser(
+        "export-sqlite", help="Export the corpus to a normalized SQLite database"
+    )
+    sqlite_parser.add_argument("--out", required=True, help="Database file to create (replaced if present)")
+
+    # Bulk graph export command
+    graph_parser = subparsers.add_parser(
+        "export-graph", help="Stream the graph as Neo4j import CSV, GraphML and/or NDJSON"
+    )
+    graph_parser.add_argument(
+        "--formats",
+        default=",".join(GRAPH_BULK_FORMATS),
+        help=f"Comma-separated formats (default: {','.join(GRAPH_BULK_FORMATS)})",
+    )
+    graph_parser.add_argument("--out", required=True, help="Output directory")
+
+    # Static site command
+    site_parser = subparsers.add_parser("site", help="Render a static Markdown site of all dossiers")
+    site_parser.add_argument("--out", required=True, help="Site output directory")
+    site_parser.add_argument("--jobs", type=int, default=1, help="Parallel render processes")
+    site_parser.add_argument("--force", action="store_true", help="Re-render every page")
+
     # Plugins command
     plugins_parser = subparsers.add_parser("plugins", help="Manage plugins")
     plugin_subs = plugins_parser.add_subparsers(dest="plugin_cmd", help="Plugin action")
@@ -94,6 +134,55 @@ def main(argv: list[str] | None = None) -> int:
             print(f"Error: event '{args.dossier_id}' not found", file=sys.stderr)
             return 1
 
+    elif args.command == "export":
+        try:
+            report = run_export(args.out, formats=args.formats, jobs=args.jobs, force=args.force)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        for fmt in EXPORT_FORMATS:
+            written = len(report.outputs.get(fmt, []))
+            skipped = len(report.skipped.get(fmt, []))
+            if written or skipped:
+                print(f"{fmt}: {written} written, {skipped} up to date")
+        if report.removed:
+            print(f"removed: {len(report.removed)} stale file(s)")
+        print("\nTimings:")
+        print(report.format_timings())
+        return 0
+
+    elif args.command == "export-sqlite":
+        counts = export_sqlite(args.out)
+        print(f"Wrote {args.out}")
+        for table, count in counts.items():
+            if count:
+                print(f"  {table}: {count}")
+        return 0
+
+    elif args.command == "export-graph":
+        try:
+            outputs = export_graph_bulk(args.out, formats=args.formats)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        for fmt, written in outputs.items():
+            print(f"{fmt}: {', '.join(written)}")
+        return 0
+
+    elif args.command == "site":
+        try:
+            site = build_site(args.out, jobs=args.jobs, force=args.force)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(
+            f"{len(site.written)} page(s) written, {len(site.unchanged)} unchanged, "
+            f"{len(site.skipped)} up to date, {len(site.removed)} removed"
+        )
+        for stage, seconds in site.timings.items():
+            print(f"  {stage}: {seconds * 1000:.1f} ms")
+        return 0
+
     elif args.command == "plugins":
         if args.plugin_cmd == "list":
             print("Loaded Plugins:")
@@ -0,0 +1,387 @@
+"""Full-text concordance over Bible translations.
+
+Each translation gets an inverted index (word -> verse slots and word
+positions) built from its compiled verse store and persisted next to it as
+``<code>.bcei``. Indexes are memory-mapped like the stores and rebuilt when
+the source JSON changes. An open index is kept on its store, so it counts
+toward ``BCE_BIBLE_CACHE_MB`` and is dropped when the store is evicted.
+
+Query syntax:
+
+- ``scapegoat azazel`` -- verses containing every word
+- ``"scape goote"`` -- the exact phrase
+- ``"goote lorde"~3`` -- the words in any order with at most 3 other words
+  between them
+
+Words are matched case- and accent-insensitively. Results are ranked by
+BM25 and ties keep canonical verse order.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from . import bibles
+
+INDEX_SUFFIX = ".bcei"
+_MAGIC = b"BCEI"
+_FORMAT_VERSION = 1
+# magic, version, slot count, source size, source mtime_ns, total tokens,
+# then (offset, length) of the vocabulary JSON, posting slots (uint32),
+# posting positions (uint16) and verse lengths (uint16).
+_HEADER = struct.Struct("<4sIIQQQ" + "QQ" * 4)
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_QUERY_RE = re.compile(r'"([^"]*)"(?:~(\d+))?|(\S+)')
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase ``word`` and strip accents (``Unigénito`` -> ``unigenito``)."""
+
+    decomposed = unicodedata.normalize("NFKD", word.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split verse or query text into normalized words."""
+
+    return [normalize_word(match) for match in _WORD_RE.findall(text)]
+
+
+@dataclass(frozen=True)
+class _Clause:
+    """One query clause: words that must co-occur in a verse.
+
+    ``slop`` is None for a bare word, 0 for an exact phrase, or the number
+    of other words allowed between unordered proximity terms.
+    """
+
+    words: Tuple[str, ...]
+    slop: Optional[int]
+    ordered: bool
+
+
+def parse_query(query: str) -> List[_Clause]:
+    """Parse a concordance query into clauses (see the module docstring)."""
+
+    clauses: List[_Clause] = []
+    for phrase, slop, bare in _QUERY_RE.findall(query):
+        if bare:
+            words = tokenize(bare)
+            if len(words) == 1:
+                clauses.append(_Clause(tuple(words), None, False))
+            elif words:
+                # "azazel's" tokenizes to two words; treat it as a phrase.
+                clauses.append(_Clause(tuple(words), 0, True))
+            continue
+        words = tokenize(phrase)
+        if not words:
+            continue
+        if slop:
+            clauses.append(_Clause(tuple(words), int(slop), False))
+        else:
+            clauses.append(_Clause(tuple(words), 0 if len(words) > 1 else None, True))
+    return clauses
+
+
+def build_index(store: "bibles._BibleStore", output: Path) -> Path:
+    """Build the inverted index for a compiled store and write it to ``output``."""
+
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    lengths: List[int] = []
+    texts = store.texts(0, store.slot_count - 1) if store.slot_count else []
+    for slot, text in enumerate(texts):
+        words = tokenize(text) if text else []
+        lengths.append(min(len(words), 0xFFFF))
+        for position, word in enumerate(words[:0xFFFF]):
+            postings[word].append((slot, position))
+
+    vocabulary: Dict[str, List[int]] = {}
+    slots: List[int] = []
+    positions: List[int] = []
+    for word in sorted(postings):
+        entries = postings[word]
+        vocabulary[word] = [len(slots), len(entries)]
+        slots.extend(slot for slot, _ in entries)
+        positions.extend(position for _, position in entries)
+
+    sections = [
+        json.dumps(vocabulary, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        struct.pack(f"<{len(slots)}I", *slots),
+        struct.pack(f"<{len(positions)}H", *positions),
+        struct.pack(f"<{len(lengths)}H", *lengths),
+    ]
+    spans: List[int] = []
+    offset = _HEADER.size
+    for section in sections:
+        spans += [offset, len(section)]
+        offset += len(section)
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        store.slot_count,
+        store.source_size,
+        store.source_mtime_ns,
+        sum(lengths),
+        *spans,
+    )
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for section in sections:
+                f.write(section)
+        os.replace(tmp_name, output)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return output
+
+
+class Concordance:
+    """Read-only, memory-mapped inverted index for one translation."""
+
+    def __init__(self, path: Path, store: "bibles._BibleStore") -> None:
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = _HEADER.unpack_from(self._mm, 0)
+        except struct.error as exc:
+            self._mm.close()
+            raise ValueError(f"Not a concordance index: {path}") from exc
+        if header[0] != _MAGIC or header[1] != _FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a concordance index: {path}")
+
+        self.path = path
+        self.store = store
+        self.slot_count: int = header[2]
+        self.source_size: int = header[3]
+        self.source_mtime_ns: int = header[4]
+        total_tokens: int = header[5]
+        vocab_off, vocab_len = header[6], header[7]
+        self._slots_off = header[8]
+        self._positions_off = header[10]
+        self._lengths_off = header[12]
+        self.vocabulary: Dict[str, List[int]] = json.loads(self._mm[vocab_off:vocab_off + vocab_len])
+        self.avg_length = total_tokens / self.slot_count if self.slot_count else 0.0
+
+    @property
+    def size_estimate(self) -> int:
+        """Approximate memory held: the mapping plus the parsed vocabulary."""
+
+        return len(self._mm) + 150 * len(self.vocabulary)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def is_fresh(self) -> bool:
+        return (
+            self.slot_count == self.store.slot_count
+            and self.source_size == self.store.source_size
+            and self.source_mtime_ns == self.store.source_mtime_ns
+        )
+
+    def postings(self, word: str) -> Dict[int, List[int]]:
+        """Return ``{slot: [positions]}`` for ``word`` (already normalized)."""
+
+        entry = self.vocabulary.get(word)
+        if entry is None:
+            return {}
+        start, count = entry[0], entry[1]
+        slots = struct.unpack_from(f"<{count}I", self._mm, self._slots_off + 4 * start)
+        positions = struct.unpack_from(f"<{count}H", self._mm, self._positions_off + 2 * start)
+        result: Dict[int, List[int]] = {}
+        for slot, position in zip(slots, positions):
+            result.setdefault(slot, []).append(position)
+        return result
+
+    def verse_length(self, slot: int) -> int:
+        return struct.unpack_from("<H", self._mm, self._lengths_off + 2 * slot)[0]
+
+    def _clause_matches(
+        self, clause: _Clause, postings: Dict[str, Dict[int, List[int]]]
+    ) -> Set[int]:
+        per_word = [postings[word] for word in clause.words]
+        candidates = set(per_word[0])
+        for entries in per_word[1:]:
+            candidates &= entries.keys()
+        if clause.slop is None or len(clause.words) == 1:
+            return candidates
+        if clause.ordered:
+            return {
+                slot
+                for slot in candidates
+                if _has_phrase([entries[slot] for entries in per_word])
+            }
+        return {
+            slot
+            for slot in candidates
+            if _within_window([entries[slot] for entries in per_word], clause.slop)
+        }
+
+    def search(self, query: str) -> List[Tuple[int, float]]:
+        """Return ``(slot, score)`` for every matching verse, best first."""
+
+        clauses = parse_query(query)
+        if not clauses:
+            return []
+        words = {word for clause in clauses for word in clause.words}
+        postings = {word: self.postings(word) for word in words}
+
+        matches: Optional[Set[int]] = None
+        for clause in clauses:
+            found = self._clause_matches(clause, postings)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+
+        n = self.slot_count
+        idf = {
+            word: math.log(1 + (n - len(entries) + 0.5) / (len(entries) + 0.5))
+            for word, entries in postings.items()
+        }
+        scored: List[Tuple[int, float]] = []
+        for slot in matches or ():
+            norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self.verse_length(slot) / (self.avg_length or 1.0))
+            score = 0.0
+            for word, entries in postings.items():
+                tf = len(entries.get(slot, ()))
+                if tf:
+                    score += idf[word] * tf * (_BM25_K1 + 1) / (tf + norm)
+            scored.append((slot, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored
+
+
+def _has_phrase(positions: List[List[int]]) -> bool:
+    following = [set(p) for p in positions[1:]]
+    return any(
+        all(start + offset + 1 in later for offset, later in enumerate(following))
+        for start in positions[0]
+    )
+
+
+def _within_window(positions: List[List[int]], slop: int) -> bool:
+    """True if one occurrence of each word fits in ``len(words) + slop`` positions.
+
+    Classic minimum covering window over the merged, sorted positions.
+    """
+
+    events = sorted((position, idx) for idx, plist in enumerate(positions) for position in plist)
+    need = len(positions)
+    counts = [0] * need
+    covered = 0
+    left = 0
+    for right_pos, right_idx in events:
+        if counts[right_idx] == 0:
+            covered += 1
+        counts[right_idx] += 1
+        while covered == need:
+            left_pos, left_idx = events[left]
+            if right_pos - left_pos - (need - 1) <= slop:
+                return True
+            counts[left_idx] -= 1
+            if counts[left_idx] == 0:
+                covered -= 1
+            left += 1
+    return False
+
+
+_DERIVED_KEY = "concordance"
+_LOCK = threading.Lock()
+
+
+def get_concordance(translation: str) -> Concordance:
+    """Return the concordance for ``translation``, building it on first use."""
+
+    store = bibles._load_translation(translation)
+    with _LOCK:
+        cached = store.derived.get(_DERIVED_KEY)
+        if cached is not None:
+            return cached
+
+        candidates = bibles._compiled_paths(bibles._source_path(translation), INDEX_SUFFIX)
+        index: Optional[Concordance] = None
+        for path in candidates:
+            if not path.exists():
+                continue
+            try:
+                opened = Concordance(path, store)
+            except (OSError, ValueError):
+                continue
+            if opened.is_fresh():
+                index = opened
+                break
+            opened.close()
+        if index is None:
+            for path in candidates:
+                try:
+                    index = Concordance(build_index(store, path), store)
+                    break
+                except OSError:
+                    continue
+            else:
+                raise OSError(f"Could not write a concordance index for translation {translation!r}")
+
+        store.set_derived(_DERIVED_KEY, index, index.size_estimate)
+    bibles._CACHE.resize(translation)
+    return index
+
+
+def search_verses(
+    query: str,
+    translation: str = "web",
+    offset: int = 0,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """Search verse text and return one page of ranked results.
+
+    Returns ``{"query", "translation", "total", "offset", "limit", "results"}``
+    where each result has ``reference``, ``book``, ``chapter``, ``verse``,
+    ``text`` and ``score``.
+    """
+
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    index = get_concordance(translation)
+    ranked = index.search(query)
+    store = index.store
+    results: List[Dict[str, Any]] = []
+    for slot, score in ranked[offset:offset + limit]:
+        book, chapter, verse = store.locate(slot)
+        results.append({
+            "reference": f"{book} {chapter}:{verse}",
+            "book": book,
+            "chapter": chapter,
+            "verse": verse,
+            "text": store.text(slot),
+            "score": round(score, 4),
+        })
+    return {
+        "query": query,
+        "translation": translation,
+        "total": len(ranked),
+        "offset": offset,
+        "limit": limit,
+        "results": results,
+    }
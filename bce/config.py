@@ -30,6 +30,9 @@ class BceConfig:
         BCE_EMBEDDING_MODEL: Embedding model name (default: all-MiniLM-L6-v2)
         BCE_ENABLE_HOOKS: Enable hook registry execution for plugins (default: false)
         BCE_AI_PLUGINS: Comma-separated list of hook plugins to auto-enable (default: empty)
+        BCE_BIBLE_CACHE_MB: Memory budget for open Bible translations in MB (default: 64)
+        BCE_BIBLE_PRELOAD: Comma-separated translation codes to load at server start (default: empty)
+        BCE_VALIDATION_WORKERS: Threads used to run validation rules (default: 1, sequential)
 
     Examples:
         >>> config = BceConfig()
@@ -58,6 +61,9 @@ class BceConfig:
         embedding_model: Optional[str] = None,
         enable_hooks: Optional[bool] = None,
         ai_plugins: Optional[List[str]] = None,
+        bible_cache_mb: Optional[float] = None,
+        bible_preload: Optional[List[str]] = None,
+        validation_workers: Optional[int] = None,
     ):
         """Initialize configuration.
 
@@ -71,6 +77,9 @@ class BceConfig:
             ai_cache_dir: Path to AI cache directory (default: from env or data_root/ai_cache)
             embedding_model: Embedding model name (default: from env or "all-MiniLM-L6-v2")
             enable_hooks: Enable hook registry execution (default: from env or False)
+            bible_cache_mb: Bible translation cache budget in MB (default: from env or 64)
+            bible_preload: Translation codes to preload (default: from env or empty)
+            validation_workers: Threads for validation rules (default: from env or 1)
         """
         self.data_root = self._resolve_data_root(data_root)
         self.cache_size = self._resolve_cache_size(cache_size)
@@ -83,6 +92,9 @@ class BceConfig:
         self.ai_cache_dir = self._resolve_ai_cache_dir(ai_cache_dir)
         self.enable_hooks = self._resolve_hooks(enable_hooks)
         self.ai_plugins = self._resolve_ai_plugins(ai_plugins)
+        self.bible_cache_mb = self._resolve_bible_cache_mb(bible_cache_mb)
+        self.bible_preload = self._resolve_bible_preload(bible_preload)
+        self.validation_workers = self._resolve_validation_workers(validation_workers)
 
     def _resolve_data_root(self, override: Optional[Path]) -> Path:
         """Resolve data root from override, environment, or default."""
@@ -209,6 +221,60 @@ class BceConfig:
             return [p.strip() for p in env_plugins.split(",") if p.strip()]
         return []
 
+    def _resolve_bible_cache_mb(self, override: Optional[float]) -> float:
+        """Resolve the Bible translation cache budget from override, environment, or default."""
+        if override is not None:
+            if override < 0:
+                raise ConfigurationError(f"bible_cache_mb must be non-negative, got {override}")
+            return float(override)
+
+        env_budget = os.getenv("BCE_BIBLE_CACHE_MB")
+        if env_budget:
+            try:
+                budget = float(env_budget)
+            except ValueError:
+                raise ConfigurationError(
+                    f"BCE_BIBLE_CACHE_MB must be a number, got '{env_budget}'"
+                )
+            if budget < 0:
+                raise ConfigurationError(
+                    f"BCE_BIBLE_CACHE_MB must be non-negative, got {budget}"
+                )
+            return budget
+
+        return 64.0  # Default: several compiled translations
+
+    def _resolve_bible_preload(self, override: Optional[List[str]]) -> List[str]:
+        """Resolve translations to preload from override or environment."""
+        if override is not None:
+            return override
+
+        env_preload = os.getenv("BCE_BIBLE_PRELOAD", "")
+        return [code.strip() for code in env_preload.split(",") if code.strip()]
+
+    def _resolve_validation_workers(self, override: Optional[int]) -> int:
+        """Resolve validation rule parallelism from override, environment, or default."""
+        if override is not None:
+            if override < 1:
+                raise ConfigurationError(f"validation_workers must be at least 1, got {override}")
+            return override
+
+        env_workers = os.getenv("BCE_VALIDATION_WORKERS")
+        if env_workers:
+            try:
+                workers = int(env_workers)
+            except ValueError:
+                raise ConfigurationError(
+                    f"BCE_VALIDATION_WORKERS must be an integer, got '{env_workers}'"
+                )
+            if workers < 1:
+                raise ConfigurationError(
+                    f"BCE_VALIDATION_WORKERS must be at least 1, got {workers}"
+                )
+            return workers
+
+        return 1  # Default: rules run sequentially
+
     def _resolve_ai_cache_dir(self, override: Optional[Path]) -> Path:
         """Resolve AI cache directory from override, environment, or default."""
         if override is not None:
@@ -269,7 +335,10 @@ class BceConfig:
             f"ai_cache_dir={self.ai_cache_dir}, "
             f"embedding_model={self.embedding_model}, "
             f"enable_hooks={self.enable_hooks}, "
-            f"ai_plugins={self.ai_plugins})"
+            f"ai_plugins={self.ai_plugins}, "
+            f"bible_cache_mb={self.bible_cache_mb}, "
+            f"bible_preload={self.bible_preload}, "
+            f"validation_workers={self.validation_workers})"
         )
 
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Any, Tuple
 
 class ConflictCategory(str, Enum):
     CHRONOLOGICAL = "chronological"
@@ -31,8 +33,35 @@ class EnhancedConflict:
     rationale: Optional[str] = None
     implications: Optional[List[str]] = None
 
+@dataclass(frozen=True, slots=True)
+class ConflictAnalysis:
+    """Immutable, source-agnostic analysis shared across identical conflicts.
+
+    Two conflicts on the same field with the same distinct values and source
+    count always analyze identically, so a single instance is memoized and
+    handed to every caller.
+    """
+
+    field: str
+    entity_type: str
+    category: ConflictCategory
+    severity: ConflictSeverity
+    distinct_values: Tuple[str, ...]
+    notes: str
+    rationale: str
+
+
+_AnalysisKey = Tuple[str, str, FrozenSet[str], int]
+
+
 class EnhancedConflictDetector:
-    """Advanced conflict detection with configurable rules."""
+    """Advanced conflict detection with configurable rules.
+
+    Analyses are memoized in a bounded LRU keyed by
+    ``(entity_type, field_name, frozenset(values), source_count)``. The memo
+    is dropped automatically when any rule table is reassigned; call
+    ``clear_analysis_cache`` after mutating a table in place.
+    """
 
     # Keyword mapping for categories
     CATEGORY_KEYWORDS = {
@@ -53,6 +82,13 @@ class EnhancedConflictDetector:
         "birthplace", "parentage", "apostleship", "conversion", "trial_outcome"
     }
 
+    # Maximum number of memoized analyses kept per detector class
+    ANALYSIS_CACHE_SIZE: ClassVar[int] = 1024
+
+    _analysis_caches: ClassVar[Dict[type, "OrderedDict[_AnalysisKey, ConflictAnalysis]"]] = {}
+    _analysis_rules: ClassVar[Dict[type, Tuple[Any, Any, Any]]] = {}
+    _analysis_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @classmethod
     def classify_category(cls, field_name: str) -> ConflictCategory:
         """Determine conflict category based on field name keywords."""
@@ -89,33 +125,92 @@ class EnhancedConflictDetector:
         return ConflictSeverity.LOW
 
     @classmethod
-    def analyze_conflict(
-        cls, 
-        field_name: str, 
-        values_by_source: Dict[str, str],
-        entity_type: str
-    ) -> EnhancedConflict:
-        """Analyze a single conflict to produce enriched metadata."""
-        
-        values = {v for v in values_by_source.values() if v}
-        num_sources = len(values_by_source)
+    def clear_analysis_cache(cls) -> None:
+        """Drop memoized analyses for this detector class."""
+        with cls._analysis_lock:
+            cls._analysis_caches.pop(cls, None)
+            cls._analysis_rules.pop(cls, None)
+
+    @classmethod
+    def _cache_for_current_rules(cls) -> "OrderedDict[_AnalysisKey, ConflictAnalysis]":
+        """Return the memo for this class, resetting it if a rule table changed."""
+        rules = (cls.CATEGORY_KEYWORDS, cls.CRITICAL_FIELDS, cls.HIGH_SEVERITY_FIELDS)
+        cached_rules = cls._analysis_rules.get(cls)
+        if cached_rules is None or any(a is not b for a, b in zip(rules, cached_rules)):
+            cls._analysis_rules[cls] = rules
+            cls._analysis_caches[cls] = OrderedDict()
+        return cls._analysis_caches[cls]
+
+    @classmethod
+    def analyze_values(
+        cls,
+        field_name: str,
+        values: FrozenSet[str],
+        num_sources: int,
+        entity_type: str,
+    ) -> ConflictAnalysis:
+        """Return the shared analysis for a field's distinct values.
+
+        ``values`` should contain only non-empty values; ``num_sources`` is
+        the number of sources reporting on the field.
+        """
+        key: _AnalysisKey = (entity_type, field_name, values, num_sources)
+        with cls._analysis_lock:
+            cache = cls._cache_for_current_rules()
+            analysis = cache.get(key)
+            if analysis is not None:
+                cache.move_to_end(key)
+                return analysis
+
         num_distinct = len(values)
-        
         category = cls.classify_category(field_name)
         severity = cls.assess_severity(field_name, num_sources, num_distinct)
-        
+
         # Auto-generate rationale
         rationale = f"Disagreement in {category.value} domain regarding {field_name}."
         if severity == ConflictSeverity.CRITICAL:
             rationale += " This touches on core doctrinal or historical identity."
-        
-        return EnhancedConflict(
+
+        analysis = ConflictAnalysis(
             field=field_name,
             entity_type=entity_type,
             category=category,
             severity=severity,
-            sources=values_by_source,
-            distinct_values=sorted(list(values)),
+            distinct_values=tuple(sorted(values)),
             notes=f"{num_distinct} variants across {num_sources} sources",
-            rationale=rationale
+            rationale=rationale,
+        )
+
+        with cls._analysis_lock:
+            cache = cls._cache_for_current_rules()
+            cache[key] = analysis
+            while len(cache) > cls.ANALYSIS_CACHE_SIZE:
+                cache.popitem(last=False)
+        return analysis
+
+    @classmethod
+    def analyze_conflict(
+        cls, 
+        field_name: str, 
+        values_by_source: Dict[str, str],
+        entity_type: str
+    ) -> EnhancedConflict:
+        """Analyze a single conflict to produce enriched metadata."""
+
+        analysis = cls.analyze_values(
+            field_name,
+            frozenset(v for v in values_by_source.values() if v),
+            len(values_by_source),
+            entity_type,
+        )
+
+        return EnhancedConflict(
+            field=analysis.field,
+            entity_type=analysis.entity_type,
+            category=analysis.category,
+            severity=analysis.severity,
+            sources=values_by_source,
+            distinct_values=list(analysis.distinct_values),
+            notes=analysis.notes,
+            rationale=analysis.rationale
         )
@@ -96,11 +96,12 @@ def summarize_character_conflicts(char_id: str) -> Dict[str, Dict[str, Any]]:
     summary: Dict[str, Dict[str, Any]] = {}
 
     for trait, per_source in conflicts.items():
-        # Use enhanced detector
-        analysis = EnhancedConflictDetector.analyze_conflict(
+        # Use enhanced detector (memoized per field and distinct value set)
+        analysis = EnhancedConflictDetector.analyze_values(
             field_name=trait,
-            values_by_source=per_source,
-            entity_type="character"
+            values=frozenset(v for v in per_source.values() if v),
+            num_sources=len(per_source),
+            entity_type="character",
         )
         
         claim_conflict = claim_conflicts.get(trait, {})
@@ -117,7 +118,7 @@ def summarize_character_conflicts(char_id: str) -> Dict[str, Dict[str, Any]]:
             "claim_type": category,
             "aspect": claim_conflict.get("aspect"),
             "sources": per_source,
-            "distinct_values": analysis.distinct_values,
+            "distinct_values": list(analysis.distinct_values),
             "harmonization_moves": harmonization_moves,
             "dominant_value": claim_conflict.get("dominant_value"),
             "notes": analysis.notes,
@@ -149,11 +150,12 @@ def summarize_event_conflicts(event_id: str) -> Dict[str, Dict[str, Any]]:
     summary: Dict[str, Dict[str, Any]] = {}
 
     for field_name, per_source in conflicts.items():
-        # Use enhanced detector
-        analysis = EnhancedConflictDetector.analyze_conflict(
+        # Use enhanced detector (memoized per field and distinct value set)
+        analysis = EnhancedConflictDetector.analyze_values(
             field_name=field_name,
-            values_by_source=per_source,
-            entity_type="event"
+            values=frozenset(v for v in per_source.values() if v),
+            num_sources=len(per_source),
+            entity_type="event",
         )
 
         claim_conflict = claim_conflicts.get(field_name, {})
@@ -170,7 +172,7 @@ def summarize_event_conflicts(event_id: str) -> Dict[str, Dict[str, Any]]:
             "claim_type": category,
             "aspect": claim_conflict.get("aspect"),
             "sources": per_source,
-            "distinct_values": analysis.distinct_values,
+            "distinct_values": list(analysis.distinct_values),
             "harmonization_moves": harmonization_moves,
             "dominant_value": claim_conflict.get("dominant_value"),
             "notes": analysis.notes,
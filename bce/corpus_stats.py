@@ -0,0 +1,252 @@
+"""Materialized corpus-wide statistics.
+
+``CorpusStats`` computes counts, conflict totals, tag frequencies and
+per-source coverage once, keeps each entity's contribution, and patches the
+totals for each character or event saved since the previous read. Reads
+touch storage only for those changed entities once the view is built.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set, Tuple
+
+from . import contradictions, queries
+from .cache import CacheRegistry
+
+
+ENTITY_CHARACTER = "character"
+ENTITY_EVENT = "event"
+
+
+@dataclass(slots=True)
+class _EntityContribution:
+    """One entity's share of the corpus totals."""
+
+    conflicts_by_severity: Counter = field(default_factory=Counter)
+    conflicts_by_category: Counter = field(default_factory=Counter)
+    tags: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+
+    @property
+    def conflict_count(self) -> int:
+        return sum(self.conflicts_by_severity.values())
+
+
+def _contribution_from_conflicts(
+    conflicts: Dict[str, Dict[str, Any]],
+    tags: Any,
+    sources: Any,
+) -> _EntityContribution:
+    contribution = _EntityContribution(
+        tags=tuple(dict.fromkeys(t for t in tags or [] if isinstance(t, str))),
+        sources=tuple(dict.fromkeys(s for s in sources if isinstance(s, str) and s)),
+    )
+    for info in conflicts.values():
+        contribution.conflicts_by_severity[str(info.get("severity") or "unknown")] += 1
+        contribution.conflicts_by_category[str(info.get("category") or "other")] += 1
+    return contribution
+
+
+def _character_contribution(char_id: str) -> _EntityContribution:
+    character = queries.get_character(char_id)
+    return _contribution_from_conflicts(
+        contradictions.summarize_character_conflicts(char_id),
+        character.tags,
+        (profile.source_id for profile in character.source_profiles),
+    )
+
+
+def _event_contribution(event_id: str) -> _EntityContribution:
+    event = queries.get_event(event_id)
+    return _contribution_from_conflicts(
+        contradictions.summarize_event_conflicts(event_id),
+        event.tags,
+        (account.source_id for account in event.accounts),
+    )
+
+
+class CorpusStats:
+    """Materialized view of corpus statistics with incremental updates.
+
+    The view is built lazily on the first read. Saving a character or event
+    through storage marks only that entity as changed, and its contribution
+    is replaced on the next read; changing the data root discards the view
+    so it is rebuilt on the next read.
+
+    Examples:
+        >>> stats = CorpusStats()
+        >>> stats.snapshot()["total_characters"]
+        74
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entities: Optional[Dict[str, Dict[str, _EntityContribution]]] = None
+        self._pending: Set[Tuple[str, str]] = set()
+        self._severity: Counter = Counter()
+        self._category: Counter = Counter()
+        self._tags: Counter = Counter()
+        self._coverage: Dict[str, Counter] = {ENTITY_CHARACTER: Counter(), ENTITY_EVENT: Counter()}
+        self._conflicts_by_type: Counter = Counter()
+        self._payload: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_built(self) -> bool:
+        """Return True when the view has been materialized."""
+        return self._entities is not None
+
+    def invalidate(self) -> None:
+        """Discard the materialized view; the next read rebuilds it."""
+        with self._lock:
+            self._entities = None
+            self._pending = set()
+            self._payload = None
+
+    def refresh(self) -> None:
+        """Rebuild the view from storage in a single pass."""
+        with self._lock:
+            self._severity = Counter()
+            self._category = Counter()
+            self._tags = Counter()
+            self._coverage = {ENTITY_CHARACTER: Counter(), ENTITY_EVENT: Counter()}
+            self._conflicts_by_type = Counter()
+            entities: Dict[str, Dict[str, _EntityContribution]] = {
+                ENTITY_CHARACTER: {},
+                ENTITY_EVENT: {},
+            }
+            self._entities = entities
+            self._pending = set()
+            self._payload = None
+            try:
+                for char_id in queries.list_character_ids():
+                    self._apply(ENTITY_CHARACTER, char_id, _character_contribution(char_id))
+                for event_id in queries.list_event_ids():
+                    self._apply(ENTITY_EVENT, event_id, _event_contribution(event_id))
+            except Exception:
+                self._entities = None
+                raise
+
+    def update_entity(self, entity_type: str, entity_id: str) -> None:
+        """Mark one entity as changed so its contribution is recomputed.
+
+        The entity is reloaded on the next read, not here, so save paths
+        never pay for (or fail on) a reload. Entities that can no longer be
+        loaded are removed from the totals. Does nothing if the view is not
+        built yet.
+        """
+        if entity_type not in (ENTITY_CHARACTER, ENTITY_EVENT):
+            raise ValueError(f"Unknown entity type: {entity_type!r}")
+
+        with self._lock:
+            if self._entities is None:
+                return
+            self._pending.add((entity_type, entity_id))
+            self._payload = None
+
+    def _apply_pending(self) -> None:
+        assert self._entities is not None
+        for entity_type, entity_id in sorted(self._pending):
+            self._remove(entity_type, entity_id)
+            builder = _character_contribution if entity_type == ENTITY_CHARACTER else _event_contribution
+            try:
+                contribution = builder(entity_id)
+            except Exception:
+                # Deleted, or no longer loadable (e.g. a load hook aborted):
+                # leave it out of the totals rather than failing the read.
+                contribution = None
+            if contribution is not None:
+                self._apply(entity_type, entity_id, contribution)
+            self._pending.discard((entity_type, entity_id))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict.
+
+        Keys include ``total_characters``, ``total_events``,
+        ``total_conflicts``, ``total_tags`` and ``tags`` (as previously served
+        by ``/api/stats``), plus ``character_conflicts``, ``event_conflicts``,
+        ``conflicts_by_severity``, ``conflicts_by_category``,
+        ``tag_frequencies`` and ``source_coverage``.
+        """
+        with self._lock:
+            if self._entities is None:
+                self.refresh()
+            if self._pending:
+                self._apply_pending()
+                self._payload = None
+            if self._payload is None:
+                self._payload = self._build_payload()
+            return copy.deepcopy(self._payload)
+
+    def _on_entity_changed(self, entity_type: Optional[str], entity_id: Optional[str]) -> None:
+        if entity_type is None or entity_id is None:
+            self.invalidate()
+            return
+        self.update_entity(entity_type, entity_id)
+
+    def _apply(self, entity_type: str, entity_id: str, contribution: _EntityContribution) -> None:
+        assert self._entities is not None
+        self._entities[entity_type][entity_id] = contribution
+        self._severity.update(contribution.conflicts_by_severity)
+        self._category.update(contribution.conflicts_by_category)
+        self._tags.update(contribution.tags)
+        self._coverage[entity_type].update(contribution.sources)
+        self._conflicts_by_type[entity_type] += contribution.conflict_count
+
+    def _remove(self, entity_type: str, entity_id: str) -> None:
+        assert self._entities is not None
+        contribution = self._entities[entity_type].pop(entity_id, None)
+        if contribution is None:
+            return
+        self._severity.subtract(contribution.conflicts_by_severity)
+        self._category.subtract(contribution.conflicts_by_category)
+        self._tags.subtract(contribution.tags)
+        self._coverage[entity_type].subtract(contribution.sources)
+        self._conflicts_by_type[entity_type] -= contribution.conflict_count
+        for counter in (self._severity, self._category, self._tags, *self._coverage.values()):
+            for key in [k for k, v in counter.items() if v <= 0]:
+                del counter[key]
+
+    def _build_payload(self) -> Dict[str, Any]:
+        assert self._entities is not None
+        tags = sorted(self._tags)
+        source_ids = sorted(set(self._coverage[ENTITY_CHARACTER]) | set(self._coverage[ENTITY_EVENT]))
+        return {
+            "total_characters": len(self._entities[ENTITY_CHARACTER]),
+            "total_events": len(self._entities[ENTITY_EVENT]),
+            "total_conflicts": sum(self._conflicts_by_type.values()),
+            "character_conflicts": self._conflicts_by_type[ENTITY_CHARACTER],
+            "event_conflicts": self._conflicts_by_type[ENTITY_EVENT],
+            "conflicts_by_severity": dict(sorted(self._severity.items())),
+            "conflicts_by_category": dict(sorted(self._category.items())),
+            "total_tags": len(tags),
+            "tags": tags,
+            "tag_frequencies": {tag: self._tags[tag] for tag in tags},
+            "source_coverage": {
+                source_id: {
+                    "characters": self._coverage[ENTITY_CHARACTER][source_id],
+                    "events": self._coverage[ENTITY_EVENT][source_id],
+                }
+                for source_id in source_ids
+            },
+        }
+
+
+_default_stats: Optional[CorpusStats] = None
+
+
+def get_default_corpus_stats() -> CorpusStats:
+    """Return the process-wide ``CorpusStats`` view kept in sync with storage."""
+    global _default_stats
+    if _default_stats is None:
+        _default_stats = CorpusStats()
+        CacheRegistry.register_entity_listener(_default_stats._on_entity_changed)
+    return _default_stats
+
+
+def get_corpus_stats() -> Dict[str, Any]:
+    """Return corpus statistics from the default materialized view."""
+    return get_default_corpus_stats().snapshot()
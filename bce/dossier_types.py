@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, TypedDict
+from typing import Dict, List, NotRequired, TypedDict
 
 
 class HarmonizationMove(TypedDict):
@@ -55,6 +55,9 @@ class CharacterDossier(TypedDict):
     relationships_by_type: Dict[str, List[dict]]
     parallels: List[dict]
     claim_graph: ClaimGraphBlock
+    # Present only when the dossier is built with ``hydrate_text``.
+    texts_by_source: NotRequired[Dict[str, Dict[str, str | None]]]
+    text_translation: NotRequired[str]
 
 
 class EventAccountDossier(TypedDict):
@@ -101,3 +104,5 @@ DOSSIER_KEY_PARALLELS = "parallels"
 DOSSIER_KEY_CITATIONS = "citations"
 DOSSIER_KEY_TEXTUAL_VARIANTS = "textual_variants"
 DOSSIER_KEY_CLAIM_GRAPH = "claim_graph"
+DOSSIER_KEY_TEXTS_BY_SOURCE = "texts_by_source"
+DOSSIER_KEY_TEXT_TRANSLATION = "text_translation"
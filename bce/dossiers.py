@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from . import bibles
 from . import queries
 from . import contradictions
 from . import sources
@@ -30,6 +31,8 @@ from .dossier_types import (
     DOSSIER_KEY_PARALLELS,
     DOSSIER_KEY_ACCOUNT_CONFLICT_SUMMARIES,
     DOSSIER_KEY_CLAIM_GRAPH,
+    DOSSIER_KEY_TEXTS_BY_SOURCE,
+    DOSSIER_KEY_TEXT_TRANSLATION,
 )
 
 
@@ -41,11 +44,16 @@ def _build_source_ids(character: Character) -> List[str]:
     return list(seen.keys())
 
 
-def build_character_dossier(char_id: str) -> CharacterDossier:
+def build_character_dossier(char_id: str, hydrate_text: Optional[str] = None) -> CharacterDossier:
     """Build a JSON-friendly dossier for a character.
 
     The returned dict includes core identity fields, per-source traits,
     and nested comparisons/conflicts for traits across sources.
+
+    With ``hydrate_text`` set to a translation code, the dossier also gets
+    ``texts_by_source`` (source -> reference -> verse text, None where the
+    translation lacks it), resolved in one batch by
+    ``bibles.resolve_references``.
     """
     character = queries.get_character(char_id)
     trait_comparison = contradictions.compare_character_sources(char_id)
@@ -106,12 +114,7 @@ def build_character_dossier(char_id: str) -> CharacterDossier:
         rel_dict.setdefault("sources", [])
         rel_dict.setdefault("references", [])
 
-        # Try to get the canonical name of the related character
-        try:
-            related_char = queries.get_character(str(target_id))
-            rel_dict["target_name"] = related_char.canonical_name
-        except Exception:
-            rel_dict["target_name"] = target_id
+        rel_dict["target_name"] = queries.get_character_display_name(str(target_id)) if target_id else target_id
 
         # Flatten attestation for dossier readability
         attestation = rel_dict.get("attestation") or []
@@ -155,6 +158,17 @@ def build_character_dossier(char_id: str) -> CharacterDossier:
         DOSSIER_KEY_CLAIM_GRAPH: claim_graph.build_claim_graph_for_character(character),
     }
 
+    if hydrate_text:
+        texts = bibles.resolve_references(
+            [ref for refs in references_by_source.values() for ref in refs],
+            translation=hydrate_text,
+        )
+        dossier[DOSSIER_KEY_TEXTS_BY_SOURCE] = {
+            source_id: {ref: texts[ref] for ref in refs}
+            for source_id, refs in references_by_source.items()
+        }
+        dossier[DOSSIER_KEY_TEXT_TRANSLATION] = hydrate_text
+
     # Hook: Dossier Enrich
     ctx = HookRegistry.trigger(
         HookPoint.DOSSIER_ENRICH,
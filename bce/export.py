@@ -4,6 +4,10 @@ from .export_json import export_all_characters, export_all_events
 from .export_markdown import dossier_to_markdown, dossiers_to_markdown
 from .export_csv import export_characters_csv, export_events_csv
 from .export_citations import export_citations
+from .export_graph_bulk import export_graph_bulk
+from .export_pipeline import run_export
+from .export_site import build_site
+from .export_sqlite import export_sqlite
 
 __all__ = [
     "export_all_characters",
@@ -13,4 +17,8 @@ __all__ = [
     "export_characters_csv",
     "export_events_csv",
     "export_citations",
+    "run_export",
+    "export_graph_bulk",
+    "build_site",
+    "export_sqlite",
 ]
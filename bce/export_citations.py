@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from . import sources, storage
+from .models import Character, Event
 
 
 def _escape_bibtex_value(value: str) -> str:
@@ -61,10 +62,10 @@ def _source_citations_bibtex() -> List[str]:
     return entries
 
 
-def _character_citations_bibtex() -> List[str]:
+def _character_citations_bibtex(characters: Optional[Iterable[Character]] = None) -> List[str]:
     entries: List[str] = []
 
-    for character in storage.iter_characters():
+    for character in storage.iter_characters() if characters is None else characters:
         key = f"character_{character.id}"
         sources_list = character.list_sources()
         fields = {
@@ -78,10 +79,10 @@ def _character_citations_bibtex() -> List[str]:
     return entries
 
 
-def _event_citations_bibtex() -> List[str]:
+def _event_citations_bibtex(events: Optional[Iterable[Event]] = None) -> List[str]:
     entries: List[str] = []
 
-    for event in storage.iter_events():
+    for event in storage.iter_events() if events is None else events:
         key = f"event_{event.id}"
         source_ids = sorted({acc.source_id for acc in event.accounts})
         fields = {
@@ -94,13 +95,19 @@ def _event_citations_bibtex() -> List[str]:
     return entries
 
 
-def export_citations(format: str = "bibtex") -> List[str]:
+def export_citations(
+    format: str = "bibtex",
+    characters: Optional[Iterable[Character]] = None,
+    events: Optional[Iterable[Event]] = None,
+) -> List[str]:
     """Export citations for BCE sources, characters, and events.
 
     Parameters
     ----------
     format:
         Citation format to use. Currently only ``"bibtex"`` is supported.
+    characters, events:
+        Optional preloaded entities; storage is read when omitted.
 
     Returns
     -------
@@ -114,6 +121,6 @@ def export_citations(format: str = "bibtex") -> List[str]:
 
     entries: List[str] = []
     entries.extend(_source_citations_bibtex())
-    entries.extend(_character_citations_bibtex())
-    entries.extend(_event_citations_bibtex())
+    entries.extend(_character_citations_bibtex(characters))
+    entries.extend(_event_citations_bibtex(events))
     return entries
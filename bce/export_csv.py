@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Callable, Iterable, Mapping
 
-from . import storage
+from . import queries, storage
+from .models import Character, Event
 
 
 def _export_csv(rows: Iterable[Mapping[str, str]], output_path: str, fieldnames: list[str]) -> None:
@@ -17,11 +18,25 @@ def _export_csv(rows: Iterable[Mapping[str, str]], output_path: str, fieldnames:
             writer.writerow({name: row.get(name, "") for name in fieldnames})
 
 
-def export_characters_csv(output_path: str, include_fields: Iterable[str] | None = None) -> None:
+def _display_name_lookup(characters: list[Character] | None) -> Callable[[str], str]:
+    """Resolve names from a preloaded corpus, or from the shared name table."""
+    if characters is None:
+        return queries.get_character_display_name
+    names = {character.id: character.canonical_name for character in characters}
+    return lambda char_id: names.get(char_id, char_id)
+
+
+def export_characters_csv(
+    output_path: str,
+    include_fields: Iterable[str] | None = None,
+    characters: Iterable[Character] | None = None,
+) -> None:
     default_fields = ["id", "canonical_name", "aliases", "roles", "source_count"]
     fieldnames = list(include_fields) if include_fields is not None else default_fields
+    characters = list(characters) if characters is not None else None
+    display_name = _display_name_lookup(characters)
     rows = []
-    for character in storage.iter_characters():
+    for character in storage.iter_characters() if characters is None else characters:
         sources = character.list_sources()
         row = {
             "id": character.id,
@@ -31,12 +46,22 @@ def export_characters_csv(output_path: str, include_fields: Iterable[str] | None
             "roles": ", ".join(character.roles),
             "source_count": str(len(sources)),
             "sources": ", ".join(sources),
+            "related_characters": ", ".join(
+                display_name(rel.target_id)
+                for rel in character.relationships
+                if rel.target_id
+            ),
         }
         rows.append(row)
     _export_csv(rows, output_path, fieldnames)
 
 
-def export_events_csv(output_path: str, include_fields: Iterable[str] | None = None) -> None:
+def export_events_csv(
+    output_path: str,
+    include_fields: Iterable[str] | None = None,
+    events: Iterable[Event] | None = None,
+    characters: Iterable[Character] | None = None,
+) -> None:
     default_fields = [
         "id",
         "label",
@@ -47,13 +72,17 @@ def export_events_csv(output_path: str, include_fields: Iterable[str] | None = N
         "source_count",
     ]
     fieldnames = list(include_fields) if include_fields is not None else default_fields
+    display_name = _display_name_lookup(list(characters) if characters is not None else None)
     rows = []
-    for event in storage.iter_events():
+    for event in storage.iter_events() if events is None else events:
         source_ids = sorted({acc.source_id for acc in event.accounts})
         row = {
             "id": event.id,
             "label": event.label,
             "participants": ", ".join(event.participants),
+            "participant_names": ", ".join(
+                display_name(pid) for pid in event.participants
+            ),
             "participant_count": str(len(event.participants)),
             "account_count": str(len(event.accounts)),
             "sources": ", ".join(source_ids),
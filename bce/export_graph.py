@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from . import storage
+from .cache import CacheRegistry
+from .models import Character, Event
 
 
 NODE_TYPE_CHARACTER = "character"
@@ -49,215 +53,570 @@ class GraphSnapshot:
     nodes: List[GraphNode]
     edges: List[GraphEdge]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable ``{"nodes": [...], "edges": [...]}`` payload."""
+        return {
+            "nodes": [
+                {"id": n.id, "label": n.label, "type": n.type, "properties": n.properties}
+                for n in self.nodes
+            ],
+            "edges": [
+                {
+                    "id": e.id,
+                    "source": e.source,
+                    "target": e.target,
+                    "type": e.type,
+                    "properties": e.properties,
+                }
+                for e in self.edges
+            ],
+        }
 
-def _get_or_create_node(
-    nodes_by_id: Dict[str, GraphNode],
-    node_id: str,
-    label: str,
-    node_type: str,
-    **props: Any,
-) -> GraphNode:
-    node = nodes_by_id.get(node_id)
-    if node is None:
-        node = GraphNode(id=node_id, label=label, type=node_type, properties=dict(props))
-        nodes_by_id[node_id] = node
-    else:
-        node.properties.update(props)
-    return node
 
+GraphElement = Union[GraphNode, GraphEdge]
 
-def build_graph_snapshot() -> GraphSnapshot:
-    """Build a simple property-graph view of all BCE characters and events.
 
-    Nodes include:
-    - character: one per Character.id
-    - event: one per Event.id
-    - source: one per source_id seen in character profiles or event accounts
+def _node_payload(node: GraphNode) -> Dict[str, Any]:
+    return {"id": node.id, "label": node.label, "type": node.type, "properties": node.properties}
 
-    Edges include:
-    - character_participated_in_event: Character -> Event
-    - character_profile_in_source: Character -> Source
-    - event_reported_in_source: Event -> Source
-    - character_relationship: Character -> Character (from relationships field)
-    - event_parallel_source: Event -> Source (from event.parallels)
+
+def _edge_payload(edge: GraphEdge) -> Dict[str, Any]:
+    return {
+        "id": edge.id,
+        "source": edge.source,
+        "target": edge.target,
+        "type": edge.type,
+        "properties": edge.properties,
+    }
+
+
+@dataclass(slots=True)
+class _EntityElements:
+    """Nodes and edges owned by one character or event.
+
+    Shared nodes (sources and undefined characters) are only referenced by
+    ID; they are materialized once when the graph is assembled.
     """
 
-    nodes_by_id: Dict[str, GraphNode] = {}
-    edges: List[GraphEdge] = []
+    node: GraphNode
+    edges: List[GraphEdge]
+    source_ids: List[str]
+    character_refs: List[str]
+    _node_payload: Optional[Dict[str, Any]] = None
+    _edge_payloads: Optional[List[Dict[str, Any]]] = None
 
-    # Character nodes and character->source profile edges.
-    for character in storage.iter_characters():
-        char_node_id = f"character:{character.id}"
-        _get_or_create_node(
-            nodes_by_id,
-            char_node_id,
-            label=character.canonical_name,
-            node_type=NODE_TYPE_CHARACTER,
-            character_id=character.id,
-            aliases=list(character.aliases),
-            roles=list(character.roles),
-        )
+    def payloads(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return (and memoize) the serialized node and edge payloads."""
+        if self._node_payload is None or self._edge_payloads is None:
+            self._node_payload = _node_payload(self.node)
+            self._edge_payloads = [_edge_payload(edge) for edge in self.edges]
+        return self._node_payload, self._edge_payloads
 
-        for profile in character.source_profiles:
-            source_node_id = f"source:{profile.source_id}"
-            _get_or_create_node(
-                nodes_by_id,
-                source_node_id,
-                label=profile.source_id,
-                node_type=NODE_TYPE_SOURCE,
-                source_id=profile.source_id,
-            )
 
-            edge_id = f"char_profile:{character.id}:{profile.source_id}"
-            edges.append(
-                GraphEdge(
-                    id=edge_id,
-                    source=char_node_id,
-                    target=source_node_id,
-                    type=EDGE_TYPE_CHARACTER_PROFILE_IN_SOURCE,
-                    properties={
-                        "character_id": character.id,
-                        "source_id": profile.source_id,
-                        "trait_count": len(profile.traits),
-                        "reference_count": len(profile.references),
-                    },
-                )
+def _character_elements(character: Character) -> _EntityElements:
+    char_node_id = f"character:{character.id}"
+    edges: List[GraphEdge] = []
+    source_ids: List[str] = []
+    refs: List[str] = []
+
+    for profile in character.source_profiles:
+        source_ids.append(profile.source_id)
+        edges.append(
+            GraphEdge(
+                id=f"char_profile:{character.id}:{profile.source_id}",
+                source=char_node_id,
+                target=f"source:{profile.source_id}",
+                type=EDGE_TYPE_CHARACTER_PROFILE_IN_SOURCE,
+                properties={
+                    "character_id": character.id,
+                    "source_id": profile.source_id,
+                    "trait_count": len(profile.traits),
+                    "reference_count": len(profile.references),
+                },
             )
-
-    # Event nodes, participant edges, account/source edges, and parallel edges.
-    for event in storage.iter_events():
-        event_node_id = f"event:{event.id}"
-        _get_or_create_node(
-            nodes_by_id,
-            event_node_id,
-            label=event.label,
-            node_type=NODE_TYPE_EVENT,
-            event_id=event.id,
-            participants=list(event.participants),
         )
 
-        # Character participation edges.
-        for participant_id in event.participants:
-            char_node_id = f"character:{participant_id}"
-            _get_or_create_node(
-                nodes_by_id,
-                char_node_id,
-                label=participant_id,
-                node_type=NODE_TYPE_CHARACTER,
-                character_id=participant_id,
+    for rel in character.relationships:
+        other_id = getattr(rel, "target_id", None)
+        if not isinstance(other_id, str) or not other_id:
+            continue
+        refs.append(other_id)
+        rel_type = getattr(rel, "type", None) or "relationship"
+        attestation = getattr(rel, "attestation", [])
+        edges.append(
+            GraphEdge(
+                id=f"char_rel:{character.id}:{other_id}:{rel_type}",
+                source=char_node_id,
+                target=f"character:{other_id}",
+                type=EDGE_TYPE_CHARACTER_RELATIONSHIP,
+                properties={
+                    "relationship_type": rel_type,
+                    "sources": [att.source_id for att in attestation],
+                    "references": [ref for att in attestation for ref in getattr(att, "references", [])],
+                    "notes": getattr(rel, "notes", None),
+                },
             )
-            edge_id = f"char_event:{participant_id}:{event.id}"
-            edges.append(
-                GraphEdge(
-                    id=edge_id,
-                    source=char_node_id,
-                    target=event_node_id,
-                    type=EDGE_TYPE_CHARACTER_PARTICIPATED_IN_EVENT,
-                    properties={
-                        "character_id": participant_id,
-                        "event_id": event.id,
-                    },
-                )
+        )
+
+    node = GraphNode(
+        id=char_node_id,
+        label=character.canonical_name,
+        type=NODE_TYPE_CHARACTER,
+        properties={
+            "character_id": character.id,
+            "aliases": list(character.aliases),
+            "roles": list(character.roles),
+        },
+    )
+    return _EntityElements(node=node, edges=edges, source_ids=source_ids, character_refs=refs)
+
+
+def _event_elements(event: Event) -> _EntityElements:
+    event_node_id = f"event:{event.id}"
+    edges: List[GraphEdge] = []
+    source_ids: List[str] = []
+
+    for participant_id in event.participants:
+        edges.append(
+            GraphEdge(
+                id=f"char_event:{participant_id}:{event.id}",
+                source=f"character:{participant_id}",
+                target=event_node_id,
+                type=EDGE_TYPE_CHARACTER_PARTICIPATED_IN_EVENT,
+                properties={"character_id": participant_id, "event_id": event.id},
             )
+        )
 
-        # Event accounts -> sources.
-        for idx, account in enumerate(event.accounts):
-            source_node_id = f"source:{account.source_id}"
-            _get_or_create_node(
-                nodes_by_id,
-                source_node_id,
-                label=account.source_id,
-                node_type=NODE_TYPE_SOURCE,
-                source_id=account.source_id,
+    for idx, account in enumerate(event.accounts):
+        source_ids.append(account.source_id)
+        edges.append(
+            GraphEdge(
+                id=f"event_source:{event.id}:{account.source_id}:{idx}",
+                source=event_node_id,
+                target=f"source:{account.source_id}",
+                type=EDGE_TYPE_EVENT_REPORTED_IN_SOURCE,
+                properties={
+                    "event_id": event.id,
+                    "source_id": account.source_id,
+                    "reference": account.reference,
+                },
             )
-            edge_id = f"event_source:{event.id}:{account.source_id}:{idx}"
+        )
+
+    for parallel_index, parallel in enumerate(event.parallels):
+        references = parallel.get("references") or {}
+        for source_id in parallel.get("sources") or []:
+            source_ids.append(source_id)
+            props: Dict[str, Any] = {
+                "event_id": event.id,
+                "parallel_index": parallel_index,
+                "source_id": source_id,
+                "relationship": parallel.get("relationship"),
+            }
+            if source_id in references:
+                props["reference"] = references[source_id]
             edges.append(
                 GraphEdge(
-                    id=edge_id,
+                    id=f"event_parallel:{event.id}:{parallel_index}:{source_id}",
                     source=event_node_id,
-                    target=source_node_id,
-                    type=EDGE_TYPE_EVENT_REPORTED_IN_SOURCE,
-                    properties={
-                        "event_id": event.id,
-                        "source_id": account.source_id,
-                        "reference": account.reference,
-                    },
+                    target=f"source:{source_id}",
+                    type=EDGE_TYPE_EVENT_PARALLEL_SOURCE,
+                    properties=props,
                 )
             )
 
-        # Event parallels -> sources.
-        for parallel_index, parallel in enumerate(event.parallels):
-            sources = parallel.get("sources") or []
-            references = parallel.get("references") or {}
-            relationship = parallel.get("relationship")
-
-            for source_id in sources:
-                source_node_id = f"source:{source_id}"
-                _get_or_create_node(
-                    nodes_by_id,
-                    source_node_id,
-                    label=source_id,
-                    node_type=NODE_TYPE_SOURCE,
-                    source_id=source_id,
-                )
-                edge_id = f"event_parallel:{event.id}:{parallel_index}:{source_id}"
-                props: Dict[str, Any] = {
-                    "event_id": event.id,
-                    "parallel_index": parallel_index,
-                    "source_id": source_id,
-                    "relationship": relationship,
-                }
-                if source_id in references:
-                    props["reference"] = references[source_id]
-                edges.append(
-                    GraphEdge(
-                        id=edge_id,
-                        source=event_node_id,
-                        target=source_node_id,
-                        type=EDGE_TYPE_EVENT_PARALLEL_SOURCE,
-                        properties=props,
-                    )
-                )
+    node = GraphNode(
+        id=event_node_id,
+        label=event.label,
+        type=NODE_TYPE_EVENT,
+        properties={"event_id": event.id, "participants": list(event.participants)},
+    )
+    return _EntityElements(
+        node=node,
+        edges=edges,
+        source_ids=source_ids,
+        character_refs=list(event.participants),
+    )
+
+
+def _source_node(source_id: str) -> GraphNode:
+    return GraphNode(
+        id=f"source:{source_id}",
+        label=source_id,
+        type=NODE_TYPE_SOURCE,
+        properties={"source_id": source_id},
+    )
+
+
+def _placeholder_character_node(char_id: str) -> GraphNode:
+    # Referenced but not defined in the corpus; labelled with the ID, which
+    # is what name resolution falls back to for unknown characters.
+    return GraphNode(
+        id=f"character:{char_id}",
+        label=char_id,
+        type=NODE_TYPE_CHARACTER,
+        properties={"character_id": char_id},
+    )
+
+
+def _assemble(
+    character_elements: Iterable[_EntityElements],
+    event_elements: Iterable[_EntityElements],
+    shared_nodes: Optional[Dict[str, GraphNode]] = None,
+) -> Iterator[Tuple[Optional[_EntityElements], GraphElement]]:
+    """Merge per-entity elements into one deduplicated node/edge stream.
+
+    Yields ``(owner, element)`` pairs; ``owner`` is None for shared source
+    and placeholder nodes. ``shared_nodes`` lets callers reuse those node
+    objects across assemblies.
+    """
 
-    # Character relationships (character -> character edges).
-    for character in storage.iter_characters():
-        char_node_id = f"character:{character.id}"
-        _get_or_create_node(
-            nodes_by_id,
-            char_node_id,
-            label=character.canonical_name,
-            node_type=NODE_TYPE_CHARACTER,
-            character_id=character.id,
-        )
-        for rel in character.relationships:
-            other_id = getattr(rel, "target_id", None)
-            if not isinstance(other_id, str) or not other_id:
-                continue
-            other_node_id = f"character:{other_id}"
-            _get_or_create_node(
-                nodes_by_id,
-                other_node_id,
-                label=other_id,
-                node_type=NODE_TYPE_CHARACTER,
-                character_id=other_id,
-            )
-            rel_type = getattr(rel, "type", None) or "relationship"
-            edge_id = f"char_rel:{character.id}:{other_id}:{rel_type}"
-            edges.append(
-                GraphEdge(
-                    id=edge_id,
-                    source=char_node_id,
-                    target=other_node_id,
-                    type=EDGE_TYPE_CHARACTER_RELATIONSHIP,
-                    properties={
-                        "relationship_type": rel_type,
-                        "sources": [att.source_id for att in getattr(rel, "attestation", [])],
-                        "references": [
-                            ref for att in getattr(rel, "attestation", []) for ref in getattr(att, "references", [])
-                        ],
-                        "notes": getattr(rel, "notes", None),
-                    },
-                )
-            )
+    shared = shared_nodes if shared_nodes is not None else {}
+    seen: Set[str] = set()
+    referenced: Dict[str, None] = {}
+
+    def shared_node(node_id: str, factory: Any, key: str) -> Iterator[Tuple[None, GraphNode]]:
+        if node_id not in seen:
+            seen.add(node_id)
+            node = shared.get(node_id)
+            if node is None:
+                node = shared[node_id] = factory(key)
+            yield None, node
+
+    for elements in character_elements:
+        if elements.node.id not in seen:
+            seen.add(elements.node.id)
+            yield elements, elements.node
+        for source_id in elements.source_ids:
+            yield from shared_node(f"source:{source_id}", _source_node, source_id)
+        for edge in elements.edges:
+            yield elements, edge
+        referenced.update(dict.fromkeys(elements.character_refs))
+
+    for char_id in referenced:
+        yield from shared_node(f"character:{char_id}", _placeholder_character_node, char_id)
+
+    for elements in event_elements:
+        if elements.node.id not in seen:
+            seen.add(elements.node.id)
+            yield elements, elements.node
+        for char_id in elements.character_refs:
+            yield from shared_node(f"character:{char_id}", _placeholder_character_node, char_id)
+        for source_id in elements.source_ids:
+            yield from shared_node(f"source:{source_id}", _source_node, source_id)
+        for edge in elements.edges:
+            yield elements, edge
+
+
+def iter_graph_elements(
+    characters: Optional[Iterable[Character]] = None,
+    events: Optional[Iterable[Event]] = None,
+) -> Iterator[GraphElement]:
+    """Stream the graph as nodes and edges in a single pass over storage.
+
+    Yields the same nodes and edges as ``build_graph_snapshot`` without
+    materializing them: each node is yielded once, the first time it is
+    defined, and only node IDs are retained. Edges may precede the node they
+    point to (for example a relationship to a character defined later), so
+    consumers must not assume endpoints were already yielded. Characters
+    that are referenced but never defined are yielded as placeholder nodes
+    after the character pass.
+    """
+
+    chars = storage.iter_characters() if characters is None else characters
+    evts = storage.iter_events() if events is None else events
+    for _, element in _assemble(map(_character_elements, chars), map(_event_elements, evts)):
+        yield element
+
+
+def _snapshot_from_elements(elements: Iterable[GraphElement]) -> GraphSnapshot:
+    nodes: List[GraphNode] = []
+    edges: List[GraphEdge] = []
+    for element in elements:
+        if isinstance(element, GraphNode):
+            nodes.append(element)
+        else:
+            edges.append(element)
+    return GraphSnapshot(nodes=nodes, edges=edges)
+
+
+class GraphSnapshotCache:
+    """Cached graph snapshot patched incrementally as entities are saved.
+
+    The graph is built from storage in a single pass on first use and kept
+    as per-entity node/edge bundles. Saving a character or event replaces
+    only that entity's bundle; changing the data root drops everything.
+    Serialized node and edge payloads are memoized per bundle, so
+    ``payload`` and ``payload_json`` only re-serialize changed entities.
+
+    ``version`` increases whenever the cached graph changes, so callers can
+    key derived results (metrics, layouts) on it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._characters: Optional[Dict[str, _EntityElements]] = None
+        self._events: Dict[str, _EntityElements] = {}
+        self._pending: Set[Tuple[str, str]] = set()
+        self._shared_nodes: Dict[str, GraphNode] = {}
+        self._shared_payloads: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: Optional[GraphSnapshot] = None
+        self._payload: Optional[Dict[str, Any]] = None
+        self._payload_json: Optional[str] = None
+        self._index: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]] = None
+        self._derived: Dict[str, Any] = {}
+        self.version = 0
+
+    @property
+    def is_built(self) -> bool:
+        """Return True when the per-entity bundles are loaded."""
+        return self._characters is not None
+
+    def invalidate(self) -> None:
+        """Drop the cached graph; the next read rebuilds it from storage."""
+        with self._lock:
+            self._characters = None
+            self._events = {}
+            self._pending = set()
+            self._shared_nodes = {}
+            self._shared_payloads = {}
+            self._drop_assembled()
+
+    def refresh(self) -> None:
+        """Rebuild every bundle in a single pass over storage."""
+        with self._lock:
+            self.invalidate()
+            characters = {c.id: _character_elements(c) for c in storage.iter_characters()}
+            self._events = {e.id: _event_elements(e) for e in storage.iter_events()}
+            self._characters = characters
+
+    def update_entity(self, entity_type: str, entity_id: str) -> None:
+        """Mark one entity as changed so its nodes and edges are replaced.
+
+        The entity is reloaded on the next read, not here, so save paths
+        never pay for (or fail on) a reload. Entities that can no longer be
+        loaded are removed. Does nothing if the graph has not been built yet.
+        """
+        if entity_type not in ("character", "event"):
+            raise ValueError(f"Unknown entity type: {entity_type!r}")
+
+        with self._lock:
+            if self._characters is None:
+                return
+            self._pending.add((entity_type, entity_id))
+            self._drop_assembled()
+
+    def _apply_pending(self) -> None:
+        assert self._characters is not None
+        for entity_type, entity_id in sorted(self._pending):
+            bundles = self._characters if entity_type == "character" else self._events
+            try:
+                if entity_type == "character":
+                    bundles[entity_id] = _character_elements(storage.load_character(entity_id))
+                else:
+                    bundles[entity_id] = _event_elements(storage.load_event(entity_id))
+            except FileNotFoundError:
+                bundles.pop(entity_id, None)
+            self._pending.discard((entity_type, entity_id))
+
+    def snapshot(self) -> GraphSnapshot:
+        """Return the current graph snapshot.
+
+        The node and edge objects are shared with the cache and must be
+        treated as read-only; the lists themselves are fresh copies.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = _snapshot_from_elements(element for _, element in self._assembled())
+            return GraphSnapshot(nodes=list(self._snapshot.nodes), edges=list(self._snapshot.edges))
+
+    def payload(self) -> Dict[str, Any]:
+        """Return the ``{"nodes": [...], "edges": [...]}`` payload.
+
+        Node and edge dicts are reused from earlier calls for every entity
+        that has not changed. Treat the result as read-only.
+        """
+        with self._lock:
+            if self._payload is None:
+                nodes: List[Dict[str, Any]] = []
+                edges: List[Dict[str, Any]] = []
+                for owner, element in self._assembled():
+                    if owner is None:
+                        payload = self._shared_payloads.get(element.id)
+                        if payload is None:
+                            payload = self._shared_payloads[element.id] = _node_payload(element)  # type: ignore[arg-type]
+                        nodes.append(payload)
+                    elif element is owner.node:
+                        nodes.append(owner.payloads()[0])
+                if self._characters is not None:
+                    for bundles in (self._characters, self._events):
+                        for key in sorted(bundles):
+                            edges.extend(bundles[key].payloads()[1])
+                self._payload = {"nodes": nodes, "edges": edges}
+            return self._payload
+
+    def _adjacency(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Return (node payload by ID, incident edge payloads by node ID)."""
+        if self._index is None:
+            payload = self.payload()
+            nodes = {node["id"]: node for node in payload["nodes"]}
+            incident: Dict[str, List[Dict[str, Any]]] = {}
+            for edge in payload["edges"]:
+                incident.setdefault(edge["source"], []).append(edge)
+                if edge["target"] != edge["source"]:
+                    incident.setdefault(edge["target"], []).append(edge)
+            self._index = (nodes, incident)
+        return self._index
+
+    def neighborhood(
+        self,
+        node_id: str,
+        hops: int = 1,
+        edge_types: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return the subgraph within ``hops`` edges of ``node_id``.
+
+        Edges are followed in either direction, optionally restricted to
+        ``edge_types``. Nodes are collected breadth-first, nearest first, up
+        to ``limit`` nodes (including ``node_id``); every matching edge
+        between collected nodes is returned. Node and edge dicts are the
+        cached payload objects and must be treated as read-only.
+
+        Raises:
+            KeyError: If ``node_id`` is not in the graph
+            ValueError: If ``hops`` is negative or ``limit`` is below 1
+        """
+        if hops < 0:
+            raise ValueError("hops must be non-negative")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        allowed = set(edge_types) if edge_types is not None else None
+
+        with self._lock:
+            nodes, incident = self._adjacency()
+            if node_id not in nodes:
+                raise KeyError(node_id)
+            depth: Dict[str, int] = {node_id: 0}
+            frontier = [node_id]
+            truncated = False
+            for level in range(1, hops + 1):
+                next_frontier: List[str] = []
+                for current in frontier:
+                    for edge in incident.get(current, ()):
+                        if allowed is not None and edge["type"] not in allowed:
+                            continue
+                        other = edge["target"] if edge["source"] == current else edge["source"]
+                        if other in depth:
+                            continue
+                        if limit is not None and len(depth) >= limit:
+                            truncated = True
+                            break
+                        depth[other] = level
+                        next_frontier.append(other)
+                    if truncated:
+                        break
+                frontier = next_frontier
+                if truncated or not frontier:
+                    break
+
+            edges = [
+                edge
+                for current in depth
+                for edge in incident.get(current, ())
+                if edge["source"] == current
+                and edge["target"] in depth
+                and (allowed is None or edge["type"] in allowed)
+            ]
+            return {
+                "center": node_id,
+                "hops": hops,
+                "nodes": [nodes[current] for current in depth],
+                "edges": edges,
+                "depth": depth,
+                "truncated": truncated,
+            }
+
+    def derived(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return a value computed from the current graph, memoized per version.
+
+        ``factory`` runs at most once per ``version``; the value is dropped
+        whenever the graph changes. Used for results that depend on the
+        whole graph, such as layouts.
+        """
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = factory()
+            return self._derived[key]
+
+    def payload_json(self) -> str:
+        """Return ``payload()`` serialized as JSON, cached until the next change."""
+        with self._lock:
+            if self._payload_json is None:
+                self._payload_json = json.dumps(self.payload(), ensure_ascii=False)
+            return self._payload_json
+
+    def _assembled(self) -> Iterator[Tuple[Optional[_EntityElements], GraphElement]]:
+        if self._characters is None:
+            self.refresh()
+        self._apply_pending()
+        assert self._characters is not None
+        characters = [self._characters[key] for key in sorted(self._characters)]
+        events = [self._events[key] for key in sorted(self._events)]
+        return _assemble(characters, events, self._shared_nodes)
+
+    def _drop_assembled(self) -> None:
+        self._snapshot = None
+        self._payload = None
+        self._payload_json = None
+        self._index = None
+        self._derived = {}
+        self.version += 1
+
+    def _on_entity_changed(self, entity_type: Optional[str], entity_id: Optional[str]) -> None:
+        if entity_type is None or entity_id is None:
+            self.invalidate()
+            return
+        self.update_entity(entity_type, entity_id)
+
+
+_default_cache: Optional[GraphSnapshotCache] = None
+
+
+def get_default_graph_cache() -> GraphSnapshotCache:
+    """Return the process-wide graph cache kept in sync with storage."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = GraphSnapshotCache()
+        CacheRegistry.register_entity_listener(_default_cache._on_entity_changed)
+    return _default_cache
+
+
+def build_graph_snapshot(
+    characters: Optional[Iterable[Character]] = None,
+    events: Optional[Iterable[Event]] = None,
+) -> GraphSnapshot:
+    """Build a simple property-graph view of all BCE characters and events.
+
+    Nodes include:
+    - character: one per Character.id
+    - event: one per Event.id
+    - source: one per source_id seen in character profiles or event accounts
+
+    Edges include:
+    - character_participated_in_event: Character -> Event
+    - character_profile_in_source: Character -> Source
+    - event_reported_in_source: Event -> Source
+    - character_relationship: Character -> Character (from relationships field)
+    - event_parallel_source: Event -> Source (from event.parallels)
+
+    Without arguments the snapshot comes from the default
+    ``GraphSnapshotCache``, built in one pass and patched on save; its nodes
+    and edges are shared and must not be mutated. ``characters`` and
+    ``events`` may be passed to build a fresh snapshot from an already-loaded
+    corpus (storage is read for whichever is omitted).
+    """
 
-    return GraphSnapshot(nodes=list(nodes_by_id.values()), edges=edges)
+    if characters is None and events is None:
+        return get_default_graph_cache().snapshot()
+    return _snapshot_from_elements(iter_graph_elements(characters=characters, events=events))
@@ -0,0 +1,294 @@
+"""Streaming bulk exports of the BCE property graph.
+
+Writers consume ``export_graph.iter_graph_elements`` directly, so a single
+pass over storage feeds every requested format and the full snapshot is
+never held in memory. Supported formats:
+
+``neo4j``
+    ``neo4j-admin database import`` CSV layout: one node file per label and
+    one relationship file per edge type, each with typed headers. Array
+    properties use ``;`` (the importer's default array delimiter)::
+
+        neo4j-admin database import full \\
+            --nodes=neo4j/nodes_character.csv --nodes=neo4j/nodes_event.csv \\
+            --nodes=neo4j/nodes_source.csv \\
+            --relationships=neo4j/rels_character_relationship.csv ...
+
+``graphml``
+    A single ``graph.graphml`` document with declared attribute keys.
+
+``ndjson``
+    ``nodes.ndjson`` and ``edges.ndjson``, one JSON object per line with
+    the same shape as the ``/api/graph`` payload.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .export_graph import (
+    EDGE_TYPE_CHARACTER_PARTICIPATED_IN_EVENT,
+    EDGE_TYPE_CHARACTER_PROFILE_IN_SOURCE,
+    EDGE_TYPE_CHARACTER_RELATIONSHIP,
+    EDGE_TYPE_EVENT_PARALLEL_SOURCE,
+    EDGE_TYPE_EVENT_REPORTED_IN_SOURCE,
+    NODE_TYPE_CHARACTER,
+    NODE_TYPE_EVENT,
+    NODE_TYPE_SOURCE,
+    GraphEdge,
+    GraphNode,
+    iter_graph_elements,
+)
+from .models import Character, Event
+
+
+GRAPH_BULK_FORMATS: Tuple[str, ...] = ("neo4j", "graphml", "ndjson")
+
+# Property schema per node/edge type: (name, neo4j type). Lists are
+# ``string[]``; GraphML stores them as JSON strings.
+NODE_PROPERTY_SCHEMA: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    NODE_TYPE_CHARACTER: (("character_id", "string"), ("aliases", "string[]"), ("roles", "string[]")),
+    NODE_TYPE_EVENT: (("event_id", "string"), ("participants", "string[]")),
+    NODE_TYPE_SOURCE: (("source_id", "string"),),
+}
+
+EDGE_PROPERTY_SCHEMA: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    EDGE_TYPE_CHARACTER_PROFILE_IN_SOURCE: (
+        ("character_id", "string"),
+        ("source_id", "string"),
+        ("trait_count", "int"),
+        ("reference_count", "int"),
+    ),
+    EDGE_TYPE_CHARACTER_RELATIONSHIP: (
+        ("relationship_type", "string"),
+        ("sources", "string[]"),
+        ("references", "string[]"),
+        ("notes", "string"),
+    ),
+    EDGE_TYPE_CHARACTER_PARTICIPATED_IN_EVENT: (("character_id", "string"), ("event_id", "string")),
+    EDGE_TYPE_EVENT_REPORTED_IN_SOURCE: (
+        ("event_id", "string"),
+        ("source_id", "string"),
+        ("reference", "string"),
+    ),
+    EDGE_TYPE_EVENT_PARALLEL_SOURCE: (
+        ("event_id", "string"),
+        ("parallel_index", "int"),
+        ("source_id", "string"),
+        ("relationship", "string"),
+        ("reference", "string"),
+    ),
+}
+
+_GRAPHML_TYPES = {"string": "string", "string[]": "string", "int": "int"}
+
+
+def parse_graph_formats(spec: Optional[str | Iterable[str]]) -> List[str]:
+    """Normalize a comma-separated or iterable list of bulk graph formats.
+
+    Raises:
+        ValueError: If an unknown format is requested
+    """
+    if spec is None:
+        return list(GRAPH_BULK_FORMATS)
+    items = spec.split(",") if isinstance(spec, str) else list(spec)
+    formats = list(dict.fromkeys(item.strip().lower() for item in items if item and item.strip()))
+    unknown = [fmt for fmt in formats if fmt not in GRAPH_BULK_FORMATS]
+    if unknown:
+        raise ValueError(
+            f"Unknown graph format(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(GRAPH_BULK_FORMATS)}"
+        )
+    return formats
+
+
+def _csv_value(value: Any, kind: str) -> str:
+    if value is None:
+        return ""
+    if kind == "string[]":
+        return ";".join(str(item) for item in value)
+    return str(value)
+
+
+class _Neo4jWriter:
+    """Writes ``neo4j-admin import`` node and relationship CSV files."""
+
+    def __init__(self, root: Path, stack: ExitStack) -> None:
+        self._root = root
+        self._stack = stack
+        self._writers: Dict[str, Any] = {}
+        self.files: List[str] = []
+        root.mkdir(parents=True, exist_ok=True)
+
+    def _writer(self, name: str, header: List[str]) -> Any:
+        writer = self._writers.get(name)
+        if writer is None:
+            handle = self._stack.enter_context((self._root / name).open("w", encoding="utf-8", newline=""))
+            writer = csv.writer(handle)
+            writer.writerow(header)
+            self._writers[name] = writer
+            self.files.append(name)
+        return writer
+
+    def node(self, node: GraphNode) -> None:
+        schema = NODE_PROPERTY_SCHEMA.get(node.type, ())
+        header = ["id:ID", "name", *(f"{p}:{t}" for p, t in schema), ":LABEL"]
+        writer = self._writer(f"nodes_{node.type}.csv", header)
+        writer.writerow(
+            [
+                node.id,
+                node.label,
+                *(_csv_value(node.properties.get(p), t) for p, t in schema),
+                node.type.capitalize(),
+            ]
+        )
+
+    def edge(self, edge: GraphEdge) -> None:
+        schema = EDGE_PROPERTY_SCHEMA.get(edge.type, ())
+        header = [":START_ID", ":END_ID", ":TYPE", "id", *(f"{p}:{t}" for p, t in schema)]
+        writer = self._writer(f"rels_{edge.type}.csv", header)
+        writer.writerow(
+            [
+                edge.source,
+                edge.target,
+                edge.type.upper(),
+                edge.id,
+                *(_csv_value(edge.properties.get(p), t) for p, t in schema),
+            ]
+        )
+
+
+class _GraphMLWriter:
+    """Writes a GraphML document element by element."""
+
+    def __init__(self, path: Path, stack: ExitStack) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._out: IO[str] = stack.enter_context(path.open("w", encoding="utf-8"))
+        self._out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._out.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        self._out.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+        self._out.write('  <key id="type" for="all" attr.name="type" attr.type="string"/>\n')
+        for domain, schemas in (("node", NODE_PROPERTY_SCHEMA), ("edge", EDGE_PROPERTY_SCHEMA)):
+            declared: Dict[str, str] = {}
+            for schema in schemas.values():
+                for prop, kind in schema:
+                    declared.setdefault(prop, _GRAPHML_TYPES[kind])
+            for prop, kind in declared.items():
+                self._out.write(
+                    f'  <key id="{domain}_{prop}" for="{domain}" attr.name="{prop}" attr.type="{kind}"/>\n'
+                )
+        self._out.write('  <graph id="bce" edgedefault="directed">\n')
+
+    def _data(self, key: str, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, ensure_ascii=False)
+        return f"      <data key={quoteattr(key)}>{escape(str(value))}</data>\n"
+
+    def node(self, node: GraphNode) -> None:
+        parts = [f"    <node id={quoteattr(node.id)}>\n", self._data("label", node.label), self._data("type", node.type)]
+        for prop, _ in NODE_PROPERTY_SCHEMA.get(node.type, ()):
+            parts.append(self._data(f"node_{prop}", node.properties.get(prop)))
+        parts.append("    </node>\n")
+        self._out.write("".join(parts))
+
+    def edge(self, edge: GraphEdge) -> None:
+        parts = [
+            f"    <edge id={quoteattr(edge.id)} source={quoteattr(edge.source)} target={quoteattr(edge.target)}>\n",
+            self._data("type", edge.type),
+        ]
+        for prop, _ in EDGE_PROPERTY_SCHEMA.get(edge.type, ()):
+            parts.append(self._data(f"edge_{prop}", edge.properties.get(prop)))
+        parts.append("    </edge>\n")
+        self._out.write("".join(parts))
+
+    def close(self) -> None:
+        self._out.write("  </graph>\n</graphml>\n")
+
+
+class _NDJSONWriter:
+    """Writes node and edge lists as newline-delimited JSON."""
+
+    def __init__(self, root: Path, stack: ExitStack) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        self._nodes: IO[str] = stack.enter_context((root / "nodes.ndjson").open("w", encoding="utf-8"))
+        self._edges: IO[str] = stack.enter_context((root / "edges.ndjson").open("w", encoding="utf-8"))
+
+    def node(self, node: GraphNode) -> None:
+        record = {"id": node.id, "label": node.label, "type": node.type, "properties": node.properties}
+        self._nodes.write(json.dumps(record, ensure_ascii=True) + "\n")
+
+    def edge(self, edge: GraphEdge) -> None:
+        record = {
+            "id": edge.id,
+            "source": edge.source,
+            "target": edge.target,
+            "type": edge.type,
+            "properties": edge.properties,
+        }
+        self._edges.write(json.dumps(record, ensure_ascii=True) + "\n")
+
+
+def export_graph_bulk(
+    out_dir: str | Path,
+    formats: Optional[str | Iterable[str]] = None,
+    characters: Optional[Iterable[Character]] = None,
+    events: Optional[Iterable[Event]] = None,
+) -> Dict[str, List[str]]:
+    """Stream the graph to bulk-load formats in one pass over storage.
+
+    Parameters
+    ----------
+    out_dir:
+        Directory that receives ``neo4j/``, ``graph.graphml`` and/or
+        ``ndjson/``.
+    formats:
+        Comma-separated string or iterable drawn from ``GRAPH_BULK_FORMATS``.
+        Defaults to all formats.
+    characters, events:
+        Optional entity iterables; storage is streamed when omitted.
+
+    Returns
+    -------
+    dict
+        Format -> written file paths relative to ``out_dir``.
+    """
+    selected = parse_graph_formats(formats)
+    root = Path(out_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        writers: Dict[str, Any] = {}
+        if "neo4j" in selected:
+            writers["neo4j"] = _Neo4jWriter(root / "neo4j", stack)
+        if "graphml" in selected:
+            writers["graphml"] = _GraphMLWriter(root / "graph.graphml", stack)
+        if "ndjson" in selected:
+            writers["ndjson"] = _NDJSONWriter(root / "ndjson", stack)
+        active = list(writers.values())
+
+        for element in iter_graph_elements(characters=characters, events=events):
+            if isinstance(element, GraphNode):
+                for writer in active:
+                    writer.node(element)
+            else:
+                for writer in active:
+                    writer.edge(element)
+
+        if "graphml" in writers:
+            writers["graphml"].close()
+
+    outputs: Dict[str, List[str]] = {}
+    if "neo4j" in writers:
+        outputs["neo4j"] = [f"neo4j/{name}" for name in writers["neo4j"].files]
+    if "graphml" in writers:
+        outputs["graphml"] = ["graph.graphml"]
+    if "ndjson" in writers:
+        outputs["ndjson"] = ["ndjson/nodes.ndjson", "ndjson/edges.ndjson"]
+    return outputs
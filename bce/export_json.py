@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from . import storage
+from .models import Character, Event
 
 
 def _export_iterable(objs: Iterable[object], output_path: str) -> None:
@@ -21,11 +22,20 @@ def _export_iterable(objs: Iterable[object], output_path: str) -> None:
         json.dump(data, f, ensure_ascii=True, indent=2)
 
 
-def export_all_characters(output_path: str) -> None:
-    """Export all characters to a single JSON file at ``output_path``."""
-    _export_iterable(storage.iter_characters(), output_path)
+def export_all_characters(
+    output_path: str, characters: Optional[Iterable[Character]] = None
+) -> None:
+    """Export all characters to a single JSON file at ``output_path``.
 
+    ``characters`` may be passed to reuse an already-loaded corpus instead
+    of reading storage again.
+    """
+    _export_iterable(storage.iter_characters() if characters is None else characters, output_path)
 
-def export_all_events(output_path: str) -> None:
-    """Export all events to a single JSON file at ``output_path``."""
-    _export_iterable(storage.iter_events(), output_path)
+
+def export_all_events(output_path: str, events: Optional[Iterable[Event]] = None) -> None:
+    """Export all events to a single JSON file at ``output_path``.
+
+    ``events`` may be passed to reuse an already-loaded corpus.
+    """
+    _export_iterable(storage.iter_events() if events is None else events, output_path)
@@ -0,0 +1,410 @@
+"""Multi-format export job.
+
+``run_export`` loads the corpus once, builds every dossier once, and fans the
+results out to per-format writers, optionally in parallel worker processes.
+Each writer receives only the preloaded data it needs, so no writer touches
+storage on its own.
+
+Output layout under ``out_dir``::
+
+    json/characters.json, json/events.json
+    csv/characters.csv, csv/events.csv
+    md/characters/<id>.md, md/events/<id>.md
+    bibtex/citations.bib
+    graph/graph.json
+    export-manifest.json
+
+Runs are incremental: the manifest records an input hash per output, and
+only outputs whose inputs changed are regenerated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import dossiers, queries, sources
+from .export_citations import export_citations
+from .export_csv import export_characters_csv, export_events_csv
+from .export_graph import build_graph_snapshot
+from .export_json import export_all_characters, export_all_events
+from .export_markdown import dossier_to_markdown
+from .models import Character, Event
+
+
+EXPORT_FORMATS: Tuple[str, ...] = ("json", "csv", "md", "bibtex", "graph")
+MANIFEST_NAME = "export-manifest.json"
+# Bump when writer output changes so existing manifests trigger a rebuild.
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ExportCorpus:
+    """Everything the writers need, loaded and built exactly once."""
+
+    characters: List[Character]
+    events: List[Event]
+    character_dossiers: List[Dict[str, Any]] = field(default_factory=list)
+    event_dossiers: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class ExportReport:
+    """Result of a multi-format export run.
+
+    Attributes:
+        out_dir: Root output directory
+        outputs: Format -> list of written file paths (relative to out_dir)
+        skipped: Format -> list of up-to-date paths that were not rewritten
+        removed: Paths deleted because their entity left the corpus
+        timings: Stage name -> elapsed seconds. Stages are ``load``,
+            ``hash``, ``dossiers``, ``write:<format>`` (time spent inside
+            each writer), ``write`` (wall time of the fan-out) and ``total``.
+    """
+
+    out_dir: Path
+    outputs: Dict[str, List[str]] = field(default_factory=dict)
+    skipped: Dict[str, List[str]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def format_timings(self) -> str:
+        """Return a human-readable per-stage timing summary."""
+        width = max((len(stage) for stage in self.timings), default=0)
+        return "\n".join(
+            f"{stage.ljust(width)}  {seconds * 1000:9.1f} ms" for stage, seconds in self.timings.items()
+        )
+
+
+def parse_formats(spec: Optional[str | Iterable[str]]) -> List[str]:
+    """Normalize a comma-separated or iterable format list.
+
+    Raises:
+        ValueError: If an unknown format is requested
+    """
+    if spec is None:
+        return list(EXPORT_FORMATS)
+    items = spec.split(",") if isinstance(spec, str) else list(spec)
+    formats = list(dict.fromkeys(item.strip().lower() for item in items if item and item.strip()))
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(
+            f"Unknown export format(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(EXPORT_FORMATS)}"
+        )
+    return formats
+
+
+def load_export_corpus(with_dossiers: bool = True) -> ExportCorpus:
+    """Load all characters and events once and optionally build their dossiers.
+
+    Entities are loaded through the ``queries`` caches so dossier building
+    and conflict analysis reuse the same objects instead of re-reading
+    storage.
+    """
+    corpus = ExportCorpus(
+        characters=[queries.get_character(char_id) for char_id in queries.list_character_ids()],
+        events=[queries.get_event(event_id) for event_id in queries.list_event_ids()],
+    )
+    if with_dossiers:
+        _build_dossiers(corpus)
+    return corpus
+
+
+def _build_dossiers(corpus: ExportCorpus) -> None:
+    corpus.character_dossiers = [dossiers.build_character_dossier(c.id) for c in corpus.characters]
+    corpus.event_dossiers = [dossiers.build_event_dossier(e.id) for e in corpus.events]
+
+
+# Writers. Each takes the output root plus the preloaded inputs it needs and
+# returns the written paths relative to the root. They are module-level so
+# they can be shipped to worker processes.
+
+
+def _write_json(out_dir: Path, characters: List[Character], events: List[Event]) -> List[str]:
+    export_all_characters(str(out_dir / "json" / "characters.json"), characters=characters)
+    export_all_events(str(out_dir / "json" / "events.json"), events=events)
+    return ["json/characters.json", "json/events.json"]
+
+
+def _write_csv(out_dir: Path, characters: List[Character], events: List[Event]) -> List[str]:
+    export_characters_csv(str(out_dir / "csv" / "characters.csv"), characters=characters)
+    export_events_csv(str(out_dir / "csv" / "events.csv"), events=events, characters=characters)
+    return ["csv/characters.csv", "csv/events.csv"]
+
+
+def _write_markdown(
+    out_dir: Path,
+    character_dossiers: List[Dict[str, Any]],
+    event_dossiers: List[Dict[str, Any]],
+) -> List[str]:
+    written: List[str] = []
+    for kind, items in (("characters", character_dossiers), ("events", event_dossiers)):
+        folder = out_dir / "md" / kind
+        folder.mkdir(parents=True, exist_ok=True)
+        for dossier in items:
+            name = f"{dossier['id']}.md"
+            (folder / name).write_text(dossier_to_markdown(dossier) + "\n", encoding="utf-8")
+            written.append(f"md/{kind}/{name}")
+    return written
+
+
+def _write_bibtex(out_dir: Path, characters: List[Character], events: List[Event]) -> List[str]:
+    path = out_dir / "bibtex" / "citations.bib"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entries = export_citations("bibtex", characters=characters, events=events)
+    path.write_text("\n\n".join(entries) + "\n", encoding="utf-8")
+    return ["bibtex/citations.bib"]
+
+
+def _write_graph(out_dir: Path, characters: List[Character], events: List[Event]) -> List[str]:
+    path = out_dir / "graph" / "graph.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    snapshot = build_graph_snapshot(characters=characters, events=events)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(snapshot.to_dict(), f, ensure_ascii=True, indent=2)
+    return ["graph/graph.json"]
+
+
+_WRITERS: Dict[str, Callable[..., List[str]]] = {
+    "json": _write_json,
+    "csv": _write_csv,
+    "md": _write_markdown,
+    "bibtex": _write_bibtex,
+    "graph": _write_graph,
+}
+
+
+def _writer_args(fmt: str, corpus: ExportCorpus) -> Tuple[Any, ...]:
+    if fmt == "md":
+        return (corpus.character_dossiers, corpus.event_dossiers)
+    return (corpus.characters, corpus.events)
+
+
+# Incremental exports. Every output file is keyed by a hash of the inputs it
+# depends on; the manifest written next to the outputs records those hashes.
+
+
+def _digest(parts: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _entity_hash(obj: Any) -> str:
+    return _digest([json.dumps(asdict(obj), sort_keys=True, ensure_ascii=True, default=str)])
+
+
+@dataclass
+class InputHashes:
+    """Content hashes of every export input, keyed by ID."""
+
+    characters: Dict[str, str]
+    events: Dict[str, str]
+    sources: Dict[str, str]
+    names: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        return {"characters": self.characters, "events": self.events, "sources": self.sources}
+
+
+def compute_input_hashes(corpus: ExportCorpus) -> InputHashes:
+    """Hash each character, event and source metadata record of ``corpus``."""
+    raw_sources = sources._read_sources_raw()
+    return InputHashes(
+        characters={c.id: _entity_hash(c) for c in corpus.characters},
+        events={e.id: _entity_hash(e) for e in corpus.events},
+        sources={
+            source_id: _digest([json.dumps(raw, sort_keys=True, ensure_ascii=True, default=str)])
+            for source_id, raw in raw_sources.items()
+        },
+        names={c.id: c.canonical_name for c in corpus.characters},
+    )
+
+
+def character_dossier_hash(character: Character, hashes: InputHashes) -> str:
+    """Return the hash of everything a character's dossier is built from.
+
+    Besides the character itself, a dossier embeds related characters' names
+    and the metadata of its sources.
+    """
+    parts = [hashes.characters[character.id]]
+    for rel in character.relationships:
+        target = rel.target_id or ""
+        parts.append(f"rel:{target}={hashes.names.get(target, target)}")
+    for profile in character.source_profiles:
+        parts.append(f"src:{profile.source_id}={hashes.sources.get(profile.source_id, '')}")
+    return _digest(parts)
+
+
+def _plan_outputs(fmt: str, corpus: ExportCorpus, hashes: InputHashes) -> Dict[str, str]:
+    """Return ``{relative output path: dependency hash}`` for one format."""
+    chars = [hashes.characters[c.id] for c in corpus.characters]
+    events = [hashes.events[e.id] for e in corpus.events]
+    names = [f"{cid}={name}" for cid, name in hashes.names.items()]
+    srcs = [f"{sid}={h}" for sid, h in sorted(hashes.sources.items())]
+    if fmt == "json":
+        return {"json/characters.json": _digest(chars), "json/events.json": _digest(events)}
+    if fmt == "csv":
+        return {"csv/characters.csv": _digest(chars), "csv/events.csv": _digest(events + names)}
+    if fmt == "md":
+        plan = {
+            f"md/characters/{c.id}.md": character_dossier_hash(c, hashes) for c in corpus.characters
+        }
+        plan.update({f"md/events/{e.id}.md": hashes.events[e.id] for e in corpus.events})
+        return plan
+    if fmt == "bibtex":
+        return {"bibtex/citations.bib": _digest(chars + events + srcs)}
+    return {"graph/graph.json": _digest(chars + events)}
+
+
+def load_manifest(out_dir: str | Path) -> Dict[str, Any]:
+    """Read the export manifest from ``out_dir``.
+
+    Returns an empty manifest when the file is missing, unreadable or was
+    written by an incompatible version.
+    """
+    path = Path(out_dir) / MANIFEST_NAME
+    empty: Dict[str, Any] = {"version": MANIFEST_VERSION, "inputs": {}, "outputs": {}}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return empty
+    if not isinstance(data.get("outputs"), dict):
+        return empty
+    return data
+
+
+def _write_manifest(out_dir: Path, manifest: Dict[str, Any]) -> None:
+    path = out_dir / MANIFEST_NAME
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=True, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _run_writer(fmt: str, out_dir: Path, args: Tuple[Any, ...]) -> Tuple[str, List[str], float]:
+    start = time.perf_counter()
+    written = _WRITERS[fmt](out_dir, *args)
+    return fmt, written, time.perf_counter() - start
+
+
+def run_export(
+    out_dir: str | Path,
+    formats: Optional[str | Iterable[str]] = None,
+    jobs: int = 1,
+    force: bool = False,
+) -> ExportReport:
+    """Export the corpus to several formats in one job.
+
+    Outputs are incremental: an export manifest in ``out_dir`` records the
+    dependency hash of every output file, and only outputs whose inputs
+    changed (or that are missing on disk) are regenerated. Outputs that
+    belong to entities no longer in the corpus are deleted.
+
+    Parameters
+    ----------
+    out_dir:
+        Directory that receives one sub-directory per format.
+    formats:
+        Comma-separated string or iterable drawn from ``EXPORT_FORMATS``.
+        Defaults to all formats.
+    jobs:
+        Number of worker processes for the writers. ``1`` writes in the
+        current process.
+    force:
+        Ignore the manifest and regenerate every selected output.
+
+    Returns
+    -------
+    ExportReport
+        Written, skipped and removed files plus per-stage timings.
+    """
+    selected = parse_formats(formats)
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+
+    root = Path(out_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    report = ExportReport(out_dir=root)
+    total_start = time.perf_counter()
+
+    start = time.perf_counter()
+    corpus = load_export_corpus(with_dossiers=False)
+    report.timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hashes = compute_input_hashes(corpus)
+    previous = load_manifest(root)
+    old_outputs: Dict[str, Dict[str, str]] = previous["outputs"]
+    new_outputs = {path: entry for path, entry in old_outputs.items() if entry.get("format") not in selected}
+
+    stale: Dict[str, List[str]] = {}
+    fresh: Dict[str, List[str]] = {}
+    for fmt in selected:
+        plan = _plan_outputs(fmt, corpus, hashes)
+        for rel_path, digest in plan.items():
+            new_outputs[rel_path] = {"format": fmt, "hash": digest}
+            old = old_outputs.get(rel_path)
+            if force or old is None or old.get("hash") != digest or not (root / rel_path).is_file():
+                stale.setdefault(fmt, []).append(rel_path)
+            else:
+                fresh.setdefault(fmt, []).append(rel_path)
+        for rel_path, entry in old_outputs.items():
+            if entry.get("format") == fmt and rel_path not in plan:
+                (root / rel_path).unlink(missing_ok=True)
+                report.removed.append(rel_path)
+    report.timings["hash"] = time.perf_counter() - start
+
+    stale_md = set(stale.get("md", []))
+    if stale_md:
+        start = time.perf_counter()
+        corpus.character_dossiers = [
+            dossiers.build_character_dossier(c.id)
+            for c in corpus.characters
+            if f"md/characters/{c.id}.md" in stale_md
+        ]
+        corpus.event_dossiers = [
+            dossiers.build_event_dossier(e.id)
+            for e in corpus.events
+            if f"md/events/{e.id}.md" in stale_md
+        ]
+        report.timings["dossiers"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tasks = [(fmt, root, _writer_args(fmt, corpus)) for fmt in selected if fmt in stale]
+    if jobs == 1 or len(tasks) <= 1:
+        results = [_run_writer(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            futures = [pool.submit(_run_writer, *task) for task in tasks]
+            results = [future.result() for future in futures]
+    for fmt, written, elapsed in results:
+        report.outputs[fmt] = written
+        report.timings[f"write:{fmt}"] = elapsed
+    # A writer may rewrite up-to-date files of its format too (json and csv
+    # write both files at once), so only what it left alone was skipped.
+    for fmt, paths in fresh.items():
+        written_paths = set(report.outputs.get(fmt, ()))
+        skipped = [path for path in paths if path not in written_paths]
+        if skipped:
+            report.skipped[fmt] = skipped
+    report.timings["write"] = time.perf_counter() - start
+
+    _write_manifest(
+        root,
+        {"version": MANIFEST_VERSION, "inputs": hashes.to_dict(), "outputs": dict(sorted(new_outputs.items()))},
+    )
+    report.timings["total"] = time.perf_counter() - total_start
+    return report
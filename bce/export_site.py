@@ -0,0 +1,290 @@
+"""Static-site renderer for Markdown dossiers.
+
+``build_site`` writes one Markdown page per character and event plus index
+pages::
+
+    index.md
+    characters/index.md, characters/<id>.md
+    events/index.md, events/<id>.md
+
+Pages are rendered with ``dossier_to_markdown`` (so ``DOSSIER_EXPORT_MARKDOWN``
+hooks such as ``graph_viz`` still apply) in a process pool. A manifest in the
+output directory records the input and content hash of each page: pages
+whose inputs are unchanged are neither rebuilt nor rendered, rendered pages
+identical to what is on disk are not rewritten, and every write goes through
+a temporary file and ``os.replace``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import dossiers
+from .config import BceConfig, get_default_config, set_default_config
+from .export_markdown import dossier_to_markdown
+from .export_pipeline import (
+    InputHashes,
+    character_dossier_hash,
+    compute_input_hashes,
+    load_export_corpus,
+)
+from .hooks import HookRegistry
+from .plugins import PluginManager
+
+
+SITE_MANIFEST_NAME = ".site-manifest.json"
+# Bump when page layout changes so existing sites are re-rendered.
+SITE_MANIFEST_VERSION = 1
+
+# (relative path, dossier, previous content hash)
+_PageTask = Tuple[str, Dict[str, Any], Optional[str]]
+
+
+@dataclass
+class SiteReport:
+    """Result of a site build.
+
+    Attributes:
+        out_dir: Root output directory
+        written: Pages (re)written to disk
+        unchanged: Pages rendered but byte-identical to the existing file
+        skipped: Pages whose inputs were unchanged and were not rendered
+        removed: Pages deleted because their entity left the corpus
+        timings: Stage name -> elapsed seconds
+    """
+
+    out_dir: Path
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _render_salt() -> str:
+    """Hash of renderer settings that affect every page's output."""
+    plugins = sorted(f"{p.name}:{p.version}" for p in PluginManager.list_loaded_plugins())
+    hooks_enabled = HookRegistry._hooks_enabled_in_config()
+    return _sha256(json.dumps([SITE_MANIFEST_VERSION, hooks_enabled, plugins]))
+
+
+def _page_input_hashes(corpus: Any, hashes: InputHashes, salt: str) -> Dict[str, str]:
+    pages = {
+        f"characters/{c.id}.md": _sha256(salt + character_dossier_hash(c, hashes))
+        for c in corpus.characters
+    }
+    pages.update({f"events/{e.id}.md": _sha256(salt + hashes.events[e.id]) for e in corpus.events})
+    return pages
+
+
+def _render_index_pages(corpus: Any) -> Dict[str, str]:
+    character_lines = [
+        f"- [{c.canonical_name}]({c.id}.md)"
+        for c in sorted(corpus.characters, key=lambda c: (c.canonical_name.lower(), c.id))
+    ]
+    event_lines = [
+        f"- [{e.label}]({e.id}.md)" for e in sorted(corpus.events, key=lambda e: (e.label.lower(), e.id))
+    ]
+    return {
+        "index.md": "\n".join(
+            [
+                "# Codex Azazel",
+                "",
+                f"- [Characters](characters/index.md) ({len(character_lines)})",
+                f"- [Events](events/index.md) ({len(event_lines)})",
+                "",
+            ]
+        ),
+        "characters/index.md": "\n".join(["# Characters", "", *character_lines, ""]),
+        "events/index.md": "\n".join(["# Events", "", *event_lines, ""]),
+    }
+
+
+def _write_if_changed(root: Path, rel_path: str, text: str, previous: Optional[str]) -> Tuple[str, bool]:
+    digest = _sha256(text)
+    path = root / rel_path
+    if digest == previous and path.is_file():
+        return digest, False
+    write_atomic(path, text)
+    return digest, True
+
+
+def _render_chunk(out_dir: str, tasks: Sequence[_PageTask]) -> List[Tuple[str, str, bool]]:
+    """Render and write a batch of dossier pages; runs in worker processes."""
+    root = Path(out_dir)
+    results = []
+    for rel_path, dossier, previous in tasks:
+        digest, written = _write_if_changed(root, rel_path, dossier_to_markdown(dossier) + "\n", previous)
+        results.append((rel_path, digest, written))
+    return results
+
+
+def _init_worker(
+    config: BceConfig,
+    hooks_enabled: bool,
+    plugin_dirs: List[Path],
+    plugin_names: List[str],
+) -> None:
+    """Mirror the parent's configuration and plugins inside a worker.
+
+    Plugins re-register their ``DOSSIER_EXPORT_MARKDOWN`` hooks on load.
+    Handlers registered directly on ``HookRegistry`` (outside a plugin) are
+    only inherited by workers on platforms that fork.
+    """
+    set_default_config(config)
+    if hooks_enabled:
+        HookRegistry.enable()
+    else:
+        HookRegistry.disable()
+    for plugin_dir in plugin_dirs:
+        PluginManager.add_plugin_directory(plugin_dir)
+    for name in plugin_names:
+        PluginManager.load_plugin(name)
+
+
+def _load_site_manifest(root: Path) -> Dict[str, Any]:
+    try:
+        with (root / SITE_MANIFEST_NAME).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SITE_MANIFEST_VERSION:
+        return {}
+    pages = data.get("pages")
+    return pages if isinstance(pages, dict) else {}
+
+
+def build_site(
+    out_dir: str | Path,
+    jobs: int = 1,
+    force: bool = False,
+    chunk_size: int = 16,
+) -> SiteReport:
+    """Render the corpus as a static Markdown site.
+
+    Parameters
+    ----------
+    out_dir:
+        Site root directory.
+    jobs:
+        Number of worker processes used to render pages. ``1`` renders in
+        the current process.
+    force:
+        Ignore the manifest and render every page. Unchanged content is
+        still not rewritten.
+    chunk_size:
+        Pages per worker task.
+
+    Returns
+    -------
+    SiteReport
+        Written, unchanged, skipped and removed pages plus per-stage timings.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+
+    root = Path(out_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    report = SiteReport(out_dir=root)
+    total_start = time.perf_counter()
+
+    start = time.perf_counter()
+    corpus = load_export_corpus(with_dossiers=False)
+    inputs = _page_input_hashes(corpus, compute_input_hashes(corpus), _render_salt())
+    previous = _load_site_manifest(root)
+    report.timings["load"] = time.perf_counter() - start
+
+    pages: Dict[str, Dict[str, Optional[str]]] = {}
+    stale: List[str] = []
+    for rel_path, input_hash in inputs.items():
+        old = previous.get(rel_path) or {}
+        if not force and old.get("input") == input_hash and (root / rel_path).is_file():
+            pages[rel_path] = {"input": input_hash, "content": old.get("content")}
+            report.skipped.append(rel_path)
+        else:
+            stale.append(rel_path)
+
+    start = time.perf_counter()
+    stale_set = set(stale)
+    builders = [
+        ("characters", [c.id for c in corpus.characters], dossiers.build_character_dossier),
+        ("events", [e.id for e in corpus.events], dossiers.build_event_dossier),
+    ]
+    tasks: List[_PageTask] = []
+    for folder, entity_ids, build in builders:
+        for entity_id in entity_ids:
+            rel_path = f"{folder}/{entity_id}.md"
+            if rel_path in stale_set:
+                old_content = (previous.get(rel_path) or {}).get("content")
+                tasks.append((rel_path, build(entity_id), old_content))
+    report.timings["dossiers"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), max(chunk_size, 1))]
+    if jobs == 1 or len(chunks) <= 1:
+        rendered = [result for chunk in chunks for result in _render_chunk(str(root), chunk)]
+    else:
+        initargs = (
+            get_default_config(),
+            HookRegistry._enabled,
+            list(PluginManager._plugin_dirs),
+            [p.name for p in PluginManager.list_loaded_plugins()],
+        )
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)), initializer=_init_worker, initargs=initargs
+        ) as pool:
+            futures = [pool.submit(_render_chunk, str(root), chunk) for chunk in chunks]
+            rendered = [result for future in futures for result in future.result()]
+    for rel_path, digest, written in rendered:
+        pages[rel_path] = {"input": inputs[rel_path], "content": digest}
+        (report.written if written else report.unchanged).append(rel_path)
+    report.timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for rel_path, text in _render_index_pages(corpus).items():
+        old_content = (previous.get(rel_path) or {}).get("content")
+        digest, written = _write_if_changed(root, rel_path, text, old_content)
+        pages[rel_path] = {"input": None, "content": digest}
+        (report.written if written else report.unchanged).append(rel_path)
+
+    for rel_path in previous:
+        if rel_path not in pages:
+            (root / rel_path).unlink(missing_ok=True)
+            report.removed.append(rel_path)
+
+    write_atomic(
+        root / SITE_MANIFEST_NAME,
+        json.dumps(
+            {"version": SITE_MANIFEST_VERSION, "pages": dict(sorted(pages.items()))},
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+    report.timings["index"] = time.perf_counter() - start
+    report.timings["total"] = time.perf_counter() - total_start
+    return report
@@ -0,0 +1,363 @@
+"""Normalized relational export to SQLite.
+
+Unlike the CSV exporters, which flatten each entity to one summary row, this
+writes every trait, reference, variant, relationship, attestation, account,
+participant and parallel to its own indexed table so the corpus can be
+queried with plain SQL.
+
+All rows are collected first and inserted with ``executemany`` inside a
+single transaction; indexes are created after the bulk load. The database is
+built next to ``output_path`` and moved into place once complete.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import sources, storage
+from .models import Character, Event
+
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE sources (
+    id TEXT PRIMARY KEY,
+    date_range TEXT,
+    provenance TEXT,
+    audience TEXT
+);
+CREATE TABLE source_dependencies (
+    source_id TEXT NOT NULL REFERENCES sources(id),
+    depends_on TEXT NOT NULL
+);
+
+CREATE TABLE characters (id TEXT PRIMARY KEY, canonical_name TEXT NOT NULL);
+CREATE TABLE character_aliases (
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    position INTEGER NOT NULL,
+    alias TEXT NOT NULL
+);
+CREATE TABLE character_roles (
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE TABLE character_tags (
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    tag TEXT NOT NULL
+);
+CREATE TABLE character_citations (
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    citation TEXT NOT NULL
+);
+
+CREATE TABLE profiles (
+    id INTEGER PRIMARY KEY,
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    source_id TEXT NOT NULL REFERENCES sources(id),
+    position INTEGER NOT NULL
+);
+CREATE TABLE traits (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    trait TEXT NOT NULL,
+    value TEXT,
+    note TEXT
+);
+CREATE TABLE structured_traits (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    trait TEXT NOT NULL,
+    value_json TEXT
+);
+CREATE TABLE profile_references (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    position INTEGER NOT NULL,
+    reference TEXT NOT NULL
+);
+CREATE TABLE profile_citations (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    citation TEXT NOT NULL
+);
+CREATE TABLE profile_variants (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    manuscript_family TEXT NOT NULL,
+    reading TEXT NOT NULL,
+    significance TEXT NOT NULL
+);
+
+CREATE TABLE relationships (
+    id INTEGER PRIMARY KEY,
+    character_id TEXT NOT NULL REFERENCES characters(id),
+    target_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    strength REAL,
+    notes TEXT,
+    description TEXT
+);
+CREATE TABLE relationship_attestations (
+    id INTEGER PRIMARY KEY,
+    relationship_id INTEGER NOT NULL REFERENCES relationships(id),
+    source_id TEXT NOT NULL REFERENCES sources(id)
+);
+CREATE TABLE attestation_references (
+    attestation_id INTEGER NOT NULL REFERENCES relationship_attestations(id),
+    reference TEXT NOT NULL
+);
+
+CREATE TABLE events (id TEXT PRIMARY KEY, label TEXT NOT NULL);
+CREATE TABLE event_participants (
+    event_id TEXT NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    character_id TEXT NOT NULL
+);
+CREATE TABLE event_tags (
+    event_id TEXT NOT NULL REFERENCES events(id),
+    tag TEXT NOT NULL
+);
+CREATE TABLE event_citations (
+    event_id TEXT NOT NULL REFERENCES events(id),
+    citation TEXT NOT NULL
+);
+CREATE TABLE event_textual_variants (
+    event_id TEXT NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    data_json TEXT NOT NULL
+);
+CREATE TABLE accounts (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL REFERENCES events(id),
+    source_id TEXT NOT NULL REFERENCES sources(id),
+    position INTEGER NOT NULL,
+    reference TEXT,
+    summary TEXT,
+    notes TEXT
+);
+CREATE TABLE account_variants (
+    account_id INTEGER NOT NULL REFERENCES accounts(id),
+    manuscript_family TEXT NOT NULL,
+    reading TEXT NOT NULL,
+    significance TEXT NOT NULL
+);
+CREATE TABLE parallels (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    relationship TEXT
+);
+CREATE TABLE parallel_sources (
+    parallel_id INTEGER NOT NULL REFERENCES parallels(id),
+    source_id TEXT NOT NULL REFERENCES sources(id),
+    reference TEXT
+);
+"""
+
+_INDEXES = """
+CREATE INDEX idx_character_aliases_alias ON character_aliases(alias);
+CREATE INDEX idx_character_aliases_character ON character_aliases(character_id);
+CREATE INDEX idx_character_roles_character ON character_roles(character_id);
+CREATE INDEX idx_character_tags_tag ON character_tags(tag);
+CREATE INDEX idx_character_tags_character ON character_tags(character_id);
+CREATE INDEX idx_profiles_character ON profiles(character_id);
+CREATE INDEX idx_profiles_source ON profiles(source_id);
+CREATE INDEX idx_traits_profile ON traits(profile_id);
+CREATE INDEX idx_traits_trait ON traits(trait);
+CREATE INDEX idx_structured_traits_profile ON structured_traits(profile_id);
+CREATE INDEX idx_profile_references_profile ON profile_references(profile_id);
+CREATE INDEX idx_profile_variants_profile ON profile_variants(profile_id);
+CREATE INDEX idx_relationships_character ON relationships(character_id);
+CREATE INDEX idx_relationships_target ON relationships(target_id);
+CREATE INDEX idx_relationships_type ON relationships(type);
+CREATE INDEX idx_relationship_attestations_relationship ON relationship_attestations(relationship_id);
+CREATE INDEX idx_relationship_attestations_source ON relationship_attestations(source_id);
+CREATE INDEX idx_attestation_references_attestation ON attestation_references(attestation_id);
+CREATE INDEX idx_event_participants_event ON event_participants(event_id);
+CREATE INDEX idx_event_participants_character ON event_participants(character_id);
+CREATE INDEX idx_event_tags_tag ON event_tags(tag);
+CREATE INDEX idx_accounts_event ON accounts(event_id);
+CREATE INDEX idx_accounts_source ON accounts(source_id);
+CREATE INDEX idx_account_variants_account ON account_variants(account_id);
+CREATE INDEX idx_parallels_event ON parallels(event_id);
+CREATE INDEX idx_parallel_sources_parallel ON parallel_sources(parallel_id);
+CREATE INDEX idx_parallel_sources_source ON parallel_sources(source_id);
+CREATE INDEX idx_source_dependencies_source ON source_dependencies(source_id);
+
+CREATE VIEW trait_values AS
+    SELECT p.character_id, p.source_id, t.trait, t.value, t.note
+    FROM traits t JOIN profiles p ON p.id = t.profile_id;
+"""
+
+
+Rows = Dict[str, List[Tuple[Any, ...]]]
+
+
+def _collect_character_rows(characters: Iterable[Character], rows: Rows, seen_sources: Dict[str, None]) -> None:
+    profile_id = 0
+    relationship_id = 0
+    attestation_id = 0
+    for character in characters:
+        rows["characters"].append((character.id, character.canonical_name))
+        rows["character_aliases"].extend((character.id, i, a) for i, a in enumerate(character.aliases))
+        rows["character_roles"].extend((character.id, i, r) for i, r in enumerate(character.roles))
+        rows["character_tags"].extend((character.id, tag) for tag in character.tags)
+        rows["character_citations"].extend((character.id, c) for c in character.citations)
+
+        for position, profile in enumerate(character.source_profiles):
+            profile_id += 1
+            seen_sources.setdefault(profile.source_id)
+            rows["profiles"].append((profile_id, character.id, profile.source_id, position))
+            trait_names = dict.fromkeys([*profile.traits, *profile.trait_notes])
+            rows["traits"].extend(
+                (profile_id, trait, profile.traits.get(trait), profile.trait_notes.get(trait))
+                for trait in trait_names
+            )
+            rows["structured_traits"].extend(
+                (profile_id, trait, json.dumps(value, sort_keys=True, default=str))
+                for trait, value in profile.structured_traits.items()
+            )
+            rows["profile_references"].extend(
+                (profile_id, i, ref) for i, ref in enumerate(profile.references)
+            )
+            rows["profile_citations"].extend((profile_id, c) for c in profile.citations)
+            rows["profile_variants"].extend(
+                (profile_id, v.manuscript_family, v.reading, v.significance) for v in profile.variants
+            )
+
+        for rel in character.relationships:
+            relationship_id += 1
+            rows["relationships"].append(
+                (
+                    relationship_id,
+                    character.id,
+                    rel.target_id,
+                    rel.type,
+                    rel.strength,
+                    rel.notes,
+                    rel.description,
+                )
+            )
+            for att in rel.attestation:
+                attestation_id += 1
+                seen_sources.setdefault(att.source_id)
+                rows["relationship_attestations"].append((attestation_id, relationship_id, att.source_id))
+                rows["attestation_references"].extend((attestation_id, ref) for ref in att.references)
+
+
+def _collect_event_rows(events: Iterable[Event], rows: Rows, seen_sources: Dict[str, None]) -> None:
+    account_id = 0
+    parallel_id = 0
+    for event in events:
+        rows["events"].append((event.id, event.label))
+        rows["event_participants"].extend((event.id, i, p) for i, p in enumerate(event.participants))
+        rows["event_tags"].extend((event.id, tag) for tag in event.tags)
+        rows["event_citations"].extend((event.id, c) for c in event.citations)
+        rows["event_textual_variants"].extend(
+            (event.id, i, json.dumps(v, sort_keys=True, default=str))
+            for i, v in enumerate(event.textual_variants)
+        )
+
+        for position, account in enumerate(event.accounts):
+            account_id += 1
+            seen_sources.setdefault(account.source_id)
+            rows["accounts"].append(
+                (
+                    account_id,
+                    event.id,
+                    account.source_id,
+                    position,
+                    account.reference,
+                    account.summary,
+                    account.notes,
+                )
+            )
+            rows["account_variants"].extend(
+                (account_id, v.manuscript_family, v.reading, v.significance) for v in account.variants
+            )
+
+        for position, parallel in enumerate(event.parallels):
+            if not isinstance(parallel, dict):
+                continue
+            parallel_id += 1
+            references = parallel.get("references") or {}
+            rows["parallels"].append((parallel_id, event.id, position, parallel.get("relationship")))
+            for source_id in parallel.get("sources") or []:
+                seen_sources.setdefault(source_id)
+                rows["parallel_sources"].append((parallel_id, source_id, references.get(source_id)))
+
+
+def _collect_source_rows(rows: Rows, seen_sources: Dict[str, None]) -> None:
+    raw_sources = sources._read_sources_raw()
+    for source_id in sorted(set(raw_sources) | set(seen_sources)):
+        raw = raw_sources.get(source_id)
+        raw = raw if isinstance(raw, dict) else {}
+        rows["sources"].append(
+            (source_id, raw.get("date_range"), raw.get("provenance"), raw.get("audience"))
+        )
+        depends_on = raw.get("depends_on")
+        if isinstance(depends_on, list):
+            rows["source_dependencies"].extend((source_id, str(dep)) for dep in depends_on)
+
+
+def _table_names() -> List[str]:
+    return [
+        line.split()[2]
+        for line in _SCHEMA.splitlines()
+        if line.startswith("CREATE TABLE ")
+    ]
+
+
+def export_sqlite(
+    output_path: str,
+    characters: Optional[Iterable[Character]] = None,
+    events: Optional[Iterable[Event]] = None,
+) -> Dict[str, int]:
+    """Write the corpus to a normalized, indexed SQLite database.
+
+    Parameters
+    ----------
+    output_path:
+        Database file to create. An existing file is replaced.
+    characters, events:
+        Optional preloaded entities; storage is read when omitted.
+
+    Returns
+    -------
+    dict
+        Row count per table.
+    """
+
+    rows: Rows = {name: [] for name in _table_names()}
+    seen_sources: Dict[str, None] = {}
+    _collect_character_rows(storage.iter_characters() if characters is None else characters, rows, seen_sources)
+    _collect_event_rows(storage.iter_events() if events is None else events, rows, seen_sources)
+    _collect_source_rows(rows, seen_sources)
+    rows["meta"] = [("schema_version", str(SCHEMA_VERSION))]
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        # The file is private until it is moved into place, so durability
+        # guarantees during the bulk load buy nothing.
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        with conn:
+            for table, table_rows in rows.items():
+                if table_rows:
+                    placeholders = ", ".join("?" * len(table_rows[0]))
+                    conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", table_rows)
+        conn.executescript(_INDEXES)
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+    return {table: len(table_rows) for table, table_rows in rows.items()}
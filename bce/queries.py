@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Optional
 
 from .cache import CacheRegistry
 from .models import Character, Event
@@ -35,10 +35,47 @@ def get_event(event_id: str) -> Event:
     return storage.load_event(event_id)
 
 
+# Corpus-wide character_id -> canonical_name table, built lazily and dropped
+# together with the entity caches above.
+_character_names: Optional[Dict[str, str]] = None
+
+
+def _get_character_names() -> Dict[str, str]:
+    global _character_names
+    if _character_names is None:
+        names: Dict[str, str] = {}
+        for char_id in storage.list_character_ids():
+            try:
+                names[char_id] = get_character(char_id).canonical_name
+            except Exception:
+                continue
+        _character_names = names
+    return _character_names
+
+
+def character_display_names() -> Dict[str, str]:
+    """Return a mapping of character ID to canonical name for the corpus.
+
+    The table is built in a single pass the first time it is needed and is
+    invalidated together with the character/event caches, so relationship
+    enrichment, graph labels and exporters can resolve names with a dict
+    lookup instead of loading each related character. Characters that fail
+    to load are omitted.
+    """
+    return dict(_get_character_names())
+
+
+def get_character_display_name(char_id: str) -> str:
+    """Return the canonical name for ``char_id``, falling back to the ID."""
+    return _get_character_names().get(char_id, char_id)
+
+
 def clear_cache() -> None:
-    """Clear the cached character/event loads."""
+    """Clear the cached character/event loads and the display-name table."""
+    global _character_names
     get_character.cache_clear()
     get_event.cache_clear()
+    _character_names = None
 
 
 # Register cache invalidator with CacheRegistry
@@ -0,0 +1,410 @@
+"""Scripture reference parsing.
+
+Book names and abbreviations come from the bundled Bible SuperSearch tables
+(``data/bibles/Extras/books_*.json``) in every language, compiled once into
+a single hash map from normalized name to canonical book id (1-66). Named
+book ranges such as "Gospels" or "Pauline Epistles" come from
+``shortcuts_en.json``.
+
+``parse_references`` understands the forms used across the corpus::
+
+    Mark 16:1-8           John 3:16          Mark 14:66-15:5
+    Matthew 5-7           Matthew 23         Philemon 24
+    Mark 14:10-11, 43-50  John 18:28-40; 19:1-16
+    1 Cor 15:3-8          Mk 1.9             Marcos 1:9
+
+Results are memoized, so parsing every reference in the corpus costs one
+regex match and one dict lookup per distinct string.
+
+``max_verse`` answers verse bounds from a versification table generated
+from the bundled translations (``data/versification.json``, rebuilt with
+``scripts/build_versification.py``) and held as one byte per chapter, so
+bounds checks never load verse text.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from array import array
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_EXTRAS_DIR = Path(__file__).resolve().parent / "data" / "bibles" / "Extras"
+_VERSIFICATION_PATH = Path(__file__).resolve().parent / "data" / "versification.json"
+_PRIMARY_LANGUAGE = "en"
+
+# Chapters per book in canonical (Protestant) order, ids 1-66.
+_CHAPTER_COUNTS: Tuple[int, ...] = (
+    50, 40, 27, 36, 34, 24, 21, 4, 31, 24, 22, 25, 29, 36, 10, 13, 10, 42, 150,
+    31, 12, 8, 66, 52, 5, 48, 12, 14, 3, 9, 1, 4, 7, 3, 3, 3, 2, 14, 4,
+    28, 16, 24, 21, 28, 16, 16, 13, 6, 6, 4, 4, 5, 3, 6, 4, 3, 1, 13, 5,
+    5, 3, 5, 1, 1, 1, 22,
+)
+# Index of each book's first chapter in the flat versification array.
+_CHAPTER_OFFSETS: Tuple[int, ...] = tuple(
+    sum(_CHAPTER_COUNTS[:index]) for index in range(len(_CHAPTER_COUNTS) + 1)
+)
+
+# Words that join the following token in the Extras "matching" lists
+# ("1 Sm", "III John", "First Samuel").
+_ORDINAL_PREFIXES = {"1", "2", "3", "i", "ii", "iii", "1st", "2nd", "3rd", "first", "second", "third"}
+
+_DASHES = "-‐‑‒–—―"
+_REF_RE = re.compile(
+    r"^\s*(?P<book>(?:[1-3]|i{1,3})?\s*[^\d:;,.\s][^\d:;,]*?)\.?\s*(?P<rest>\d[\d\s:.,;" + re.escape(_DASHES) + r"]*)$",
+    re.IGNORECASE,
+)
+_SEGMENT_RE = re.compile(
+    r"^(?P<c1>\d+)(?:[:.](?P<v1>\d+))?"
+    r"(?:[" + re.escape(_DASHES) + r"](?P<c2>\d+)(?:[:.](?P<v2>\d+))?)?$"
+)
+
+
+def normalize_book_key(name: str) -> str:
+    """Lowercase, strip accents and drop everything but letters and digits."""
+
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    return "".join(ch for ch in decomposed if ch.isalnum() and not unicodedata.combining(ch))
+
+
+@dataclass(frozen=True, slots=True)
+class BookInfo:
+    """A canonical book: id (1-66), English name and chapter count."""
+
+    id: int
+    name: str
+    chapters: int
+
+    @property
+    def single_chapter(self) -> bool:
+        return self.chapters == 1
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptureReference:
+    """One contiguous span of scripture.
+
+    ``verse_start``/``verse_end`` are None for whole-chapter references
+    ("Matthew 5-7"). ``end_chapter`` differs from ``chapter`` only for
+    spans such as "Mark 14:66-15:5".
+    """
+
+    book_id: int
+    book: str
+    chapter: int
+    verse_start: Optional[int]
+    end_chapter: int
+    verse_end: Optional[int]
+
+    @property
+    def start(self) -> Tuple[int, int]:
+        return (self.chapter, self.verse_start or 0)
+
+    @property
+    def end(self) -> Tuple[int, int]:
+        # Whole chapters run to the end of the chapter, whatever its length.
+        return (self.end_chapter, self.verse_end if self.verse_end is not None else 10**6)
+
+    def overlaps(self, other: "ScriptureReference") -> bool:
+        """True if both spans share at least one verse of the same book."""
+
+        return (
+            self.book_id == other.book_id
+            and self.start <= other.end
+            and other.start <= self.end
+        )
+
+    def __str__(self) -> str:
+        if self.verse_start is None:
+            if self.end_chapter != self.chapter:
+                return f"{self.book} {self.chapter}-{self.end_chapter}"
+            return f"{self.book} {self.chapter}"
+        text = f"{self.book} {self.chapter}:{self.verse_start}"
+        if self.end_chapter != self.chapter:
+            return f"{text}-{self.end_chapter}:{self.verse_end}"
+        if self.verse_end != self.verse_start:
+            return f"{text}-{self.verse_end}"
+        return text
+
+
+class ReferenceParseError(ValueError):
+    """Raised by ``parse_reference_strict`` for unparseable references.
+
+    ``book`` is the title-cased book text when the format was recognized
+    but the book was not.
+    """
+
+    def __init__(self, message: str, book: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.book = book
+
+
+def _variants(field: Optional[str], split: bool) -> List[str]:
+    if not field:
+        return []
+    if not split:
+        return [field]
+    tokens = field.split()
+    if any(token[0].islower() for token in tokens):
+        # "Song of Songs", "Canticle of Canticles": one multi-word name.
+        return [field]
+    variants: List[str] = []
+    pending = ""
+    for token in tokens:
+        if pending:
+            variants.append(f"{pending} {token}")
+            pending = ""
+        elif token.lower() in _ORDINAL_PREFIXES:
+            pending = token
+        else:
+            variants.append(token)
+    if pending:
+        variants.append(pending)
+    return variants
+
+
+@lru_cache(maxsize=1)
+def _tables() -> Tuple[Dict[int, BookInfo], Dict[str, int], Dict[str, Tuple[int, ...]]]:
+    """Compile the Extras tables into (books by id, name key -> id, shortcut key -> ids)."""
+
+    files = sorted(_EXTRAS_DIR.glob("books_*.json"))
+    primary = _EXTRAS_DIR / f"books_{_PRIMARY_LANGUAGE}.json"
+    if primary in files:
+        files.remove(primary)
+        files.insert(0, primary)
+
+    books: Dict[int, BookInfo] = {}
+    keys: Dict[str, int] = {}
+    for path in files:
+        with path.open("r", encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            book_id = int(entry["id"])
+            if not 1 <= book_id <= len(_CHAPTER_COUNTS):
+                continue
+            if path == primary:
+                books[book_id] = BookInfo(book_id, entry["name"], _CHAPTER_COUNTS[book_id - 1])
+            names = _variants(entry.get("name"), False) + _variants(entry.get("shortname"), False)
+            names += _variants(entry.get("matching1"), True) + _variants(entry.get("matching2"), True)
+            for name in names:
+                key = normalize_book_key(name)
+                # Earlier (English) tables win on collisions.
+                if key and not key.isdigit():
+                    keys.setdefault(key, book_id)
+
+    shortcuts: Dict[str, Tuple[int, ...]] = {}
+    shortcuts_path = _EXTRAS_DIR / f"shortcuts_{_PRIMARY_LANGUAGE}.json"
+    if shortcuts_path.exists():
+        with shortcuts_path.open("r", encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            span = entry.get("reference") or ""
+            if " - " not in span:
+                continue
+            first, last = (keys.get(normalize_book_key(part)) for part in span.split(" - ", 1))
+            if first is None or last is None:
+                continue
+            ids = tuple(range(first, last + 1))
+            for name in (entry.get(field) for field in ("name", "short1", "short2", "short3")):
+                if name:
+                    shortcuts.setdefault(normalize_book_key(name), ids)
+    return books, keys, shortcuts
+
+
+def all_books() -> List[BookInfo]:
+    """Return the 66 canonical books in order."""
+
+    books, _, _ = _tables()
+    return [books[book_id] for book_id in sorted(books)]
+
+
+def get_book(book_id: int) -> Optional[BookInfo]:
+    books, _, _ = _tables()
+    return books.get(book_id)
+
+
+@lru_cache(maxsize=4096)
+def lookup_book(name: str) -> Optional[BookInfo]:
+    """Resolve a book name or abbreviation in any bundled language.
+
+    Falls back to an unambiguous prefix of an English book name
+    ("Philipp" -> Philippians), at least three characters long.
+    """
+
+    books, keys, _ = _tables()
+    key = normalize_book_key(name)
+    book_id = keys.get(key)
+    if book_id is None and len(key) >= 3:
+        matches = {
+            info.id for info in books.values() if normalize_book_key(info.name).startswith(key)
+        }
+        if len(matches) == 1:
+            book_id = matches.pop()
+    return books.get(book_id) if book_id is not None else None
+
+
+def expand_shortcut(name: str) -> List[BookInfo]:
+    """Return the books in a named range ("Gospels", "Pauline Epistles", "NT")."""
+
+    books, _, shortcuts = _tables()
+    return [books[book_id] for book_id in shortcuts.get(normalize_book_key(name), ())]
+
+
+def _title_case(raw: str) -> str:
+    parts = []
+    for part in raw.split():
+        parts.append(part if part[0].isdigit() else part[0].upper() + part[1:].lower())
+    return " ".join(parts)
+
+
+def _parse_segments(book: BookInfo, rest: str) -> Tuple[ScriptureReference, ...]:
+    refs: List[ScriptureReference] = []
+    chapter: Optional[int] = None
+    for group in rest.split(";"):
+        # After ";" a bare number is a chapter again; after "," it is a verse.
+        in_verses = False
+        for piece in group.split(","):
+            segment = re.sub(r"\s+", "", piece)
+            if not segment:
+                raise ReferenceParseError("Unrecognized reference format")
+            match = _SEGMENT_RE.match(segment)
+            if match is None:
+                raise ReferenceParseError("Unrecognized reference format")
+            c1, v1, c2, v2 = (
+                int(value) if value is not None else None
+                for value in match.group("c1", "v1", "c2", "v2")
+            )
+            if v1 is None and in_verses and chapter is not None:
+                # "Mark 14:10-11, 43-50": verses continuing chapter 14.
+                if v2 is not None:
+                    refs.append(ScriptureReference(book.id, book.name, chapter, c1, c2, v2))
+                    chapter = c2
+                else:
+                    refs.append(ScriptureReference(book.id, book.name, chapter, c1, chapter, c2 if c2 is not None else c1))
+                continue
+            if v1 is None and book.single_chapter:
+                # "Philemon 24" / "Jude 3-5": verses of the only chapter.
+                refs.append(ScriptureReference(book.id, book.name, 1, c1, 1, c2 if c2 is not None else c1))
+                in_verses, chapter = True, 1
+                continue
+            if v1 is None:
+                # Whole chapters: "Matthew 23", "Matthew 5-7".
+                if v2 is not None:
+                    raise ReferenceParseError("Unrecognized reference format")
+                refs.append(ScriptureReference(book.id, book.name, c1, None, c2 if c2 is not None else c1, None))
+                chapter = c2 if c2 is not None else c1
+                continue
+            if c2 is None:
+                refs.append(ScriptureReference(book.id, book.name, c1, v1, c1, v1))
+                chapter = c1
+            elif v2 is None:
+                # "16:1-8": the number after the dash is a verse.
+                refs.append(ScriptureReference(book.id, book.name, c1, v1, c1, c2))
+                chapter = c1
+            else:
+                refs.append(ScriptureReference(book.id, book.name, c1, v1, c2, v2))
+                chapter = c2
+            in_verses = True
+    return tuple(refs)
+
+
+@lru_cache(maxsize=8192)
+def parse_reference_strict(text: str) -> Tuple[ScriptureReference, ...]:
+    """Parse ``text`` into one or more references or raise ``ReferenceParseError``."""
+
+    match = _REF_RE.match(text)
+    if match is None:
+        raise ReferenceParseError("Unrecognized reference format")
+    raw_book = " ".join(match.group("book").split())
+    book = lookup_book(raw_book)
+    if book is None:
+        raise ReferenceParseError(f"Unknown book '{_title_case(raw_book)}'", book=_title_case(raw_book))
+    return _parse_segments(book, match.group("rest").strip().rstrip(".,;"))
+
+
+def parse_references(text: str) -> Tuple[ScriptureReference, ...]:
+    """Parse ``text`` into references; returns an empty tuple if it is not one."""
+
+    try:
+        return parse_reference_strict(text)
+    except ReferenceParseError:
+        return ()
+
+
+def parse_reference(text: str) -> Optional[ScriptureReference]:
+    """Return the first reference in ``text``, or None if it does not parse."""
+
+    refs = parse_references(text)
+    return refs[0] if refs else None
+
+
+def build_versification(translations: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Derive max verse per chapter from compiled Bible translations.
+
+    Uses the book tables of the compiled stores, so no verse text is read.
+    Where translations disagree (e.g. 3 John 14/15) the larger count wins,
+    so valid references in any of them pass. Books none of the translations
+    contain get an empty list and are left unchecked.
+    """
+
+    from . import bibles
+
+    codes = sorted(bibles.list_translations()) if translations is None else list(translations)
+    counts = [[0] * chapters for chapters in _CHAPTER_COUNTS]
+    for code in codes:
+        store = bibles._load_translation(code)
+        for book in store.books.values():
+            if not 1 <= book.number <= len(_CHAPTER_COUNTS):
+                continue
+            row = counts[book.number - 1]
+            for chapter, (_, last_verse) in book.chapters.items():
+                if 1 <= chapter <= len(row):
+                    row[chapter - 1] = max(row[chapter - 1], last_verse)
+    books = {}
+    for book_id, row in enumerate(counts, start=1):
+        books[str(book_id)] = row if all(row) else []
+    return {"translations": codes, "books": books}
+
+
+def write_versification(path: Optional[Path] = None, translations: Optional[List[str]] = None) -> Path:
+    """Regenerate the versification table file (default: the bundled one)."""
+
+    target = Path(path) if path is not None else _VERSIFICATION_PATH
+    table = build_versification(translations)
+    lines = [f'  "translations": {json.dumps(table["translations"])},', '  "books": {']
+    items = list(table["books"].items())
+    for index, (book_id, row) in enumerate(items):
+        comma = "," if index < len(items) - 1 else ""
+        lines.append(f'    "{book_id}": {json.dumps(row)}{comma}')
+    target.write_text("{\n" + "\n".join(lines) + "\n  }\n}\n", encoding="utf-8")
+    _versification.cache_clear()
+    return target
+
+
+@lru_cache(maxsize=1)
+def _versification() -> array:
+    """Load the table as one unsigned byte per chapter (0 = unknown)."""
+
+    table = array("B", bytes(_CHAPTER_OFFSETS[-1]))
+    if not _VERSIFICATION_PATH.exists():
+        return table
+    with _VERSIFICATION_PATH.open("r", encoding="utf-8") as f:
+        books = json.load(f).get("books", {})
+    for key, row in books.items():
+        book_id = int(key)
+        if 1 <= book_id <= len(_CHAPTER_COUNTS) and len(row) == _CHAPTER_COUNTS[book_id - 1]:
+            base = _CHAPTER_OFFSETS[book_id - 1]
+            table[base:base + len(row)] = array("B", row)
+    return table
+
+
+def max_verse(book_id: int, chapter: int) -> Optional[int]:
+    """Return the highest verse number of a chapter, or None if unknown."""
+
+    if not 1 <= book_id <= len(_CHAPTER_COUNTS) or not 1 <= chapter <= _CHAPTER_COUNTS[book_id - 1]:
+        return None
+    return _versification()[_CHAPTER_OFFSETS[book_id - 1] + chapter - 1] or None
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from . import queries
+from . import references
 from . import storage
 
 
@@ -30,13 +31,36 @@ def _contains(haystack: Optional[str], needle: str) -> bool:
     return needle in haystack.lower()
 
 
+def _reference_matches(
+    reference: Optional[str],
+    needle: str,
+    query_refs: Sequence[references.ScriptureReference],
+) -> bool:
+    """Substring match, or overlap when the query itself is a reference.
+
+    "Mk 15:25" matches "Mark 15:22-41"; "Mark 15" matches every reference
+    into that chapter.
+    """
+    if _contains(reference, needle):
+        return True
+    if not query_refs or not reference:
+        return False
+    return any(
+        span.overlaps(query_ref)
+        for span in references.parse_references(reference)
+        for query_ref in query_refs
+    )
+
+
 def search_all(query: str, scope: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """Search across characters and events for a simple text query.
 
     Parameters
     ----------
     query:
-        Text to search for (case-insensitive substring match).
+        Text to search for (case-insensitive substring match). A query that
+        parses as a scripture reference ("Mk 15:25", "Marcos 15") also
+        matches references whose verses overlap it.
     scope:
         Optional list of search domains. Supported values include:
 
@@ -63,6 +87,7 @@ def search_all(query: str, scope: Optional[List[str]] = None) -> List[Dict[str,
 
     scopes = set(scope or ["traits", "references", "accounts", "notes", "tags"])
     needle = query.lower()
+    query_refs = references.parse_references(query)
     results: List[Dict[str, Any]] = []
 
     # Character search
@@ -91,7 +116,7 @@ def search_all(query: str, scope: Optional[List[str]] = None) -> List[Dict[str,
                     for ref in getattr(profile, "references", []):
                         if not isinstance(ref, str):
                             continue
-                        if _contains(ref, needle):
+                        if _reference_matches(ref, needle, query_refs):
                             results.append(
                                 {
                                     "type": "character",
@@ -124,7 +149,7 @@ def search_all(query: str, scope: Optional[List[str]] = None) -> List[Dict[str,
 
                 if "accounts" in scopes:
                     summary = getattr(account, "summary", None)
-                    if _contains(summary, needle) or _contains(reference, needle):
+                    if _contains(summary, needle) or _reference_matches(reference, needle, query_refs):
                         results.append(
                             {
                                 "type": "event",
@@ -15,7 +15,7 @@ try:  # Lazy optional dependency load so CLI import works without web extras
     from fastapi import FastAPI, HTTPException, Query
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse
+    from fastapi.responses import FileResponse, Response
     import uvicorn
 
     FASTAPI_AVAILABLE = True
@@ -67,37 +67,9 @@ if FASTAPI_AVAILABLE:
 
     @app.get("/api/stats")
     async def get_stats() -> Dict[str, Any]:
-        """Get dashboard statistics."""
+        """Get dashboard statistics from the materialized corpus stats view."""
         try:
-            char_ids = api.list_character_ids()
-            event_ids = api.list_event_ids()
-
-            # Count total conflicts
-            total_conflicts = 0
-            for char_id in char_ids:
-                conflicts = api.summarize_character_conflicts(char_id)
-                total_conflicts += len(conflicts)
-
-            for event_id in event_ids:
-                conflicts = api.summarize_event_conflicts(event_id)
-                total_conflicts += len(conflicts)
-
-            # Get all tags
-            all_tags = set()
-            for char_id in char_ids:
-                char = api.get_character(char_id)
-                all_tags.update(char.tags)
-            for event_id in event_ids:
-                event = api.get_event(event_id)
-                all_tags.update(event.tags)
-
-            return {
-                "total_characters": len(char_ids),
-                "total_events": len(event_ids),
-                "total_conflicts": total_conflicts,
-                "total_tags": len(all_tags),
-                "tags": sorted(list(all_tags)),
-            }
+            return api.get_corpus_stats()
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -110,12 +82,19 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/api/characters/{char_id}")
-    async def get_character(char_id: str) -> Dict[str, Any]:
+    async def get_character(
+        char_id: str,
+        hydrate_text: Optional[str] = Query(
+            None, description="Translation code to include verse text for each reference"
+        ),
+    ) -> Dict[str, Any]:
         """Get character dossier by ID."""
         try:
-            return api.build_character_dossier(char_id)
+            return api.build_character_dossier(char_id, hydrate_text=hydrate_text)
         except exceptions.DataNotFoundError:
             raise HTTPException(status_code=404, detail=f"Character '{char_id}' not found")
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -241,30 +220,103 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/api/graph")
-    async def get_graph() -> Dict[str, Any]:
+    async def get_graph(
+        layout: bool = Query(True, description="Include precomputed x/y node properties"),
+    ) -> Response:
         """Get graph snapshot for network visualization."""
         try:
-            graph = api.build_graph_snapshot()
-            return {
-                "nodes": [
-                    {
-                        "id": node.id,
-                        "label": node.label,
-                        "type": node.type,
-                        "properties": node.properties,
-                    }
-                    for node in graph.nodes
-                ],
-                "edges": [
-                    {
-                        "source": edge.source,
-                        "target": edge.target,
-                        "type": edge.type,
-                        "properties": edge.properties,
-                    }
-                    for edge in graph.edges
-                ],
-            }
+            return Response(content=api.graph_payload_json(with_layout=layout), media_type="application/json")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/graph/neighborhood")
+    async def get_graph_neighborhood(
+        node_id: str = Query(..., description="Center node ID, e.g. character:jesus"),
+        hops: int = Query(1, ge=0, le=5, description="Maximum distance from the center"),
+        edge_types: Optional[str] = Query(None, description="Comma-separated edge types to follow"),
+        limit: Optional[int] = Query(None, ge=1, description="Maximum number of nodes"),
+        positions: bool = Query(False, description="Include precomputed node positions"),
+    ) -> Dict[str, Any]:
+        """Get the subgraph around one node for focused visualization."""
+        type_list = [t.strip() for t in edge_types.split(",") if t.strip()] if edge_types else None
+        try:
+            return api.graph_neighborhood(
+                node_id, hops=hops, edge_types=type_list, limit=limit, positions=positions
+            )
+        except exceptions.DataNotFoundError:
+            raise HTTPException(status_code=404, detail=f"Graph node '{node_id}' not found")
+        except ImportError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/graph/metrics")
+    async def get_graph_metrics(
+        metrics: Optional[str] = Query(
+            None, description="Comma-separated metrics: degree, pagerank, betweenness, eigenvector, communities"
+        ),
+        top: Optional[int] = Query(None, ge=1, description="Limit nodes returned per centrality"),
+        betweenness_k: Optional[int] = Query(None, ge=1, description="Sampled pivots for betweenness"),
+        seed: Optional[int] = Query(None, description="Random seed for sampling and communities"),
+        community_method: str = Query(
+            "greedy", description="Community method: greedy, label_propagation, louvain"
+        ),
+        time_budget: Optional[float] = Query(None, gt=0, description="Seconds allowed for communities"),
+    ) -> Dict[str, Any]:
+        """Get graph centralities and communities in one request."""
+        try:
+            return api.graph_metrics(
+                metrics=metrics,
+                top=top,
+                betweenness_k=betweenness_k,
+                seed=seed,
+                community_method=community_method,
+                time_budget=time_budget,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/analytics/source-disagreement")
+    async def get_source_disagreement(
+        by_claim_type: bool = Query(False, description="Include per-claim-type matrices"),
+        sources: Optional[str] = Query(None, description="Comma-separated source IDs"),
+        top: Optional[int] = Query(None, ge=1, description="Limit ranked source pairs"),
+    ) -> Dict[str, Any]:
+        """Get the source x source disagreement matrix for heatmaps."""
+        source_list = [s.strip() for s in sources.split(",") if s.strip()] if sources else None
+        try:
+            return api.source_disagreement_matrix(
+                by_claim_type=by_claim_type, sources=source_list, top=top
+            )
+        except ImportError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/bibles/search")
+    async def search_bible_verses(
+        q: str = Query(..., description="Words, \"exact phrase\" or \"proximity words\"~N"),
+        translation: str = Query("tyndale", description="Translation code"),
+        offset: int = Query(0, ge=0, description="Index of the first result"),
+        limit: int = Query(20, ge=1, le=200, description="Results per page"),
+    ) -> Dict[str, Any]:
+        """Search verse text, ranked and paginated."""
+        try:
+            return api.search_verses(q, translation=translation, offset=offset, limit=limit)
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/bibles/cache")
+    async def get_bible_cache_stats() -> Dict[str, Any]:
+        """Get Bible translation cache budget, usage and hit/miss metrics."""
+        try:
+            return api.get_bible_cache_stats()
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -314,6 +366,9 @@ if FASTAPI_AVAILABLE:
 def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
     """Run the FastAPI server."""
     _require_fastapi()
+    preloaded = api.preload_bible_translations()
+    if preloaded:
+        print(f"Preloaded Bible translations: {', '.join(preloaded)}")
     print(f"Starting BCE Web Server on http://{host}:{port}")
     print(f"Frontend directory: {FRONTEND_DIR}")
     print(f"API documentation: http://{host}:{port}/docs")
@@ -246,7 +246,7 @@ class StorageManager:
 
         path = self._char_dir / f"{character.id}.json"
         self._write_json(path, asdict(character))
-        CacheRegistry.invalidate_all()
+        CacheRegistry.invalidate_entity("character", character.id)
 
         # Hook: After Save
         HookRegistry.trigger(HookPoint.AFTER_CHARACTER_SAVE, data=character)
@@ -395,7 +395,7 @@ class StorageManager:
 
         path = self._event_dir / f"{event.id}.json"
         self._write_json(path, asdict(event))
-        CacheRegistry.invalidate_all()
+        CacheRegistry.invalidate_entity("event", event.id)
 
         # Hook: After Save
         HookRegistry.trigger(HookPoint.AFTER_EVENT_SAVE, data=event)
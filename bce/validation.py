@@ -1,33 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from . import queries
+from . import queries, references
 from .config import get_default_config
 from .exceptions import DataNotFoundError, StorageError, BceError
 from .models import STANDARD_TRAIT_KEYS, Relationship
 
 
-_REF_RE = re.compile(
-    r"^\s*(?P<book>(?:[1-3]\s+)?[A-Za-z]+(?:\s+[A-Za-z]+)*)\s+"  # book name
-    r"(?P<chapter>\d+):"  # chapter
-    r"(?P<verse_start>\d+)"  # verse start
-    r"(?:-(?P<verse_end>\d+))?\s*$"  # optional verse end
-)
-
-
-_BOOK_MAX_CHAPTER: Dict[str, int] = {
-    "Matthew": 28,
-    "Mark": 16,
-    "Luke": 24,
-    "John": 21,
-}
-
-_SUPPORTED_BOOKS_FOR_GLOBAL_VALIDATION = set(_BOOK_MAX_CHAPTER.keys())
 _PACKAGE_DATA_ROOT = Path(__file__).resolve().parent / "data"
 
 
@@ -39,6 +26,8 @@ class ValidationReport:
     warnings: List[str] = field(default_factory=list)
     skipped: bool = False
     reason: Optional[str] = None
+    # Seconds spent loading the corpus ("load") and in each rule, by rule name.
+    timings: Dict[str, float] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -55,23 +44,10 @@ class ValidationReport:
             "skipped": self.skipped,
             "reason": self.reason,
             "success": self.success,
+            "timings": dict(self.timings),
         }
 
 
-def _normalize_book_name(raw: str) -> str:
-    raw = " ".join(raw.split())
-    parts = raw.split(" ")
-    norm_parts = []
-    for part in parts:
-        if not part:
-            continue
-        if part[0].isdigit():
-            norm_parts.append(part)
-        else:
-            norm_parts.append(part[0].upper() + part[1:].lower())
-    return " ".join(norm_parts)
-
-
 def validate_reference(ref: str) -> Dict[str, Any]:
     """Validate a scripture reference string.
 
@@ -79,10 +55,19 @@ def validate_reference(ref: str) -> Dict[str, Any]:
 
     - ``valid`` (bool): overall validity flag.
     - ``error`` (str | None): human-readable error description, if any.
-    - ``book`` (str | None): normalized book name when parseable.
-    - ``chapter`` (int | None): chapter number when parseable.
-    - ``verse_start`` / ``verse_end`` (int | None): verse bounds when parseable.
-    - ``canonical`` (bool): True when the book is known in the internal table.
+    - ``book`` (str | None): canonical English book name (or the title-cased
+      text of an unknown book).
+    - ``book_id`` (int | None): canonical book number, 1-66.
+    - ``chapter`` / ``end_chapter`` (int | None): chapter span when parseable.
+    - ``verse_start`` / ``verse_end`` (int | None): verse bounds when parseable;
+      None for whole-chapter references such as "Matthew 5-7".
+    - ``canonical`` (bool): True when the book is a known canonical book.
+
+    Book names and abbreviations are resolved in any bundled language (see
+    ``bce.references``). For multi-part references ("Mark 14:10-11, 43-50")
+    the fields describe the first part and every part must be valid. Verse
+    numbers are checked against the bundled versification table for books
+    it covers.
     """
 
     ref = ref.strip()
@@ -90,7 +75,9 @@ def validate_reference(ref: str) -> Dict[str, Any]:
         "valid": False,
         "error": None,
         "book": None,
+        "book_id": None,
         "chapter": None,
+        "end_chapter": None,
         "verse_start": None,
         "verse_end": None,
         "canonical": False,
@@ -100,62 +87,58 @@ def validate_reference(ref: str) -> Dict[str, Any]:
         result["error"] = "Empty reference"
         return result
 
-    match = _REF_RE.match(ref)
-    if not match:
-        result["error"] = "Unrecognized reference format"
-        return result
-
-    book_raw = match.group("book")
-    chapter_str = match.group("chapter")
-    verse_start_str = match.group("verse_start")
-    verse_end_str = match.group("verse_end")
-
     try:
-        chapter = int(chapter_str)
-        verse_start = int(verse_start_str)
-        verse_end = int(verse_end_str) if verse_end_str is not None else verse_start
-    except ValueError:
-        result["error"] = "Non-numeric chapter or verse"
-        return result
-
-    book = _normalize_book_name(book_raw)
-    result["book"] = book
-    result["chapter"] = chapter
-    result["verse_start"] = verse_start
-    result["verse_end"] = verse_end
-
-    max_chapter = _BOOK_MAX_CHAPTER.get(book)
-    if max_chapter is None:
-        result["error"] = f"Unknown book '{book}'"
+        parsed = references.parse_reference_strict(ref)
+    except references.ReferenceParseError as exc:
+        result["book"] = exc.book
+        result["error"] = str(exc)
         return result
 
+    first = parsed[0]
+    book = references.get_book(first.book_id)
+    result["book"] = first.book
+    result["book_id"] = first.book_id
+    result["chapter"] = first.chapter
+    result["end_chapter"] = first.end_chapter
+    result["verse_start"] = first.verse_start
+    result["verse_end"] = first.verse_end
     result["canonical"] = True
 
-    if chapter < 1 or chapter > max_chapter:
-        result["error"] = f"Book '{book}' has only {max_chapter} chapters"
-        return result
-
-    if verse_start < 1 or verse_end < verse_start:
-        result["error"] = "Invalid verse range"
-        return result
+    for span in parsed:
+        if span.chapter < 1 or span.end_chapter > book.chapters:
+            result["error"] = f"Book '{book.name}' has only {book.chapters} chapters"
+            return result
+        if span.verse_start is None:
+            if span.end_chapter < span.chapter:
+                result["error"] = "Invalid chapter range"
+                return result
+        elif span.verse_start < 1 or span.end < span.start:
+            result["error"] = "Invalid verse range"
+            return result
+        else:
+            for chapter, verse in ((span.chapter, span.verse_start), (span.end_chapter, span.verse_end)):
+                last = references.max_verse(span.book_id, chapter)
+                if last is not None and verse is not None and verse > last:
+                    result["error"] = f"{book.name} {chapter} has only {last} verses"
+                    return result
 
-    # We intentionally do not validate upper bounds on verses per chapter yet.
     result["valid"] = True
     result["error"] = None
     return result
 
 
-def _validate_reference_in_context(ref: str, context: str, errors: List[str]) -> None:
+def _validate_reference_in_context(
+    ctx: "ValidationContext", ref: str, context: str, errors: List[str]
+) -> None:
     """Best-effort reference validation used by validate_all.
 
-    Only applies strict checks for a limited set of books to avoid breaking
-    existing free-form data. References that cannot be parsed or whose book
-    is not in the supported set are ignored here.
+    Only applies strict checks to references to canonical books, so free-form
+    citations of other works (1 Enoch, Qumran scrolls, rabbinic texts) in
+    existing data are ignored here.
     """
 
-    result = validate_reference(ref)
-    book = result.get("book")
-    if not isinstance(book, str) or book not in _SUPPORTED_BOOKS_FOR_GLOBAL_VALIDATION:
+    result = ctx.check_reference(ref)
+    if not result.get("canonical"):
         return
 
     if result.get("valid"):
@@ -165,213 +148,436 @@ def _validate_reference_in_context(ref: str, context: str, errors: List[str]) ->
     errors.append(f"{context} has invalid reference '{ref}': {error}")
 
 
-def validate_trait_keys(errors: List[str], warnings: List[str]) -> None:
-    """Validate trait keys against the standard vocabulary.
-
-    This function checks all trait keys in character source profiles against
-    the STANDARD_TRAIT_KEYS vocabulary. Non-standard keys generate warnings
-    but not errors, to allow flexibility while encouraging consistency.
-
-    Parameters:
-        errors: List to append error messages to (currently unused)
-        warnings: List to append warning messages to
-    """
-    # Skip noisy warnings for the bundled reference dataset so that baseline
-    # validation remains clean. Custom data roots (e.g., tests writing fixtures)
-    # will still receive warnings for non-standard keys.
+def _uses_bundled_data() -> bool:
     try:
         config = get_default_config()
-        if Path(config.data_root).resolve() == _PACKAGE_DATA_ROOT.resolve():
-            return
+        return Path(config.data_root).resolve() == _PACKAGE_DATA_ROOT.resolve()
     except Exception:
         # If configuration can't be inspected, proceed with validation.
-        pass
+        return False
 
-    for char_id in queries.list_character_ids():
-        try:
-            character = queries.get_character(char_id)
-        except Exception:
-            # Character loading errors are caught elsewhere
-            continue
-
-        for profile in getattr(character, "source_profiles", []):
-            source_id = getattr(profile, "source_id", "unknown")
-            traits = getattr(profile, "traits", {})
-
-            for trait_key in traits.keys():
-                if trait_key not in STANDARD_TRAIT_KEYS:
-                    warnings.append(
-                        f"Character '{char_id}' source '{source_id}': "
-                        f"non-standard trait key '{trait_key}' "
-                        f"(consider using standard vocabulary from models.STANDARD_TRAIT_KEYS)"
-                    )
 
+class ValidationContext:
+    """Corpus state shared by every validation rule in a run.
 
-def _validate_characters(errors: List[str]) -> None:
-    ids = queries.list_character_ids()
+    Characters and events are loaded once and indexed (ids, source sets per
+    character, participants per event); load failures are kept rather than
+    raised so each rule can report them. Rules only read from the context,
+    which is what lets them run concurrently.
+    """
 
-    # Detect duplicate IDs.
-    seen = set()
-    duplicates = set()
-    for char_id in ids:
-        if char_id in seen:
-            duplicates.add(char_id)
-        seen.add(char_id)
-    if duplicates:
-        joined = ", ".join(sorted(duplicates))
-        errors.append(f"Duplicate character IDs found: {joined}")
+    def __init__(self) -> None:
+        self.character_ids: List[str] = []
+        self.event_ids: List[str] = []
+        self.characters: Dict[str, Any] = {}
+        self.events: Dict[str, Any] = {}
+        self.character_load_errors: Dict[str, Exception] = {}
+        self.event_load_errors: Dict[str, Exception] = {}
+        self.character_id_set: Set[str] = set()
+        self.character_sources: Dict[str, Set[str]] = {}
+        self.event_participants: Dict[str, List[str]] = {}
+        self._reference_results: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, events: bool = True) -> "ValidationContext":
+        """Load every character and event through ``queries`` exactly once.
+
+        With ``events=False`` only characters are loaded, for rules that never
+        look at events; the event fields stay empty.
+        """
+
+        ctx = cls()
+        ctx.character_ids = list(queries.list_character_ids())
+        ctx.character_id_set = set(ctx.character_ids)
+        for char_id in dict.fromkeys(ctx.character_ids):
+            try:
+                character = queries.get_character(char_id)
+            except Exception as exc:
+                ctx.character_load_errors[char_id] = exc
+                continue
+            ctx.characters[char_id] = character
+            ctx.character_sources[char_id] = {
+                source_id
+                for source_id in (
+                    getattr(profile, "source_id", None)
+                    for profile in getattr(character, "source_profiles", [])
+                )
+                if isinstance(source_id, str) and source_id
+            }
+
+        if not events:
+            return ctx
+
+        ctx.event_ids = list(queries.list_event_ids())
+        for event_id in dict.fromkeys(ctx.event_ids):
+            try:
+                event = queries.get_event(event_id)
+            except Exception as exc:
+                ctx.event_load_errors[event_id] = exc
+                continue
+            ctx.events[event_id] = event
+            ctx.event_participants[event_id] = [
+                p for p in getattr(event, "participants", []) if isinstance(p, str)
+            ]
+        return ctx
+
+    def check_reference(self, ref: str) -> Dict[str, Any]:
+        """Return ``validate_reference(ref)``, computed once per distinct string."""
+
+        result = self._reference_results.get(ref)
+        if result is None:
+            result = validate_reference(ref)
+            self._reference_results[ref] = result
+        return result
 
-    # Build set of valid character IDs for cross-reference validation
-    valid_char_ids = set(ids)
 
-    # Validate that each character can be loaded and has a sane id field.
-    for char_id in ids:
-        try:
-            character = queries.get_character(char_id)
-        except Exception as exc:
-            errors.append(f"Failed to load character '{char_id}': {exc}")
-            continue
+class ValidationRule(ABC):
+    """A named check run by ``ValidationEngine``.
+
+    Subclasses set ``name`` and implement ``check``, appending messages to
+    ``errors``/``warnings``. They must not mutate the context.
+    """
+
+    name: str = "rule"
+
+    @abstractmethod
+    def check(self, ctx: ValidationContext, errors: List[str], warnings: List[str]) -> None:
+        """Append this rule's findings for ``ctx`` to ``errors``/``warnings``."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+def _duplicates(ids: List[str]) -> Set[str]:
+    seen: Set[str] = set()
+    duplicates: Set[str] = set()
+    for item in ids:
+        if item in seen:
+            duplicates.add(item)
+        seen.add(item)
+    return duplicates
+
+
+class CharacterRule(ValidationRule):
+    """Character ids, relationships and profile scripture references."""
 
-        obj_id = getattr(character, "id", None)
-        if not isinstance(obj_id, str) or not obj_id:
-            errors.append(f"Character '{char_id}' has an empty or invalid id field")
-        elif obj_id != char_id:
+    name = "characters"
+
+    def check(self, ctx: ValidationContext, errors: List[str], warnings: List[str]) -> None:
+        duplicates = _duplicates(ctx.character_ids)
+        if duplicates:
+            joined = ", ".join(sorted(duplicates))
+            errors.append(f"Duplicate character IDs found: {joined}")
+
+        for char_id in dict.fromkeys(ctx.character_ids):
+            if char_id in ctx.character_load_errors:
+                errors.append(f"Failed to load character '{char_id}': {ctx.character_load_errors[char_id]}")
+                continue
+            character = ctx.characters[char_id]
+
+            obj_id = getattr(character, "id", None)
+            if not isinstance(obj_id, str) or not obj_id:
+                errors.append(f"Character '{char_id}' has an empty or invalid id field")
+            elif obj_id != char_id:
+                errors.append(
+                    f"Character object id '{obj_id}' does not match key '{char_id}'"
+                )
+
+            for i, rel in enumerate(getattr(character, "relationships", []) or []):
+                self._check_relationship(ctx, char_id, i, rel, errors)
+
+            # Best-effort validation of scripture references in source profiles.
+            for profile in getattr(character, "source_profiles", []):
+                for ref in getattr(profile, "references", []):
+                    if not isinstance(ref, str):
+                        continue
+                    _validate_reference_in_context(
+                        ctx,
+                        ref,
+                        f"Character '{char_id}' profile '{getattr(profile, 'source_id', '?')}'",
+                        errors,
+                    )
+
+    @staticmethod
+    def _check_relationship(
+        ctx: ValidationContext, char_id: str, i: int, rel: Any, errors: List[str]
+    ) -> None:
+        is_dict_entry = False
+        target_id = ""
+        rel_type = ""
+        attestation = []
+        sources = None
+        rel_references = None
+
+        if isinstance(rel, Relationship):
+            target_id = getattr(rel, "target_id", "")
+            rel_type = getattr(rel, "type", "")
+            attestation = getattr(rel, "attestation", [])
+        elif isinstance(rel, dict):
+            is_dict_entry = True
+            target_id = (
+                rel.get("target_id")
+                or rel.get("character_id")
+                or rel.get("to")
+                or ""
+            )
+            rel_type = rel.get("type") or rel.get("relationship_type") or ""
+            sources = rel.get("sources")
+            rel_references = rel.get("references")
+        else:
             errors.append(
-                f"Character object id '{obj_id}' does not match key '{char_id}'"
+                f"Character '{char_id}': relationship at index {i} is not a dict"
             )
+            return
 
-        # Validate relationships
-        relationships = getattr(character, "relationships", [])
-        if relationships:
-            for i, rel in enumerate(relationships):
-                is_dict_entry = False
-                target_id = ""
-                rel_type = ""
-                attestation = []
-                sources = None
-                references = None
-
-                if isinstance(rel, Relationship):
-                    target_id = getattr(rel, "target_id", "")
-                    rel_type = getattr(rel, "type", "")
-                    attestation = getattr(rel, "attestation", [])
-                elif isinstance(rel, dict):
-                    is_dict_entry = True
-                    target_id = (
-                        rel.get("target_id")
-                        or rel.get("character_id")
-                        or rel.get("to")
-                        or ""
-                    )
-                    rel_type = rel.get("type") or rel.get("relationship_type") or ""
-                    sources = rel.get("sources")
-                    references = rel.get("references")
-                else:
-                    errors.append(
-                        f"Character '{char_id}': relationship at index {i} is not a dict"
-                    )
-                    continue
+        if not target_id:
+            errors.append(
+                f"Character '{char_id}': relationship at index {i} missing 'character_id'"
+            )
+            return
+        if target_id not in ctx.character_id_set:
+            errors.append(
+                f"Character '{char_id}': relationship references unknown character '{target_id}'"
+            )
 
-                if not target_id:
-                    errors.append(
-                        f"Character '{char_id}': relationship at index {i} missing 'character_id'"
-                    )
-                    continue
-                if target_id not in valid_char_ids:
-                    errors.append(
-                        f"Character '{char_id}': relationship references unknown character '{target_id}'"
-                    )
+        if not rel_type:
+            errors.append(
+                f"Character '{char_id}': relationship to '{target_id}' missing 'type' field"
+            )
 
-                if not rel_type:
-                    errors.append(
-                        f"Character '{char_id}': relationship to '{target_id}' missing 'type' field"
-                    )
+        if is_dict_entry:
+            if not isinstance(sources, list):
+                errors.append(
+                    f"Character '{char_id}': relationship to '{target_id}' missing 'sources' field"
+                )
+            if not isinstance(rel_references, list):
+                errors.append(
+                    f"Character '{char_id}': relationship to '{target_id}' missing 'references' field"
+                )
+            return
 
-                if is_dict_entry:
-                    if not isinstance(sources, list):
-                        errors.append(
-                            f"Character '{char_id}': relationship to '{target_id}' missing 'sources' field"
-                        )
-                    if not isinstance(references, list):
-                        errors.append(
-                            f"Character '{char_id}': relationship to '{target_id}' missing 'references' field"
-                        )
-                    continue
+        if not attestation:
+            errors.append(
+                f"Character '{char_id}': relationship to '{target_id}' missing attestation"
+            )
 
-                if not attestation:
-                    errors.append(
-                        f"Character '{char_id}': relationship to '{target_id}' missing attestation"
-                    )
 
-        # Best-effort validation of scripture references in source profiles.
-        for profile in getattr(character, "source_profiles", []):
-            for ref in getattr(profile, "references", []):
+class EventRule(ValidationRule):
+    """Event ids and account scripture references."""
+
+    name = "events"
+
+    def check(self, ctx: ValidationContext, errors: List[str], warnings: List[str]) -> None:
+        duplicates = _duplicates(ctx.event_ids)
+        if duplicates:
+            joined = ", ".join(sorted(duplicates))
+            errors.append(f"Duplicate event IDs found: {joined}")
+
+        for event_id in dict.fromkeys(ctx.event_ids):
+            if event_id in ctx.event_load_errors:
+                errors.append(f"Failed to load event '{event_id}': {ctx.event_load_errors[event_id]}")
+                continue
+            event = ctx.events[event_id]
+
+            obj_id = getattr(event, "id", None)
+            if not isinstance(obj_id, str) or not obj_id:
+                errors.append(f"Event '{event_id}' has an empty or invalid id field")
+            elif obj_id != event_id:
+                errors.append(
+                    f"Event object id '{obj_id}' does not match key '{event_id}'"
+                )
+
+            # Best-effort validation of scripture references in event accounts.
+            for account in getattr(event, "accounts", []):
+                ref = getattr(account, "reference", None)
                 if not isinstance(ref, str):
                     continue
                 _validate_reference_in_context(
+                    ctx,
                     ref,
-                    f"Character '{char_id}' profile '{getattr(profile, 'source_id', '?')}'",
+                    f"Event '{event_id}' account '{getattr(account, 'source_id', '?')}'",
                     errors,
                 )
 
 
-def _validate_events(errors: List[str]) -> None:
-    ids = queries.list_event_ids()
-
-    # Detect duplicate IDs.
-    seen = set()
-    duplicates = set()
-    for event_id in ids:
-        if event_id in seen:
-            duplicates.add(event_id)
-        seen.add(event_id)
-    if duplicates:
-        joined = ", ".join(sorted(duplicates))
-        errors.append(f"Duplicate event IDs found: {joined}")
+class CrossReferenceRule(ValidationRule):
+    """Event participants exist and each account's source is attested by one."""
 
-    # Validate that each event can be loaded and has a sane id field.
-    for event_id in ids:
-        try:
-            event = queries.get_event(event_id)
-        except Exception as exc:
-            errors.append(f"Failed to load event '{event_id}': {exc}")
-            continue
+    name = "cross_references"
 
-        obj_id = getattr(event, "id", None)
-        if not isinstance(obj_id, str) or not obj_id:
-            errors.append(f"Event '{event_id}' has an empty or invalid id field")
-        elif obj_id != event_id:
+    def check(self, ctx: ValidationContext, errors: List[str], warnings: List[str]) -> None:
+        for char_id, exc in ctx.character_load_errors.items():
             errors.append(
-                f"Event object id '{obj_id}' does not match key '{event_id}'"
+                f"Failed to load character '{char_id}' for cross-reference validation: {exc}"
             )
 
-        # Best-effort validation of scripture references in event accounts.
-        for account in getattr(event, "accounts", []):
-            ref = getattr(account, "reference", None)
-            if not isinstance(ref, str):
+        for event_id in dict.fromkeys(ctx.event_ids):
+            if event_id in ctx.event_load_errors:
+                errors.append(
+                    f"Failed to load event '{event_id}' for cross-reference validation: "
+                    f"{ctx.event_load_errors[event_id]}"
+                )
                 continue
-            _validate_reference_in_context(
-                ref,
-                f"Event '{event_id}' account '{getattr(account, 'source_id', '?')}'",
-                errors,
-            )
+            participants = ctx.event_participants[event_id]
 
+            # 1) Ensure all event participants exist as characters.
+            for participant_id in participants:
+                if participant_id not in ctx.character_id_set:
+                    errors.append(
+                        f"Event '{event_id}' participant '{participant_id}' not found in characters"
+                    )
 
-def _collect_validation_messages() -> ValidationReport:
-    """Execute validators and return a structured report."""
+            # 2) Ensure event accounts' sources are present in at least one
+            #    participant's source profiles. If there are no participants, skip
+            #    this check for the event.
+            if not participants:
+                continue
 
-    report = ValidationReport()
+            for account in getattr(ctx.events[event_id], "accounts", []):
+                source_id = getattr(account, "source_id", None)
+                if not isinstance(source_id, str) or not source_id:
+                    continue
 
-    _validate_characters(report.errors)
-    _validate_events(report.errors)
+                has_matching_profile = any(
+                    source_id in ctx.character_sources.get(participant_id, set())
+                    for participant_id in participants
+                )
 
-    cross_ref_errors = validate_cross_references()
-    if cross_ref_errors:
-        report.errors.extend(cross_ref_errors)
+                if not has_matching_profile:
+                    errors.append(
+                        f"Event '{event_id}' account from '{source_id}' has no participant "
+                        "with matching source profile"
+                    )
 
-    validate_trait_keys(report.errors, report.warnings)
 
-    return report
+class TraitKeyRule(ValidationRule):
+    """Warn about trait keys outside ``models.STANDARD_TRAIT_KEYS``."""
+
+    name = "trait_keys"
+
+    def check(self, ctx: ValidationContext, errors: List[str], warnings: List[str]) -> None:
+        # Skip noisy warnings for the bundled reference dataset so that baseline
+        # validation remains clean. Custom data roots (e.g., tests writing fixtures)
+        # will still receive warnings for non-standard keys.
+        if _uses_bundled_data():
+            return
+
+        for char_id, character in ctx.characters.items():
+            for profile in getattr(character, "source_profiles", []):
+                source_id = getattr(profile, "source_id", "unknown")
+                traits = getattr(profile, "traits", {})
+
+                for trait_key in traits.keys():
+                    if trait_key not in STANDARD_TRAIT_KEYS:
+                        warnings.append(
+                            f"Character '{char_id}' source '{source_id}': "
+                            f"non-standard trait key '{trait_key}' "
+                            f"(consider using standard vocabulary from models.STANDARD_TRAIT_KEYS)"
+                        )
+
+
+# Rules run by validate_all, in report order.
+_RULES: List[ValidationRule] = [CharacterRule(), EventRule(), CrossReferenceRule(), TraitKeyRule()]
+_RULES_LOCK = threading.Lock()
+
+
+def register_rule(rule: ValidationRule) -> None:
+    """Add a rule to every validation run, replacing one with the same name."""
+
+    with _RULES_LOCK:
+        for index, existing in enumerate(_RULES):
+            if existing.name == rule.name:
+                _RULES[index] = rule
+                return
+        _RULES.append(rule)
+
+
+def unregister_rule(name: str) -> None:
+    """Remove the rule called ``name``; unknown names are ignored."""
+
+    with _RULES_LOCK:
+        _RULES[:] = [rule for rule in _RULES if rule.name != name]
+
+
+def list_rules() -> List[ValidationRule]:
+    """Return the registered rules in execution/report order."""
+
+    with _RULES_LOCK:
+        return list(_RULES)
+
+
+class ValidationEngine:
+    """Load the corpus once and run rules over the shared context.
+
+    With ``workers`` > 1 rules run on a thread pool; their messages are
+    still reported in rule order. ``ValidationReport.timings`` records the
+    corpus load (``"load"``) and each rule, in seconds. A rule that raises
+    is reported as an error instead of aborting the run.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[List[ValidationRule]] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.rules = list_rules() if rules is None else list(rules)
+        if workers is None:
+            workers = getattr(get_default_config(), "validation_workers", 1)
+        self.workers = max(1, int(workers))
+
+    @staticmethod
+    def _run_rule(
+        rule: ValidationRule, ctx: ValidationContext
+    ) -> Tuple[List[str], List[str], float]:
+        errors: List[str] = []
+        warnings: List[str] = []
+        start = time.perf_counter()
+        try:
+            rule.check(ctx, errors, warnings)
+        except Exception as exc:
+            errors.append(f"Validation rule '{rule.name}' failed: {exc}")
+        return errors, warnings, time.perf_counter() - start
+
+    def run(self, ctx: Optional[ValidationContext] = None) -> ValidationReport:
+        report = ValidationReport()
+        if ctx is None:
+            start = time.perf_counter()
+            ctx = ValidationContext.load()
+            report.timings["load"] = time.perf_counter() - start
+
+        if self.workers > 1 and len(self.rules) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(self.rules))) as pool:
+                results = list(pool.map(lambda rule: self._run_rule(rule, ctx), self.rules))
+        else:
+            results = [self._run_rule(rule, ctx) for rule in self.rules]
+
+        for rule, (errors, warnings, elapsed) in zip(self.rules, results):
+            report.errors.extend(errors)
+            report.warnings.extend(warnings)
+            report.timings[rule.name] = elapsed
+        return report
+
+
+def validate_trait_keys(errors: List[str], warnings: List[str]) -> None:
+    """Validate trait keys against the standard vocabulary.
+
+    This function checks all trait keys in character source profiles against
+    the STANDARD_TRAIT_KEYS vocabulary. Non-standard keys generate warnings
+    but not errors, to allow flexibility while encouraging consistency.
+
+    Parameters:
+        errors: List to append error messages to (currently unused)
+        warnings: List to append warning messages to
+    """
+    if _uses_bundled_data():
+        return
+    TraitKeyRule().check(ValidationContext.load(events=False), errors, warnings)
+
+
+def _collect_validation_messages() -> ValidationReport:
+    """Execute validators and return a structured report."""
+
+    return ValidationEngine().run()
 
 
 def run_validation(force: bool | None = None) -> ValidationReport:
@@ -426,68 +632,5 @@ def validate_cross_references() -> List[str]:
     """
 
     errors: List[str] = []
-
-    # Build a mapping of character_id -> set(source_ids) from source_profiles.
-    character_ids = queries.list_character_ids()
-    character_id_set = set(character_ids)
-    character_sources: Dict[str, set[str]] = {}
-
-    for char_id in character_ids:
-        try:
-            character = queries.get_character(char_id)
-        except Exception as exc:
-            errors.append(
-                f"Failed to load character '{char_id}' for cross-reference validation: {exc}"
-            )
-            continue
-
-        sources_for_char: set[str] = set()
-        for profile in getattr(character, "source_profiles", []):
-            source_id = getattr(profile, "source_id", None)
-            if isinstance(source_id, str) and source_id:
-                sources_for_char.add(source_id)
-        character_sources[char_id] = sources_for_char
-
-    # Now walk events and check participants + their account sources.
-    for event_id in queries.list_event_ids():
-        try:
-            event = queries.get_event(event_id)
-        except Exception as exc:
-            errors.append(
-                f"Failed to load event '{event_id}' for cross-reference validation: {exc}"
-            )
-            continue
-
-        participants = [p for p in getattr(event, "participants", []) if isinstance(p, str)]
-
-        # 1) Ensure all event participants exist as characters.
-        for participant_id in participants:
-            if participant_id not in character_id_set:
-                errors.append(
-                    f"Event '{event_id}' participant '{participant_id}' not found in characters"
-                )
-
-        # 2) Ensure event accounts' sources are present in at least one
-        #    participant's source profiles. If there are no participants, skip
-        #    this check for the event.
-        if not participants:
-            continue
-
-        for account in getattr(event, "accounts", []):
-            source_id = getattr(account, "source_id", None)
-            if not isinstance(source_id, str) or not source_id:
-                continue
-
-            has_matching_profile = any(
-                source_id in character_sources.get(participant_id, set())
-                for participant_id in participants
-                if participant_id in character_sources
-            )
-
-            if not has_matching_profile:
-                errors.append(
-                    f"Event '{event_id}' account from '{source_id}' has no participant "
-                    "with matching source profile"
-                )
-
+    CrossReferenceRule().check(ValidationContext.load(), errors, [])
     return errors
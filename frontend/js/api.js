@@ -164,6 +164,17 @@ const API = {
         return this.fetch('/graph');
     },
 
+    /**
+     * Get the subgraph within `hops` edges of one node
+     */
+    async getGraphNeighborhood(nodeId, { hops = 1, edgeTypes = null, limit = null, positions = false } = {}) {
+        const params = new URLSearchParams({ node_id: nodeId, hops });
+        if (edgeTypes) params.append('edge_types', edgeTypes.join(','));
+        if (limit) params.append('limit', limit);
+        if (positions) params.append('positions', 'true');
+        return this.fetch(`/graph/neighborhood?${params}`);
+    },
+
     /**
      * Get character conflicts
      */
@@ -14,11 +14,27 @@ document.addEventListener('DOMContentLoaded', async () => {
 });
 
 /**
- * Load graph data from API
+ * Load graph data from API.
+ *
+ * `graph.html?focus=character:peter&hops=2` loads only that node's
+ * neighborhood instead of the whole graph.
  */
 async function loadGraph() {
     try {
-        graphData = await API.getGraph();
+        const params = new URLSearchParams(window.location.search);
+        const focus = params.get('focus');
+        if (focus) {
+            graphData = await API.getGraphNeighborhood(focus, {
+                hops: Number(params.get('hops')) || 1,
+                positions: true,
+            });
+            graphData.nodes = graphData.nodes.map(n => {
+                const xy = graphData.positions && graphData.positions[n.id];
+                return xy ? { ...n, properties: { ...n.properties, x: xy[0], y: xy[1] } } : n;
+            });
+        } else {
+            graphData = await API.getGraph();
+        }
         initializeGraph();
         document.getElementById('loading').classList.add('hidden');
     } catch (error) {
@@ -146,6 +162,20 @@ function renderGraph() {
         .attr('dy', -12)
         .text(d => d.label || d.id);
 
+    // Start from server-computed positions (properties.x/y in [-1, 1]) when
+    // present, so only a short refinement runs instead of a full layout.
+    const width = svg.attr('width');
+    const height = svg.attr('height');
+    let placed = 0;
+    filteredNodes.forEach(d => {
+        const props = d.properties || {};
+        if (d.x === undefined && typeof props.x === 'number' && typeof props.y === 'number') {
+            d.x = width / 2 + props.x * width * 0.45;
+            d.y = height / 2 + props.y * height * 0.45;
+            placed++;
+        }
+    });
+
     // Update simulation
     simulation.nodes(filteredNodes)
         .on('tick', ticked);
@@ -153,7 +183,7 @@ function renderGraph() {
     simulation.force('link')
         .links(filteredEdges);
 
-    simulation.alpha(1).restart();
+    simulation.alpha(placed === filteredNodes.length && placed > 0 ? 0.15 : 1).restart();
 }
 
 /**
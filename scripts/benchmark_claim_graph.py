@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+BCE Claim Graph Benchmark
+
+Times a corpus-wide claim graph build (every character and event) with a
+cold and a warm claim-classification cache. Run locally with:
+
+    python scripts/benchmark_claim_graph.py --repeat 20
+"""
+
+import argparse
+import time
+
+from bce import claim_graph, queries
+
+
+def _build_all(characters, events) -> int:
+    conflicts = 0
+    for character in characters:
+        conflicts += len(claim_graph.build_claim_graph_for_character(character)["conflicts"])
+    for event in events:
+        conflicts += len(claim_graph.build_claim_graph_for_event(event)["conflicts"])
+    return conflicts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark corpus-wide claim graph builds")
+    parser.add_argument("--repeat", type=int, default=10, help="Warm iterations to average")
+    args = parser.parse_args()
+
+    characters = queries.list_all_characters()
+    events = queries.list_all_events()
+
+    claim_graph._classify_predicate.cache_clear()
+    claim_graph._classify_conflict_type.cache_clear()
+    start = time.perf_counter()
+    conflicts = _build_all(characters, events)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        _build_all(characters, events)
+    warm = (time.perf_counter() - start) / max(args.repeat, 1)
+
+    info = claim_graph._classify_predicate.cache_info()
+    print('=' * 60)
+    print('BCE Claim Graph Benchmark')
+    print('=' * 60)
+    print(f'Entities:            {len(characters)} characters, {len(events)} events')
+    print(f'Conflicts detected:  {conflicts}')
+    print(f'Cold build:          {cold * 1000:.2f} ms')
+    print(f'Warm build (avg):    {warm * 1000:.2f} ms over {args.repeat} run(s)')
+    print(f'Classifier cache:    {info.hits} hits, {info.misses} misses, {info.currsize} entries')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+BCE Graph Algorithm Benchmark
+
+Compares exact and k-pivot sampled betweenness, and greedy modularity,
+label propagation and Louvain community detection, on synthetic planted-
+partition graphs of increasing size. Sampled betweenness is scored against
+the exact result (where that is affordable) by Spearman rank correlation and
+top-20 overlap; community methods are scored by modularity. Run locally with:
+
+    python scripts/benchmark_graph_algorithms.py --sizes 1000,10000,100000
+
+Requires numpy.
+"""
+
+import argparse
+import time
+
+import networkx as nx
+
+from bce.analytics.csr import CSRGraph
+from bce.analytics.network import louvain_communities
+from bce.analytics._deps import get_numpy
+
+
+def _planted_partition(n, community_size, degree, mixing, seed):
+    """Return a CSRGraph with ``n`` nodes in planted communities.
+
+    Each node draws ``degree`` out-edges; a ``mixing`` fraction of them go
+    to uniformly random nodes, the rest stay inside its community.
+    """
+    np = get_numpy()
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(n), degree)
+    block = sources // community_size
+    inside = block * community_size + rng.integers(0, community_size, sources.shape[0])
+    outside = rng.integers(0, n, sources.shape[0])
+    targets = np.where(rng.random(sources.shape[0]) < mixing, outside, np.minimum(inside, n - 1))
+    keep = sources != targets
+    return CSRGraph.from_arrays(n, sources[keep], targets[keep])
+
+
+def _modularity(csr, communities):
+    np = get_numpy()
+    und = csr.undirected()
+    label = np.empty(csr.num_nodes, dtype=np.int64)
+    for idx, community in enumerate(communities):
+        label[[csr.index[node] for node in community]] = idx
+    src = und.sources()
+    m2 = float(und.num_edges)
+    if m2 == 0:
+        return 0.0
+    internal = np.bincount(label[src], weights=(label[src] == label[und.indices]), minlength=len(communities))
+    degree_sum = np.bincount(label, weights=np.diff(und.indptr), minlength=len(communities))
+    return float((internal / m2 - (degree_sum / m2) ** 2).sum())
+
+
+def _spearman(exact, approx):
+    np = get_numpy()
+    keys = list(exact)
+    a = np.argsort(np.argsort([exact[k] for k in keys]))
+    b = np.argsort(np.argsort([approx[k] for k in keys]))
+    return float(np.corrcoef(a, b)[0, 1])
+
+
+def _top_overlap(exact, approx, top=20):
+    best = set(sorted(exact, key=exact.get, reverse=True)[:top])
+    guess = set(sorted(approx, key=approx.get, reverse=True)[:top])
+    return len(best & guess) / top
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalable graph algorithms")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated node counts")
+    parser.add_argument("--degree", type=int, default=4, help="Out-edges drawn per node")
+    parser.add_argument("--community-size", type=int, default=50, help="Planted community size")
+    parser.add_argument("--mixing", type=float, default=0.1, help="Fraction of edges leaving a community")
+    parser.add_argument("--pivots", default="32,128", help="Comma-separated k values for sampled betweenness")
+    parser.add_argument("--exact-limit", type=int, default=2000, help="Largest n for exact betweenness/greedy")
+    parser.add_argument("--time-budget", type=float, default=10.0, help="Seconds for LPA/Louvain")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    pivots = [int(k) for k in args.pivots.split(",")]
+
+    print('=' * 72)
+    print('BCE Graph Algorithm Benchmark')
+    print('=' * 72)
+    for n in sizes:
+        csr, build = _timed(
+            lambda: _planted_partition(n, args.community_size, args.degree, args.mixing, args.seed)
+        )
+        print(f'\nn={n:,}  edges={csr.num_edges:,}  build={build * 1000:.0f} ms  arrays={csr.nbytes / 1024:.0f} KiB')
+
+        exact = None
+        if n <= args.exact_limit:
+            exact, elapsed = _timed(csr.betweenness_centrality)
+            print(f'  betweenness exact          {elapsed:8.2f} s')
+        for k in pivots:
+            approx, elapsed = _timed(lambda: csr.betweenness_centrality(k=k, seed=args.seed))
+            quality = (
+                f'spearman={_spearman(exact, approx):.3f} top20={_top_overlap(exact, approx):.2f}'
+                if exact is not None else 'no exact baseline'
+            )
+            print(f'  betweenness k={k:<10} {elapsed:8.2f} s  {quality}')
+
+        undirected = nx.Graph()
+        undirected.add_nodes_from(csr.node_ids)
+        und = csr.undirected()
+        undirected.add_edges_from(
+            (csr.node_ids[u], csr.node_ids[v]) for u, v in zip(und.sources(), und.indices) if u < v
+        )
+        methods = [
+            (
+                "label_propagation",
+                lambda: csr.label_propagation_communities(seed=args.seed, time_budget=args.time_budget),
+            ),
+            ("louvain", lambda: louvain_communities(undirected, seed=args.seed, time_budget=args.time_budget)),
+        ]
+        if n <= args.exact_limit:
+            methods.insert(0, ("greedy", lambda: nx.algorithms.community.greedy_modularity_communities(undirected)))
+        for method, run in methods:
+            communities, elapsed = _timed(run)
+            print(
+                f'  communities {method:<18} {elapsed:6.2f} s  '
+                f'count={len(communities):<6} modularity={_modularity(csr, communities):.3f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Regenerate bce/data/versification.json from the bundled Bible translations.
+
+Run after adding or updating a translation under bce/data/bibles.
+"""
+
+import sys
+from bce.references import build_versification, write_versification
+
+
+def main():
+    """Write the versification table and report book coverage."""
+    translations = sys.argv[1:] or None
+    path = write_versification(translations=translations)
+    table = build_versification(translations)
+    covered = sum(1 for row in table['books'].values() if row)
+    print(f'Wrote {path}')
+    print(f'  Translations: {", ".join(table["translations"])}')
+    print(f'  Books with verse counts: {covered}/66')
+
+
+if __name__ == '__main__':
+    main()
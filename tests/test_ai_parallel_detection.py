@@ -411,6 +411,22 @@ class TestParseSourceFromReference:
         assert _parse_source_from_reference("Genesis 1:1") is None
         assert _parse_source_from_reference("Invalid Book 99:99") is None
 
+    def test_parse_annotated_reference(self):
+        """Should attribute references carrying a trailing annotation."""
+        from bce.ai.parallel_detection import _parse_source_from_reference
+
+        assert _parse_source_from_reference("John 3:16 (NRSV)") == "john"
+        assert _parse_source_from_reference("Mark 16:9-20 (longer ending)") == "mark"
+        assert _parse_source_from_reference("1 Corinthians 15:3-8 (pre-Pauline creed)") == "paul_undisputed"
+        assert _parse_source_from_reference("Mark") == "mark"
+
+    def test_parse_multi_book_reference(self):
+        """Should attribute multi-book references to their first book."""
+        from bce.ai.parallel_detection import _parse_source_from_reference
+
+        assert _parse_source_from_reference("Matthew 27:3-10; Acts 1:18") == "matthew"
+        assert _parse_source_from_reference("Acts 1:18; Matthew 27:3-10") == "acts"
+
 
 class TestFindParallelGroups:
     """Tests for _find_parallel_groups internal function."""
@@ -99,6 +99,32 @@ def test_build_graph_snapshot_via_api() -> None:
     assert snapshot.edges
 
 
+def test_graph_metrics_via_api() -> None:
+    metrics = api.graph_metrics(["degree", "betweenness"], top=3)
+
+    assert set(metrics) == {"degree", "betweenness"}
+    scores = list(metrics["degree"].values())
+    assert len(scores) == 3
+    assert scores == sorted(scores, reverse=True)
+    full = api.graph_degree_centrality()
+    assert max(full.values()) == scores[0]
+    full.clear()
+    assert api.graph_degree_centrality()
+
+
+def test_graph_neighborhood_positions_fall_back_without_layout(monkeypatch) -> None:
+    import sys
+
+    # A None entry makes ``import bce.analytics.layout`` raise ImportError,
+    # as it does when numpy is missing.
+    monkeypatch.setitem(sys.modules, "bce.analytics.layout", None)
+
+    result = api.graph_neighborhood("character:peter", positions=True)
+
+    assert "positions" not in result
+    assert result["nodes"]
+
+
 def test_bible_helpers_via_api() -> None:
     translations = api.list_bible_translations()
 
@@ -115,3 +141,26 @@ def test_bible_helpers_via_api() -> None:
     for code, verse in parallel.items():
         assert isinstance(verse, str)
         assert verse
+
+
+def test_bible_translation_info_via_api() -> None:
+    spanish = api.list_bible_translation_info("es")
+
+    assert [info["code"] for info in spanish] == ["rv_1858"]
+    assert spanish[0]["language_dir"] == "ES-Spanish"
+    assert spanish[0]["name"] == "Reina Valera 1858 NT"
+
+
+def test_passage_text_via_api() -> None:
+    text = api.get_passage_text("Mark", 14, 72, 15, 1, translation="tyndale", join="\n")
+
+    assert text.count("\n") == 1
+    parallel = api.get_parallel_passage_text("Mark", 14, 72, 15, 1, ["tyndale", "rv_1858"])
+    assert [len(verses) for verses in parallel.values()] == [2, 2]
+
+
+def test_search_verses_via_api() -> None:
+    result = api.search_verses("begynnynge", translation="tyndale", limit=1)
+
+    assert result["total"] >= 1
+    assert result["results"][0]["reference"] == "Genesis 1:1"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
+import os
 from typing import Dict
 
+import pytest
+
 import bce.bibles as bibles
 
 
@@ -42,3 +46,344 @@ class TestBibleHelpers:
         for code, text in verses.items():
             assert isinstance(text, str)
             assert text
+
+
+def _write_translation(root, code: str, verses) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "metadata": {"name": code.upper(), "shortname": code},
+        "verses": [
+            {"book_name": book, "book": number, "chapter": ch, "verse": v, "text": text}
+            for book, number, ch, v, text in verses
+        ],
+    }
+    (root / f"{code}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+class TestCompiledStore:
+    VERSES = [
+        ("Genesis", 1, 1, 1, "In the beginning"),
+        ("Genesis", 1, 1, 2, "The earth was void"),
+        ("Genesis", 1, 1, 4, "Light was good"),
+        ("Mark", 41, 15, 1, "Straightway in the morning"),
+        ("Mark", 41, 15, 2, "Pilate asked him"),
+    ]
+
+    def _use_root(self, monkeypatch, root) -> None:
+        monkeypatch.setattr(bibles, "_BIBLES_DIR", root.parent)
+        monkeypatch.setattr(bibles, "_FALLBACK_DIR", root.parent.parent / "fallback")
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+
+    def test_compiles_on_first_use_and_reads_verses(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", self.VERSES)
+        self._use_root(monkeypatch, root)
+
+        assert bibles.get_verse("genesis", 1, 2, translation="tst") == "The earth was void"
+        assert (root / f"tst{bibles.COMPILED_SUFFIX}").exists()
+        assert bibles.get_passage("Mark", 15, 1, 2, translation="tst") == [
+            "Straightway in the morning",
+            "Pilate asked him",
+        ]
+        assert bibles.get_translation_metadata("tst")["shortname"] == "tst"
+
+    def test_missing_verses_raise_key_error(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", self.VERSES)
+        self._use_root(monkeypatch, root)
+
+        with pytest.raises(KeyError, match="Genesis 1:3"):
+            bibles.get_verse("Genesis", 1, 3, translation="tst")
+        with pytest.raises(KeyError, match="Genesis 1:3"):
+            bibles.get_passage("Genesis", 1, 1, 4, translation="tst")
+        with pytest.raises(KeyError, match="Genesis 2:1"):
+            bibles.get_verse("Genesis", 2, 1, translation="tst")
+        with pytest.raises(KeyError, match="Unknown book"):
+            bibles.get_verse("Exodus", 1, 1, translation="tst")
+
+    def test_stale_store_is_recompiled(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", self.VERSES)
+        self._use_root(monkeypatch, root)
+        bibles.get_verse("Genesis", 1, 1, translation="tst")
+
+        _write_translation(root, "tst", [("Genesis", 1, 1, 1, "Revised text")])
+        stat = (root / "tst.json").stat()
+        os.utime(root / "tst.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+
+        assert bibles.get_verse("Genesis", 1, 1, translation="tst") == "Revised text"
+
+    def test_falls_back_when_data_dir_is_not_writable(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", self.VERSES)
+        self._use_root(monkeypatch, root)
+        real_compile = bibles.compile_translation
+
+        def compile_outside_root(source, output):
+            if output.parent == root:
+                raise PermissionError(output)
+            return real_compile(source, output)
+
+        monkeypatch.setattr(bibles, "compile_translation", compile_outside_root)
+
+        assert bibles.get_verse("Genesis", 1, 4, translation="tst") == "Light was good"
+        assert bibles._CACHE.get("tst").path.parent == tmp_path / "fallback" / "EN-English"
+
+    def test_matches_source_json_for_bundled_translation(self) -> None:
+        source = bibles._source_path("tyndale")
+        with source.open("r", encoding="utf-8") as f:
+            verses = json.load(f)["verses"]
+
+        for verse in verses[::97]:
+            assert bibles.get_verse(
+                verse["book_name"], verse["chapter"], verse["verse"], translation="tyndale"
+            ) == verse["text"]
+
+
+class TestTranslationCache:
+    VERSES = TestCompiledStore.VERSES
+
+    def _setup(self, tmp_path, monkeypatch, codes, max_bytes):
+        root = tmp_path / "bibles" / "EN-English"
+        for code in codes:
+            _write_translation(root, code, self.VERSES)
+        monkeypatch.setattr(bibles, "_BIBLES_DIR", root.parent)
+        monkeypatch.setattr(bibles, "_FALLBACK_DIR", tmp_path / "fallback")
+        cache = bibles._TranslationCache(max_bytes=max_bytes)
+        monkeypatch.setattr(bibles, "_CACHE", cache)
+        return cache
+
+    def test_counts_hits_and_misses(self, tmp_path, monkeypatch) -> None:
+        self._setup(tmp_path, monkeypatch, ["aaa"], max_bytes=10**9)
+
+        bibles.get_verse("Genesis", 1, 1, translation="aaa")
+        bibles.get_verse("Genesis", 1, 2, translation="aaa")
+        bibles.get_passage("Mark", 15, 1, 2, translation="aaa")
+
+        stats = bibles.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["translations"][0]["translation"] == "aaa"
+        assert stats["used_bytes"] == stats["translations"][0]["size_bytes"] > 0
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path, monkeypatch) -> None:
+        cache = self._setup(tmp_path, monkeypatch, ["aaa", "bbb", "ccc"], max_bytes=10**9)
+        bibles.get_verse("Genesis", 1, 1, translation="aaa")
+        one_store = cache.used_bytes
+        cache._max_bytes = 2 * one_store
+
+        bibles.get_verse("Genesis", 1, 1, translation="bbb")
+        bibles.get_verse("Genesis", 1, 1, translation="aaa")
+        bibles.get_verse("Genesis", 1, 1, translation="ccc")
+
+        assert "aaa" in cache and "ccc" in cache
+        assert "bbb" not in cache
+        assert bibles.cache_stats()["evictions"] == 1
+
+    def test_keeps_most_recent_store_even_when_over_budget(self, tmp_path, monkeypatch) -> None:
+        cache = self._setup(tmp_path, monkeypatch, ["aaa", "bbb"], max_bytes=0)
+
+        bibles.get_verse("Genesis", 1, 1, translation="aaa")
+        bibles.get_verse("Genesis", 1, 1, translation="bbb")
+
+        assert "bbb" in cache and "aaa" not in cache
+
+    def test_derived_caches_count_toward_budget_and_go_with_eviction(self, tmp_path, monkeypatch) -> None:
+        cache = self._setup(tmp_path, monkeypatch, ["aaa", "bbb"], max_bytes=10**9)
+        aaa = bibles._load_translation("aaa")
+        bbb = bibles._load_translation("bbb")
+        cache._max_bytes = cache.used_bytes
+
+        aaa.set_derived("index", object(), 10)
+        cache.resize("aaa")
+        bbb.set_derived("index", object(), 10)
+        cache.resize("bbb")
+
+        assert "aaa" not in cache and "bbb" in cache
+        assert aaa.derived == {}
+        assert cache.used_bytes == bbb.size_estimate
+
+    def test_preload_loads_configured_translations(self, tmp_path, monkeypatch) -> None:
+        from bce.config import BceConfig, reset_default_config, set_default_config
+
+        cache = self._setup(tmp_path, monkeypatch, ["aaa", "bbb"], max_bytes=10**9)
+        set_default_config(BceConfig(bible_preload=["aaa", "missing"]))
+        try:
+            assert bibles.preload_translations() == ["aaa"]
+        finally:
+            reset_default_config()
+
+        assert "aaa" in cache and "bbb" not in cache
+        assert bibles.preload_translations(["bbb"]) == ["bbb"]
+        assert "bbb" in cache
+
+
+class TestTranslationRegistry:
+    def test_bundled_registry_spans_language_directories(self) -> None:
+        translations = bibles.list_translations()
+
+        assert "tyndale" in translations
+        assert "rv_1858" in translations
+        assert bibles.list_translations("es") == ["rv_1858"]
+        assert "tyndale" in bibles.list_translations("EN-English")
+        assert "Unigénito" in bibles.get_verse("Juan", 3, 16, translation="rv_1858")
+
+    def test_metadata_matches_full_parse(self) -> None:
+        for code in ("tyndale", "rv_1858"):
+            with bibles._source_path(code).open("r", encoding="utf-8") as f:
+                expected = json.load(f)["metadata"]
+            assert bibles.get_translation_metadata(code) == expected
+
+    def test_metadata_read_does_not_load_verses(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles"
+        (root / "EN-English").mkdir(parents=True)
+        (root / "Extras").mkdir()
+        (root / "Extras" / "books_en.json").write_text("[]", encoding="utf-8")
+        # Metadata spans several read chunks; the verse list is truncated JSON.
+        metadata = {"name": "Header Only", "lang": "English", "description": "x" * 50000}
+        body = '{"metadata": ' + json.dumps(metadata) + ', "verses": [{"book_name": '
+        (root / "EN-English" / "hdr.json").write_text(body, encoding="utf-8")
+        monkeypatch.setattr(bibles, "_BIBLES_DIR", root)
+        monkeypatch.setattr(bibles, "_METADATA_CACHE", {})
+
+        assert bibles.list_translations() == ["hdr"]
+        assert bibles.get_translation_metadata("hdr") == metadata
+        assert [info.to_dict()["name"] for info in bibles.list_translation_info("english")] == [
+            "Header Only"
+        ]
+
+    def test_metadata_cache_refreshes_when_file_changes(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", TestCompiledStore.VERSES)
+        monkeypatch.setattr(bibles, "_BIBLES_DIR", root.parent)
+        monkeypatch.setattr(bibles, "_METADATA_CACHE", {})
+        assert bibles.get_translation_metadata("tst")["name"] == "TST"
+
+        path = root / "tst.json"
+        path.write_text(json.dumps({"verses": [], "metadata": {"name": "Renamed"}}), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert bibles.get_translation_metadata("tst") == {"name": "Renamed"}
+
+    def test_unknown_translation_raises(self) -> None:
+        with pytest.raises(FileNotFoundError, match="not_a_bible"):
+            bibles.get_translation_metadata("not_a_bible")
+
+
+class TestRangeRetrieval:
+    def test_cross_chapter_range_is_contiguous(self) -> None:
+        verses = bibles.get_range("Mark", 14, 66, 15, 5, translation="tyndale")
+
+        expected = [bibles.get_verse("Mark", 14, v, translation="tyndale") for v in range(66, 73)]
+        expected += [bibles.get_verse("Mark", 15, v, translation="tyndale") for v in range(1, 6)]
+        assert verses == expected
+
+    def test_join_returns_single_string(self) -> None:
+        joined = bibles.get_range("Genesis", 1, 1, 1, 3, translation="tyndale", join=" ")
+
+        assert joined == " ".join(bibles.get_passage("Genesis", 1, 1, 3, translation="tyndale"))
+
+    def test_reversed_range_raises(self) -> None:
+        with pytest.raises(ValueError):
+            bibles.get_range("Mark", 15, 1, 14, 66, translation="tyndale")
+
+    def test_gaps_raise_unless_skipped(self, tmp_path, monkeypatch) -> None:
+        root = tmp_path / "bibles" / "EN-English"
+        _write_translation(root, "tst", TestCompiledStore.VERSES)
+        monkeypatch.setattr(bibles, "_BIBLES_DIR", root.parent)
+        monkeypatch.setattr(bibles, "_FALLBACK_DIR", tmp_path / "fallback")
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+
+        with pytest.raises(KeyError, match="Genesis 1:3"):
+            bibles.get_range("Genesis", 1, 1, 1, 4, translation="tst")
+        assert bibles.get_range("Genesis", 1, 2, 1, 4, translation="tst", skip_missing=True) == [
+            "The earth was void",
+            "Light was good",
+        ]
+        with pytest.raises(KeyError, match="Mark 15:3"):
+            bibles.get_range("Mark", 15, 1, 15, 3, translation="tst")
+
+    def test_parallel_range_resolves_localized_book_names(self) -> None:
+        ranges = bibles.get_parallel_range(
+            "Mark", 14, 71, 15, 1, translations=["tyndale", "rv_1858"], join=" "
+        )
+
+        assert set(ranges) == {"tyndale", "rv_1858"}
+        assert ranges["rv_1858"].startswith("Y él comenzó")
+        assert ranges["tyndale"] == " ".join(
+            bibles.get_range("Mark", 14, 71, 15, 1, translation="tyndale")
+        )
+
+
+class TestResolveReferences:
+    def test_resolves_mixed_reference_forms(self) -> None:
+        texts = bibles.resolve_references(
+            ["Mark 16:1-2", "Mk 16:2", "Mark 14:10-11, 43", "Philemon 24", "Matthew 99:1", "1 Enoch 1:1"],
+            translation="tyndale",
+        )
+
+        assert list(texts) == ["Mark 16:1-2", "Mk 16:2", "Mark 14:10-11, 43", "Philemon 24", "Matthew 99:1", "1 Enoch 1:1"]
+        assert texts["Mark 16:1-2"] == bibles.get_range("Mark", 16, 1, 16, 2, translation="tyndale", join=" ")
+        assert texts["Mk 16:2"] == bibles.get_verse("Mark", 16, 2, translation="tyndale")
+        assert texts["Mark 14:10-11, 43"] == " ".join(
+            bibles.get_range("Mark", 14, 10, 14, 11, translation="tyndale")
+            + [bibles.get_verse("Mark", 14, 43, translation="tyndale")]
+        )
+        assert texts["Philemon 24"] == bibles.get_verse("Philemon", 1, 24, translation="tyndale")
+        assert texts["Matthew 99:1"] is None
+        assert texts["1 Enoch 1:1"] is None
+
+    def test_reversed_ranges_resolve_to_none(self) -> None:
+        reversed_refs = ["Mark 14:10-5", "Mark 15:5-14:66", "Matthew 7-5"]
+
+        texts = bibles.resolve_references(reversed_refs, translation="tyndale")
+        assert texts == dict.fromkeys(reversed_refs)
+
+        # Batched next to an overlapping valid reference, the result is the same.
+        bibles.clear_cache()
+        texts = bibles.resolve_references(["Mark 14:1-20", *reversed_refs], translation="tyndale")
+        assert texts["Mark 14:1-20"]
+        assert [texts[ref] for ref in reversed_refs] == [None, None, None]
+
+    def test_whole_chapters_and_localized_translation(self) -> None:
+        texts = bibles.resolve_references(["Jude", "Mark 15", "Mark 15:1"], translation="rv_1858")
+
+        assert texts["Jude"] is None
+        assert texts["Mark 15"] == " ".join(bibles.get_range("Marcos", 15, 1, 15, 47, translation="rv_1858"))
+        assert texts["Mark 15:1"] == bibles.get_verse("Marcos", 15, 1, translation="rv_1858")
+
+    def test_reads_merged_runs_once_and_caches(self, monkeypatch) -> None:
+        bibles.clear_cache()
+        store = bibles._load_translation("tyndale")
+        calls = []
+        original = store.texts
+
+        def counting(first, last):
+            calls.append((first, last))
+            return original(first, last)
+
+        monkeypatch.setattr(store, "texts", counting)
+        bibles.resolve_references(["Mark 16:1-4", "Mark 16:3-8", "Mark 16:9", "Genesis 1:1"], translation="tyndale")
+        assert len(calls) == 2
+
+        calls.clear()
+        bibles.resolve_references(["Mark 16:3-8"], translation="tyndale")
+        assert calls == []
+
+    def test_cache_lives_on_the_store_and_is_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+        monkeypatch.setattr(bibles, "_RESOLVED_MAX_ENTRIES", 2)
+        store = bibles._load_translation("tyndale")
+        before = store.size_estimate
+
+        bibles.resolve_references(["Mark 16:1", "Mark 16:2", "Mark 16:3"], translation="tyndale")
+
+        assert list(store.derived["resolved"]) == ["Mark 16:2", "Mark 16:3"]
+        assert store.size_estimate > before
+        assert bibles._CACHE.stats()["used_bytes"] == store.size_estimate
+
+        bibles.clear_cache()
+        assert store.derived == {}
+        assert store.size_estimate == before
@@ -101,3 +101,56 @@ class TestCacheRegistryInvalidateAllBehavior:
                 except CacheError:
                     # If it was never registered or already removed, ignore.
                     pass
+
+
+class TestCacheRegistryEntityListeners:
+    def test_register_non_callable_listener_raises_cache_error(self) -> None:
+        with pytest.raises(CacheError) as exc:
+            CacheRegistry.register_entity_listener("nope")  # type: ignore[arg-type]
+
+        assert "Entity listener must be callable" in str(exc.value)
+
+    def test_invalidate_entity_clears_invalidators_then_notifies_listeners(self) -> None:
+        calls: List[object] = []
+
+        def invalidator() -> None:
+            calls.append("clear")
+
+        def listener(entity_type, entity_id) -> None:
+            calls.append((entity_type, entity_id))
+
+        CacheRegistry.register(invalidator)
+        CacheRegistry.register_entity_listener(listener)
+        try:
+            CacheRegistry.invalidate_entity("character", "jesus")
+            CacheRegistry.invalidate_all()
+        finally:
+            CacheRegistry.unregister(invalidator)
+            CacheRegistry.unregister_entity_listener(listener)
+
+        assert calls == ["clear", ("character", "jesus"), "clear", (None, None)]
+
+    def test_unregister_unknown_listener_raises_cache_error(self) -> None:
+        with pytest.raises(CacheError) as exc:
+            CacheRegistry.unregister_entity_listener(lambda *_: None)
+
+        assert "was not registered" in str(exc.value)
+
+    def test_invalidate_entity_isolates_failing_listeners(self) -> None:
+        calls: List[object] = []
+
+        def failing(entity_type, entity_id) -> None:
+            raise RuntimeError("listener broke")
+
+        def listener(entity_type, entity_id) -> None:
+            calls.append((entity_type, entity_id))
+
+        CacheRegistry.register_entity_listener(failing)
+        CacheRegistry.register_entity_listener(listener)
+        try:
+            CacheRegistry.invalidate_entity("character", "jesus")
+        finally:
+            CacheRegistry.unregister_entity_listener(failing)
+            CacheRegistry.unregister_entity_listener(listener)
+
+        assert calls == [("character", "jesus")]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bce import claim_graph
 from bce.claim_graph import (
     ClaimType,
     build_claim_graph_for_event,
@@ -70,3 +71,32 @@ def test_build_claim_graph_for_event_serializes_conflicts() -> None:
     assert summary_conflict
     assert summary_conflict["claim_type"] == ClaimType.NARRATIVE.value
     assert summary_conflict["harmonization_moves"]
+
+
+def test_classify_claim_type_respects_keyword_priority() -> None:
+    # "reference" (chronology) outranks "place" (geography) regardless of position.
+    assert claim_graph._classify_claim_type("place_reference") == (ClaimType.CHRONOLOGY, "dating")
+    assert claim_graph._classify_claim_type("Passover_Order") == (ClaimType.CHRONOLOGY, "sequence")
+    assert claim_graph._classify_claim_type("messianic_secret") == (ClaimType.THEOLOGY, "christology")
+    assert claim_graph._classify_claim_type("sea_crossing") == (ClaimType.GEOGRAPHY, "locale")
+    assert claim_graph._classify_claim_type("unmatched") == (ClaimType.OTHER, "other")
+
+
+def test_classify_claim_type_uses_value_class_for_codex_mentions() -> None:
+    assert claim_graph._classify_claim_type("wording", "Codex Vaticanus") == (
+        ClaimType.TEXTUAL,
+        "textual_variant",
+    )
+    assert claim_graph._classify_claim_type("wording", "plain text") == (ClaimType.OTHER, "other")
+
+
+def test_classify_claim_type_is_memoized_per_predicate_and_value_class() -> None:
+    claim_graph._classify_predicate.cache_clear()
+
+    claim_graph._classify_claim_type("timeline", "before exile")
+    claim_graph._classify_claim_type("timeline", "after exile")
+    claim_graph._classify_claim_type("Timeline", None)
+
+    info = claim_graph._classify_predicate.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
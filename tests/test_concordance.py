@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import bce.bibles as bibles
+from bce import concordance
+
+
+VERSES = [
+    ("Leviticus", 3, 16, 8, "And Aaron shall cast lots upon the two goats; one lot for the LORD, and the other lot for Azazel."),
+    ("Leviticus", 3, 16, 10, "But the goat, on which the lot fell for Azazel, shall be presented alive."),
+    ("Leviticus", 3, 16, 26, "And he that let go the goat for Azazel shall wash his clothes."),
+    ("Mark", 41, 14, 66, "And as Peter was beneath in the palace"),
+    ("Mark", 41, 15, 1, "And straightway in the morning the chief priests held a consultation"),
+    ("John", 43, 3, 16, "Porque de tal manera amó Dios al mundo, que ha dado á su Hijo Unigénito"),
+]
+
+
+@pytest.fixture()
+def translation(tmp_path, monkeypatch):
+    root = tmp_path / "bibles" / "EN-English"
+    root.mkdir(parents=True)
+    payload = {
+        "metadata": {"name": "Test"},
+        "verses": [
+            {"book_name": book, "book": number, "chapter": ch, "verse": v, "text": text}
+            for book, number, ch, v, text in VERSES
+        ],
+    }
+    (root / "tst.json").write_text(json.dumps(payload), encoding="utf-8")
+    monkeypatch.setattr(bibles, "_BIBLES_DIR", root.parent)
+    monkeypatch.setattr(bibles, "_FALLBACK_DIR", tmp_path / "fallback")
+    monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+    return root
+
+
+def _refs(result):
+    return [hit["reference"] for hit in result["results"]]
+
+
+class TestQueryParsing:
+    def test_words_phrases_and_proximity(self) -> None:
+        clauses = concordance.parse_query('Azazel "two goats" "goat Azazel"~3')
+
+        assert [(c.words, c.slop, c.ordered) for c in clauses] == [
+            (("azazel",), None, False),
+            (("two", "goats"), 0, True),
+            (("goat", "azazel"), 3, False),
+        ]
+
+    def test_normalizes_case_and_accents(self) -> None:
+        assert concordance.tokenize("Unigénito, AMÓ!") == ["unigenito", "amo"]
+
+
+class TestSearch:
+    def test_all_words_must_match(self, translation) -> None:
+        result = concordance.search_verses("azazel goat", translation="tst")
+
+        assert result["total"] == 2
+        assert set(_refs(result)) == {"Leviticus 16:10", "Leviticus 16:26"}
+
+    def test_exact_phrase(self, translation) -> None:
+        result = concordance.search_verses('"for azazel"', translation="tst")
+        assert result["total"] == 3
+
+        result = concordance.search_verses('"azazel for"', translation="tst")
+        assert result["total"] == 0
+
+    def test_proximity_is_unordered_and_bounded(self, translation) -> None:
+        # Leviticus 16:10: "goat, on which the lot fell for Azazel" - 6 words between.
+        assert concordance.search_verses('"azazel goat"~6', translation="tst")["total"] == 2
+        assert _refs(concordance.search_verses('"azazel goat"~5', translation="tst")) == [
+            "Leviticus 16:26"
+        ]
+
+    def test_accent_insensitive_match(self, translation) -> None:
+        result = concordance.search_verses("unigenito", translation="tst")
+
+        assert _refs(result) == ["John 3:16"]
+        assert "Unigénito" in result["results"][0]["text"]
+
+    def test_ranked_and_paginated(self, translation) -> None:
+        full = concordance.search_verses("lot", translation="tst")
+        scores = [hit["score"] for hit in full["results"]]
+        assert scores == sorted(scores, reverse=True)
+        # Leviticus 16:8 has "lot" twice.
+        assert _refs(full)[0] == "Leviticus 16:8"
+
+        page = concordance.search_verses("lot", translation="tst", offset=1, limit=1)
+        assert page["total"] == full["total"] == 2
+        assert _refs(page) == _refs(full)[1:2]
+
+    def test_invalid_paging_raises(self, translation) -> None:
+        with pytest.raises(ValueError):
+            concordance.search_verses("lot", translation="tst", limit=0)
+
+
+class TestPersistence:
+    def test_index_is_written_next_to_translation_and_reused(self, translation, monkeypatch) -> None:
+        concordance.search_verses("azazel", translation="tst")
+        index_path = translation / f"tst{concordance.INDEX_SUFFIX}"
+        assert index_path.exists()
+
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+
+        def fail_build(*args, **kwargs):
+            raise AssertionError("index should be reused")
+
+        monkeypatch.setattr(concordance, "build_index", fail_build)
+        assert concordance.search_verses("azazel", translation="tst")["total"] == 3
+
+    def test_index_rebuilds_when_translation_changes(self, translation, monkeypatch) -> None:
+        concordance.search_verses("azazel", translation="tst")
+
+        path = translation / "tst.json"
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload["verses"] = payload["verses"][:1]
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        monkeypatch.setattr(bibles, "_CACHE", bibles._TranslationCache())
+
+        assert concordance.search_verses("azazel", translation="tst")["total"] == 1
+
+
+class TestCacheBudget:
+    def test_index_is_counted_and_dropped_with_its_store(self, translation, monkeypatch) -> None:
+        store = bibles._load_translation("tst")
+        before = bibles.cache_stats()["used_bytes"]
+
+        index = concordance.get_concordance("tst")
+        assert concordance.get_concordance("tst") is index
+        assert bibles.cache_stats()["used_bytes"] == before + index.size_estimate
+
+        bibles.clear_cache()
+        assert store.derived == {}
+        assert concordance.get_concordance("tst") is not index
+
+    def test_stale_index_is_closed(self, translation, monkeypatch) -> None:
+        concordance.search_verses("azazel", translation="tst")
+        path = translation / "tst.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        bibles.clear_cache()
+
+        closed = []
+        original = concordance.Concordance.close
+
+        def tracking_close(self) -> None:
+            closed.append(self.path)
+            original(self)
+
+        monkeypatch.setattr(concordance.Concordance, "close", tracking_close)
+        concordance.get_concordance("tst")
+
+        assert closed == [translation / f"tst{concordance.INDEX_SUFFIX}"]
+
+
+def test_bundled_translation_search() -> None:
+    result = concordance.search_verses('"begynnynge god"', translation="tyndale", limit=5)
+
+    assert "Genesis 1:1" in _refs(result)
@@ -63,6 +63,48 @@ class TestBceConfigCacheSize:
         assert cfg.cache_size == 10
 
 
+class TestBceConfigBibleCache:
+    def test_env_bible_cache_mb_and_preload(self, monkeypatch) -> None:
+        monkeypatch.setenv("BCE_BIBLE_CACHE_MB", "12.5")
+        monkeypatch.setenv("BCE_BIBLE_PRELOAD", "tyndale, rv_1858,")
+        cfg = BceConfig()
+        assert cfg.bible_cache_mb == 12.5
+        assert cfg.bible_preload == ["tyndale", "rv_1858"]
+
+        monkeypatch.setenv("BCE_BIBLE_CACHE_MB", "-1")
+        with pytest.raises(ConfigurationError, match="non-negative"):
+            BceConfig()
+
+        monkeypatch.setenv("BCE_BIBLE_CACHE_MB", "lots")
+        with pytest.raises(ConfigurationError, match="must be a number"):
+            BceConfig()
+
+    def test_defaults_and_overrides(self, monkeypatch) -> None:
+        monkeypatch.delenv("BCE_BIBLE_CACHE_MB", raising=False)
+        monkeypatch.delenv("BCE_BIBLE_PRELOAD", raising=False)
+        assert BceConfig().bible_cache_mb == 64.0
+        assert BceConfig().bible_preload == []
+
+        monkeypatch.setenv("BCE_BIBLE_CACHE_MB", "999")
+        assert BceConfig(bible_cache_mb=8).bible_cache_mb == 8.0
+
+
+class TestBceConfigValidationWorkers:
+    def test_default_env_and_override(self, monkeypatch) -> None:
+        monkeypatch.delenv("BCE_VALIDATION_WORKERS", raising=False)
+        assert BceConfig().validation_workers == 1
+
+        monkeypatch.setenv("BCE_VALIDATION_WORKERS", "4")
+        assert BceConfig().validation_workers == 4
+        assert BceConfig(validation_workers=2).validation_workers == 2
+
+    @pytest.mark.parametrize("env_value, message", [("0", "at least 1"), ("many", "must be an integer")])
+    def test_invalid_env(self, monkeypatch, env_value: str, message: str) -> None:
+        monkeypatch.setenv("BCE_VALIDATION_WORKERS", env_value)
+        with pytest.raises(ConfigurationError, match=message):
+            BceConfig()
+
+
 class TestBceConfigValidationFlag:
     @pytest.mark.parametrize("env_value, expected", [
         ("false", False),
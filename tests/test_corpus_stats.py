@@ -0,0 +1,153 @@
+"""Tests for bce.corpus_stats materialized statistics."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from bce import api, corpus_stats, queries, storage
+from bce.models import Character, Event, EventAccount, SourceProfile
+
+
+@pytest.fixture
+def custom_root(tmp_path: Path):
+    root = tmp_path / "stats_data"
+    storage.configure_data_root(root)
+    try:
+        yield root
+    finally:
+        storage.reset_data_root()
+
+
+def _save_conflicted_character(char_id: str = "tester", tags=None) -> Character:
+    character = Character(
+        id=char_id,
+        canonical_name="Stats Tester",
+        tags=list(tags or ["alpha"]),
+        source_profiles=[
+            SourceProfile(source_id="mark", traits={"timeline": "early"}),
+            SourceProfile(source_id="john", traits={"timeline": "late"}),
+        ],
+    )
+    storage.save_character(character)
+    return character
+
+
+def test_snapshot_matches_bundled_corpus() -> None:
+    stats = corpus_stats.CorpusStats().snapshot()
+
+    assert stats["total_characters"] == len(queries.list_character_ids())
+    assert stats["total_events"] == len(queries.list_event_ids())
+
+    expected_conflicts = sum(
+        len(api.summarize_character_conflicts(cid)) for cid in queries.list_character_ids()
+    ) + sum(len(api.summarize_event_conflicts(eid)) for eid in queries.list_event_ids())
+    assert stats["total_conflicts"] == expected_conflicts
+    assert sum(stats["conflicts_by_severity"].values()) == expected_conflicts
+    assert sum(stats["conflicts_by_category"].values()) == expected_conflicts
+
+    assert stats["total_tags"] == len(stats["tags"]) == len(stats["tag_frequencies"])
+    assert stats["source_coverage"]["mark"]["characters"] > 0
+
+
+def test_snapshot_is_built_once() -> None:
+    view = corpus_stats.CorpusStats()
+    view.snapshot()
+
+    calls = []
+    original = queries.list_character_ids
+
+    def counting():
+        calls.append(1)
+        return original()
+
+    try:
+        queries.list_character_ids = counting  # type: ignore[assignment]
+        view.snapshot()
+        view.snapshot()
+    finally:
+        queries.list_character_ids = original  # type: ignore[assignment]
+
+    assert calls == []
+
+
+def test_snapshot_returns_independent_copies() -> None:
+    view = corpus_stats.CorpusStats()
+    first = view.snapshot()
+    first["tags"].append("mutated")
+
+    assert "mutated" not in view.snapshot()["tags"]
+
+
+def test_save_updates_default_view_incrementally(custom_root: Path) -> None:
+    stats = api.get_corpus_stats()
+    assert stats["total_characters"] == 0
+
+    character = _save_conflicted_character(tags=["alpha", "beta"])
+    stats = api.get_corpus_stats()
+    assert stats["total_characters"] == 1
+    assert stats["character_conflicts"] == 1
+    assert stats["tag_frequencies"] == {"alpha": 1, "beta": 1}
+    assert stats["source_coverage"]["john"] == {"characters": 1, "events": 0}
+
+    # Re-saving replaces the old contribution rather than adding to it.
+    storage.save_character(replace(character, tags=["beta"]))
+    stats = api.get_corpus_stats()
+    assert stats["total_characters"] == 1
+    assert stats["tag_frequencies"] == {"beta": 1}
+
+    storage.save_event(
+        Event(
+            id="gathering",
+            label="Gathering",
+            participants=["tester"],
+            accounts=[EventAccount(source_id="mark", reference="Mark 1:1", summary="Met")],
+            tags=["beta"],
+        )
+    )
+    stats = api.get_corpus_stats()
+    assert stats["total_events"] == 1
+    assert stats["tag_frequencies"] == {"beta": 2}
+    assert stats["source_coverage"]["mark"] == {"characters": 1, "events": 1}
+
+
+def test_data_root_change_discards_view(custom_root: Path) -> None:
+    _save_conflicted_character()
+    assert api.get_corpus_stats()["total_characters"] == 1
+
+    view = corpus_stats.get_default_corpus_stats()
+    storage.reset_data_root()
+    assert not view.is_built
+    assert api.get_corpus_stats()["total_characters"] == len(queries.list_character_ids())
+
+
+def test_update_entity_rejects_unknown_type() -> None:
+    with pytest.raises(ValueError):
+        corpus_stats.CorpusStats().update_entity("place", "jerusalem")
+
+
+def test_save_does_not_reload_and_unloadable_entities_are_dropped(custom_root: Path, monkeypatch) -> None:
+    from bce.hooks import HookPoint, HookRegistry
+
+    monkeypatch.setattr(HookRegistry, "_hooks_enabled_in_config", classmethod(lambda cls: True))
+    _save_conflicted_character("tester")
+    _save_conflicted_character("other")
+    assert api.get_corpus_stats()["total_characters"] == 2
+
+    def abort_tester(ctx):
+        if ctx.data.get("char_id") == "tester":
+            ctx.abort = True
+        return ctx
+
+    HookRegistry.register(HookPoint.BEFORE_CHARACTER_LOAD, abort_tester)
+    try:
+        # The listener only queues the change, so the save still succeeds.
+        _save_conflicted_character("tester", tags=["gamma"])
+        stats = api.get_corpus_stats()
+    finally:
+        HookRegistry.unregister(HookPoint.BEFORE_CHARACTER_LOAD, abort_tester)
+
+    assert stats["total_characters"] == 1
+    assert stats["tag_frequencies"] == {"alpha": 1}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import get_args, get_origin, get_type_hints
+from typing import NotRequired, get_args, get_origin, get_type_hints
 
 from bce.dossier_types import (
     CharacterDossier,
@@ -29,6 +29,8 @@ from bce.dossier_types import (
     DOSSIER_KEY_TRAITS_BY_SOURCE,
     DOSSIER_KEY_PARALLELS,
     DOSSIER_KEY_CLAIM_GRAPH,
+    DOSSIER_KEY_TEXT_TRANSLATION,
+    DOSSIER_KEY_TEXTS_BY_SOURCE,
 )
 
 
@@ -51,8 +53,11 @@ def test_character_dossier_typed_dict_keys() -> None:
         DOSSIER_KEY_PARALLELS,
         DOSSIER_KEY_CLAIM_GRAPH,
     }
+    optional_keys = {DOSSIER_KEY_TEXTS_BY_SOURCE, DOSSIER_KEY_TEXT_TRANSLATION}
 
-    assert set(CharacterDossier.__annotations__.keys()) == expected_keys
+    assert set(CharacterDossier.__annotations__.keys()) == expected_keys | optional_keys
+    hints = get_type_hints(CharacterDossier, include_extras=True)
+    assert {key for key, hint in hints.items() if get_origin(hint) is NotRequired} == optional_keys
 
 
 def test_event_dossier_typed_dict_keys() -> None:
@@ -301,6 +301,16 @@ class TestDossierEdgeCases:
         assert "references" in first
         assert "notes" in first
 
+    def test_relationship_target_names_use_display_name_table(self) -> None:
+        from bce import queries
+
+        dossier = dossiers.build_character_dossier("paul")
+        names = queries.character_display_names()
+
+        for rel in dossier["relationships"]:
+            target_id = rel["character_id"]
+            assert rel["target_name"] == names.get(target_id, target_id)
+
     def test_event_dossier_includes_parallels(self) -> None:
         dossier = dossiers.build_event_dossier("empty_tomb")
 
@@ -315,3 +325,20 @@ class TestDossierEdgeCases:
         assert "references" in entry
         assert isinstance(entry["sources"], list)
         assert isinstance(entry["references"], dict)
+
+
+def test_character_dossier_hydrates_reference_texts() -> None:
+    from bce import bibles
+
+    d = dossiers.build_character_dossier("peter", hydrate_text="tyndale")
+
+    assert d["text_translation"] == "tyndale"
+    assert set(d["texts_by_source"]) == set(d["references_by_source"])
+    for source_id, refs in d["references_by_source"].items():
+        assert list(d["texts_by_source"][source_id]) == list(dict.fromkeys(refs))
+    texts = d["texts_by_source"]["mark"]
+    ref = d["references_by_source"]["mark"][0]
+    assert texts[ref] == bibles.resolve_references([ref], translation="tyndale")[ref]
+    assert texts[ref]
+
+    assert "texts_by_source" not in dossiers.build_character_dossier("peter")
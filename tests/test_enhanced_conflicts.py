@@ -42,3 +42,61 @@ def test_analyze_conflict():
     assert conflict.severity == ConflictSeverity.MEDIUM # 3 sources, 2 distinct values
     assert conflict.distinct_values == ["at the tomb", "in the garden"]
     assert "Disagreement in geographical domain" in conflict.rationale
+
+
+def test_analyze_values_returns_shared_immutable_analysis():
+    """Identical field/value sets should reuse one frozen analysis object."""
+    EnhancedConflictDetector.clear_analysis_cache()
+    values = frozenset({"at the tomb", "in the garden"})
+
+    first = EnhancedConflictDetector.analyze_values("location", values, 3, "event")
+    second = EnhancedConflictDetector.analyze_values("location", values, 3, "event")
+
+    assert first is second
+    assert first.distinct_values == ("at the tomb", "in the garden")
+    with pytest.raises(AttributeError):
+        first.severity = ConflictSeverity.LOW  # type: ignore[misc]
+
+    # A different source count is a different key.
+    other = EnhancedConflictDetector.analyze_values("location", values, 2, "event")
+    assert other is not first
+    assert other.severity == ConflictSeverity.LOW
+
+
+def test_analyze_conflict_keeps_per_call_sources():
+    """Shared analyses must not leak source mappings between callers."""
+    a = EnhancedConflictDetector.analyze_conflict("location", {"mark": "x", "john": "y"}, "event")
+    b = EnhancedConflictDetector.analyze_conflict("location", {"luke": "y", "acts": "x"}, "event")
+
+    assert a.sources == {"mark": "x", "john": "y"}
+    assert b.sources == {"luke": "y", "acts": "x"}
+    assert a.distinct_values == b.distinct_values == ["x", "y"]
+
+
+def test_analysis_cache_invalidated_when_rule_tables_change(monkeypatch):
+    """Reassigning a rule table should drop memoized analyses."""
+    values = frozenset({"a", "b"})
+    before = EnhancedConflictDetector.analyze_values("color_of_robe", values, 2, "character")
+    assert before.severity == ConflictSeverity.LOW
+
+    monkeypatch.setattr(
+        EnhancedConflictDetector,
+        "CRITICAL_FIELDS",
+        EnhancedConflictDetector.CRITICAL_FIELDS | {"color_of_robe"},
+    )
+    after = EnhancedConflictDetector.analyze_values("color_of_robe", values, 2, "character")
+    assert after.severity == ConflictSeverity.CRITICAL
+
+
+def test_analysis_cache_is_bounded(monkeypatch):
+    """The memo should evict least-recently-used analyses beyond its size."""
+    EnhancedConflictDetector.clear_analysis_cache()
+    monkeypatch.setattr(EnhancedConflictDetector, "ANALYSIS_CACHE_SIZE", 2)
+
+    first = EnhancedConflictDetector.analyze_values("f1", frozenset({"a", "b"}), 2, "event")
+    EnhancedConflictDetector.analyze_values("f2", frozenset({"a", "b"}), 2, "event")
+    EnhancedConflictDetector.analyze_values("f3", frozenset({"a", "b"}), 2, "event")
+
+    again = EnhancedConflictDetector.analyze_values("f1", frozenset({"a", "b"}), 2, "event")
+    assert again is not first
+    assert again == first
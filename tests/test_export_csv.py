@@ -133,6 +133,17 @@ class TestExportEventsCsv:
         for row in rows:
             assert row["account_count"].isdigit()
 
+    def test_participant_names_field(self, tmp_path: Path) -> None:
+        """participant_names should resolve participant IDs to canonical names."""
+        output_file = tmp_path / "events_names.csv"
+
+        export_events_csv(str(output_file), include_fields=["id", "participant_names"])
+
+        with output_file.open(newline="", encoding="utf-8") as f:
+            rows = {row["id"]: row for row in csv.DictReader(f)}
+
+        assert "Jesus of Nazareth" in rows["crucifixion"]["participant_names"]
+
     def test_empty_event_list(self, tmp_path: Path) -> None:
         """Should handle empty event directory and still produce header-only CSV."""
         custom_root = tmp_path / "empty_data"
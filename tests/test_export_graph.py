@@ -6,7 +6,12 @@ potential graph database exports.
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from typing import Dict
+from unittest.mock import patch
+
+import pytest
 
 from bce import storage
 from bce.analytics import network as graph_network
@@ -22,8 +27,12 @@ from bce.export_graph import (
     GraphEdge,
     GraphNode,
     GraphSnapshot,
+    GraphSnapshotCache,
     build_graph_snapshot,
+    get_default_graph_cache,
+    iter_graph_elements,
 )
+from bce.models import Character, Event, SourceProfile
 
 
 def _index_nodes(snapshot: GraphSnapshot) -> Dict[str, GraphNode]:
@@ -190,9 +199,206 @@ class TestGraphAnalytics:
         assert communities, "expected at least one community"
         assert any("character:jesus" in community for community in communities)
 
+    def test_session_memoizes_views_and_metrics(self) -> None:
+        session = graph_network.get_graph_analytics()
+
+        assert graph_network.get_graph_analytics() is session
+        assert session.digraph is session.digraph
+        batch = session.compute(["degree", "eigenvector"])
+        assert session.metric("degree") is batch["degree"]
+        assert graph_network.compute_degree_centrality() == batch["degree"]
+
+    def test_module_helpers_return_copies(self) -> None:
+        session = graph_network.get_graph_analytics()
+        degree = graph_network.compute_degree_centrality()
+        communities = graph_network.detect_communities()
+
+        degree.clear()
+        communities[0].clear()
+        communities.clear()
+
+        assert session.metric("degree")
+        assert graph_network.compute_degree_centrality() == session.metric("degree")
+        assert all(graph_network.detect_communities())
+
+    def test_session_tracks_corpus_version(self, small_root) -> None:
+        session = graph_network.get_graph_analytics()
+        assert "character:gamma" not in session.metric("degree")
+
+        storage.save_character(Character(id="gamma", canonical_name="Gamma"))
+        updated = graph_network.get_graph_analytics()
+
+        assert updated is not session
+        assert "character:gamma" in updated.metric("degree")
+
+    def test_default_metrics_without_numpy(self) -> None:
+        session = graph_network.GraphAnalytics(graph=graph_network.build_networkx_graph())
+        # Simulate a base install: no CSR core, so the pure-Python paths run.
+        session._csr_checked = True
+
+        pagerank = session.metric("pagerank")
+
+        assert set(pagerank) == set(session.digraph.nodes)
+        assert sum(pagerank.values()) == pytest.approx(1.0)
+        assert min(pagerank.values()) > 0
+
+    def test_unknown_metric_rejected(self) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            graph_network.GraphAnalytics(graph=graph_network.build_networkx_graph()).compute("degree,bogus")
+
     def test_shortest_path_between_character_and_event(self) -> None:
         path = graph_network.shortest_path("character:jesus", "event:crucifixion")
 
         assert path[0] == "character:jesus"
         assert path[-1] == "event:crucifixion"
         assert len(path) >= 2
+
+
+@pytest.fixture
+def small_root(tmp_path: Path):
+    storage.configure_data_root(tmp_path / "graph_data")
+    try:
+        storage.save_character(
+            Character(
+                id="alpha",
+                canonical_name="Alpha",
+                source_profiles=[SourceProfile(source_id="mark", traits={"role": "healer"})],
+                relationships=[{"target_id": "beta", "type": "sibling"}],
+            )
+        )
+        storage.save_character(Character(id="beta", canonical_name="Beta"))
+        storage.save_event(Event(id="meal", label="Meal", participants=["alpha", "ghost"]))
+        yield
+    finally:
+        storage.reset_data_root()
+
+
+def _ids(snapshot: GraphSnapshot) -> tuple[set, set]:
+    return {n.id for n in snapshot.nodes}, {e.id for e in snapshot.edges}
+
+
+class TestGraphSnapshotCache:
+    """The cached snapshot is built once and patched per saved entity."""
+
+    def test_cached_snapshot_matches_streamed_elements(self) -> None:
+        snapshot = build_graph_snapshot()
+        streamed = GraphSnapshot(nodes=[], edges=[])
+        for element in iter_graph_elements():
+            (streamed.nodes if isinstance(element, GraphNode) else streamed.edges).append(element)
+
+        assert _ids(snapshot) == _ids(streamed)
+        assert len(snapshot.nodes) == len(streamed.nodes)
+        assert len(snapshot.edges) == len(streamed.edges)
+
+    def test_builds_in_one_storage_pass_and_reuses_it(self, small_root) -> None:
+        cache = GraphSnapshotCache()
+        with patch("bce.export_graph.storage.iter_characters", wraps=storage.iter_characters) as spy:
+            first = cache.snapshot()
+            second = cache.snapshot()
+
+        assert spy.call_count == 1
+        assert _ids(first) == _ids(second)
+        assert first.nodes is not second.nodes
+        assert "character:ghost" in _ids(first)[0]
+
+    def test_save_patches_only_changed_entity(self, small_root) -> None:
+        cache = get_default_graph_cache()
+        cache.snapshot()
+        beta_payload = next(n for n in cache.payload()["nodes"] if n["id"] == "character:beta")
+        version = cache.version
+
+        with patch("bce.export_graph.storage.iter_characters") as spy:
+            storage.save_character(
+                Character(
+                    id="alpha",
+                    canonical_name="Alpha Renamed",
+                    source_profiles=[SourceProfile(source_id="luke", traits={})],
+                )
+            )
+            snapshot = build_graph_snapshot()
+            payload = cache.payload()
+
+        spy.assert_not_called()
+        assert cache.version > version
+        nodes = _index_nodes(snapshot)
+        assert nodes["character:alpha"].label == "Alpha Renamed"
+        assert "source:luke" in nodes
+        assert "char_rel:alpha:beta:sibling" not in _ids(snapshot)[1]
+        # Unchanged entities keep their serialized payloads.
+        assert next(n for n in payload["nodes"] if n["id"] == "character:beta") is beta_payload
+
+    def test_new_and_removed_entities(self, small_root, tmp_path: Path) -> None:
+        cache = get_default_graph_cache()
+        cache.snapshot()
+
+        storage.save_character(Character(id="ghost", canonical_name="Ghost"))
+        assert _index_nodes(build_graph_snapshot())["character:ghost"].label == "Ghost"
+
+        (tmp_path / "graph_data" / "characters" / "ghost.json").unlink()
+        cache.update_entity("character", "ghost")
+        assert _index_nodes(build_graph_snapshot())["character:ghost"].label == "ghost"
+
+    def test_payload_json_is_cached_until_change(self, small_root) -> None:
+        cache = get_default_graph_cache()
+        text = cache.payload_json()
+
+        assert cache.payload_json() is text
+        assert json.loads(text) == cache.payload()
+
+        storage.save_event(Event(id="meal", label="Supper", participants=["alpha"]))
+        updated = json.loads(cache.payload_json())
+        assert any(n["label"] == "Supper" for n in updated["nodes"])
+        assert "character:ghost" not in {n["id"] for n in updated["nodes"]}
+
+
+class TestNeighborhood:
+    """Ego-network queries over the cached adjacency index."""
+
+    def test_one_hop_returns_induced_subgraph(self, small_root) -> None:
+        result = get_default_graph_cache().neighborhood("character:alpha")
+
+        ids = {node["id"] for node in result["nodes"]}
+        assert ids == {"character:alpha", "character:beta", "source:mark", "event:meal"}
+        assert result["depth"]["character:alpha"] == 0
+        assert all(e["source"] in ids and e["target"] in ids for e in result["edges"])
+        assert {e["type"] for e in result["edges"]} == {
+            EDGE_TYPE_CHARACTER_PROFILE_IN_SOURCE,
+            EDGE_TYPE_CHARACTER_RELATIONSHIP,
+            EDGE_TYPE_CHARACTER_PARTICIPATED_IN_EVENT,
+        }
+        assert not result["truncated"]
+
+    def test_hops_edge_types_and_limit(self, small_root) -> None:
+        cache = get_default_graph_cache()
+
+        two_hops = cache.neighborhood("character:beta", hops=2)
+        assert two_hops["depth"]["event:meal"] == 2
+        assert "character:ghost" not in two_hops["depth"]
+        assert cache.neighborhood("character:beta", hops=0)["nodes"][0]["id"] == "character:beta"
+
+        only_rel = cache.neighborhood("character:alpha", hops=3, edge_types=[EDGE_TYPE_CHARACTER_RELATIONSHIP])
+        assert {n["id"] for n in only_rel["nodes"]} == {"character:alpha", "character:beta"}
+
+        limited = cache.neighborhood("character:alpha", hops=2, limit=2)
+        assert len(limited["nodes"]) == 2
+        assert limited["truncated"]
+
+    def test_unknown_node_and_bad_arguments(self, small_root) -> None:
+        cache = get_default_graph_cache()
+
+        with pytest.raises(KeyError):
+            cache.neighborhood("character:nobody")
+        with pytest.raises(ValueError):
+            cache.neighborhood("character:alpha", hops=-1)
+        with pytest.raises(ValueError):
+            cache.neighborhood("character:alpha", limit=0)
+
+    def test_index_follows_saves(self, small_root) -> None:
+        cache = get_default_graph_cache()
+        cache.neighborhood("character:beta")
+
+        storage.save_character(
+            Character(id="beta", canonical_name="Beta", relationships=[{"target_id": "delta", "type": "friend"}])
+        )
+        ids = {n["id"] for n in cache.neighborhood("character:beta")["nodes"]}
+        assert "character:delta" in ids
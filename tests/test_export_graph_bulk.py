@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import csv
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from bce import api, storage
+from bce.export_graph import GraphNode, build_graph_snapshot, iter_graph_elements
+from bce.export_graph_bulk import export_graph_bulk, parse_graph_formats
+from bce.models import Character, Event
+
+GRAPHML_NS = "{http://graphml.graphdrawing.org/xmlns}"
+
+
+def _edge_key(edge):
+    return (edge.id, edge.source, edge.target, edge.type, json.dumps(edge.properties, sort_keys=True))
+
+
+def test_iter_graph_elements_matches_snapshot() -> None:
+    snapshot = build_graph_snapshot()
+    elements = list(iter_graph_elements())
+    nodes = [e for e in elements if isinstance(e, GraphNode)]
+    edges = [e for e in elements if not isinstance(e, GraphNode)]
+
+    assert len({n.id for n in nodes}) == len(nodes)
+    expected_nodes = {n.id: (n.label, n.type, n.properties) for n in snapshot.nodes}
+    assert {n.id: (n.label, n.type, n.properties) for n in nodes} == expected_nodes
+    assert sorted(map(_edge_key, edges)) == sorted(map(_edge_key, snapshot.edges))
+
+
+def test_iter_graph_elements_reads_storage_once(monkeypatch) -> None:
+    calls = {"characters": 0, "events": 0}
+    original_chars, original_events = storage.iter_characters, storage.iter_events
+
+    def chars():
+        calls["characters"] += 1
+        return original_chars()
+
+    def events():
+        calls["events"] += 1
+        return original_events()
+
+    monkeypatch.setattr(storage, "iter_characters", chars)
+    monkeypatch.setattr(storage, "iter_events", events)
+    for _ in iter_graph_elements():
+        pass
+    assert calls == {"characters": 1, "events": 1}
+
+
+def test_placeholder_nodes_for_undefined_characters() -> None:
+    characters = [Character(id="a", canonical_name="A", relationships=[{"target_id": "ghost", "type": "friend"}])]
+    events = [Event(id="e", label="E", participants=["a", "stranger"])]
+    nodes = {e.id: e for e in iter_graph_elements(characters, events) if isinstance(e, GraphNode)}
+
+    assert nodes["character:ghost"].label == "ghost"
+    assert nodes["character:stranger"].properties == {"character_id": "stranger"}
+
+
+def test_writes_all_formats(tmp_path: Path) -> None:
+    outputs = export_graph_bulk(tmp_path)
+    snapshot = build_graph_snapshot()
+
+    assert set(outputs) == {"neo4j", "graphml", "ndjson"}
+    for written in outputs.values():
+        for rel_path in written:
+            assert (tmp_path / rel_path).is_file()
+
+    # NDJSON line counts match the snapshot.
+    node_lines = (tmp_path / "ndjson" / "nodes.ndjson").read_text(encoding="utf-8").splitlines()
+    edge_lines = (tmp_path / "ndjson" / "edges.ndjson").read_text(encoding="utf-8").splitlines()
+    assert len(node_lines) == len(snapshot.nodes)
+    assert len(edge_lines) == len(snapshot.edges)
+    assert {"id", "source", "target", "type", "properties"} == set(json.loads(edge_lines[0]))
+
+    # GraphML parses and carries every element.
+    graph = ET.parse(tmp_path / "graph.graphml").getroot().find(f"{GRAPHML_NS}graph")
+    assert len(graph.findall(f"{GRAPHML_NS}node")) == len(snapshot.nodes)
+    assert len(graph.findall(f"{GRAPHML_NS}edge")) == len(snapshot.edges)
+
+    # Neo4j node files carry typed headers and labels.
+    with (tmp_path / "neo4j" / "nodes_character.csv").open(encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["id:ID", "name", "character_id:string", "aliases:string[]", "roles:string[]", ":LABEL"]
+    jesus = next(row for row in rows if row[0] == "character:jesus")
+    assert jesus[-1] == "Character"
+
+    rel_rows = 0
+    for name in outputs["neo4j"]:
+        if name.startswith("neo4j/rels_"):
+            with (tmp_path / name).open(encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                assert next(reader)[:3] == [":START_ID", ":END_ID", ":TYPE"]
+                rel_rows += sum(1 for _ in reader)
+    assert rel_rows == len(snapshot.edges)
+
+
+def test_selected_formats_only(tmp_path: Path) -> None:
+    outputs = api.export_graph_bulk(str(tmp_path), formats="ndjson")
+    assert outputs == {"ndjson": ["ndjson/nodes.ndjson", "ndjson/edges.ndjson"]}
+    assert not (tmp_path / "graph.graphml").exists()
+
+
+def test_parse_graph_formats_rejects_unknown() -> None:
+    with pytest.raises(ValueError, match="rdf"):
+        parse_graph_formats("graphml,rdf")
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bce import export_pipeline, queries, storage
+from bce.cache import CacheRegistry
+from bce.export_citations import export_citations
+from bce.export_json import export_all_characters
+from bce.models import Character, Event, SourceProfile
+
+
+def test_parse_formats_defaults_and_deduplicates() -> None:
+    assert export_pipeline.parse_formats(None) == list(export_pipeline.EXPORT_FORMATS)
+    assert export_pipeline.parse_formats("CSV, md,csv") == ["csv", "md"]
+    with pytest.raises(ValueError, match="pdf"):
+        export_pipeline.parse_formats("json,pdf")
+
+
+def test_run_export_writes_every_format(tmp_path: Path) -> None:
+    report = export_pipeline.run_export(tmp_path)
+
+    assert set(report.outputs) == set(export_pipeline.EXPORT_FORMATS)
+    for written in report.outputs.values():
+        for rel_path in written:
+            assert (tmp_path / rel_path).is_file()
+
+    md_files = report.outputs["md"]
+    assert len(md_files) == len(queries.list_character_ids()) + len(queries.list_event_ids())
+    assert "md/characters/jesus.md" in md_files
+
+    graph = json.loads((tmp_path / "graph" / "graph.json").read_text(encoding="utf-8"))
+    assert {"nodes", "edges"} <= set(graph)
+
+    for stage in ("load", "dossiers", "write:json", "write", "total"):
+        assert stage in report.timings
+    assert "write:graph" in report.format_timings()
+
+
+def test_outputs_match_standalone_exporters(tmp_path: Path) -> None:
+    export_pipeline.run_export(tmp_path, formats="json,bibtex")
+
+    standalone = tmp_path / "standalone.json"
+    export_all_characters(str(standalone))
+    assert (tmp_path / "json" / "characters.json").read_text(encoding="utf-8") == standalone.read_text(
+        encoding="utf-8"
+    )
+
+    bib = (tmp_path / "bibtex" / "citations.bib").read_text(encoding="utf-8")
+    assert bib == "\n\n".join(export_citations("bibtex")) + "\n"
+
+
+def test_run_export_loads_each_entity_once(tmp_path: Path, monkeypatch) -> None:
+    queries.clear_cache()
+    calls = {"character": 0, "event": 0}
+    original_character = storage.load_character
+    original_event = storage.load_event
+
+    def counting_character(char_id):
+        calls["character"] += 1
+        return original_character(char_id)
+
+    def counting_event(event_id):
+        calls["event"] += 1
+        return original_event(event_id)
+
+    monkeypatch.setattr(storage, "load_character", counting_character)
+    monkeypatch.setattr(storage, "load_event", counting_event)
+    monkeypatch.setattr(storage, "iter_characters", lambda: pytest.fail("writers must not re-read storage"))
+    monkeypatch.setattr(storage, "iter_events", lambda: pytest.fail("writers must not re-read storage"))
+
+    try:
+        export_pipeline.run_export(tmp_path)
+    finally:
+        queries.clear_cache()
+
+    assert calls["character"] == len(queries.list_character_ids())
+    assert calls["event"] == len(queries.list_event_ids())
+
+
+def test_parallel_export_matches_sequential(tmp_path: Path) -> None:
+    sequential = export_pipeline.run_export(tmp_path / "seq", formats="json,csv,graph")
+    parallel = export_pipeline.run_export(tmp_path / "par", formats="json,csv,graph", jobs=2)
+
+    assert parallel.outputs == sequential.outputs
+    for written in sequential.outputs.values():
+        for rel_path in written:
+            assert (tmp_path / "par" / rel_path).read_bytes() == (tmp_path / "seq" / rel_path).read_bytes()
+
+
+def test_run_export_rejects_bad_jobs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        export_pipeline.run_export(tmp_path, jobs=0)
+
+
+@pytest.fixture
+def custom_root(tmp_path: Path):
+    root = tmp_path / "export_data"
+    storage.configure_data_root(root)
+    try:
+        storage.save_character(
+            Character(
+                id="alpha",
+                canonical_name="Alpha",
+                source_profiles=[SourceProfile(source_id="mark", traits={"role": "healer"})],
+                relationships=[{"target_id": "beta", "type": "sibling"}],
+            )
+        )
+        storage.save_character(Character(id="beta", canonical_name="Beta"))
+        storage.save_character(Character(id="gamma", canonical_name="Gamma"))
+        storage.save_event(Event(id="meal", label="Meal", participants=["alpha", "beta"]))
+        yield root
+    finally:
+        storage.reset_data_root()
+
+
+def test_second_run_skips_unchanged_outputs(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    first = export_pipeline.run_export(out)
+    assert (out / export_pipeline.MANIFEST_NAME).is_file()
+    assert sum(len(paths) for paths in first.outputs.values()) == 10
+
+    second = export_pipeline.run_export(out)
+    assert second.outputs == {}
+    assert sum(len(paths) for paths in second.skipped.values()) == 10
+    assert "dossiers" not in second.timings
+
+
+def test_changed_entity_regenerates_dependent_outputs(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    export_pipeline.run_export(out)
+
+    # Renaming beta changes beta's own page, alpha's dossier (relationship
+    # target name) and every aggregate that embeds names.
+    storage.save_character(Character(id="beta", canonical_name="Beta Renamed"))
+    report = export_pipeline.run_export(out)
+
+    assert sorted(report.outputs["md"]) == ["md/characters/alpha.md", "md/characters/beta.md"]
+    assert "md/characters/gamma.md" in report.skipped["md"]
+    assert "md/events/meal.md" in report.skipped["md"]
+    assert report.outputs["csv"] == ["csv/characters.csv", "csv/events.csv"]
+    assert "# Beta Renamed" in (out / "md" / "characters" / "beta.md").read_text(encoding="utf-8")
+
+
+def test_files_rewritten_with_a_stale_sibling_are_not_skipped(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    export_pipeline.run_export(out, formats="json")
+
+    # Only events.json is stale, but the json writer rewrites both files.
+    storage.save_event(Event(id="meal", label="Last Meal", participants=["alpha", "beta"]))
+    report = export_pipeline.run_export(out, formats="json")
+
+    assert report.outputs["json"] == ["json/characters.json", "json/events.json"]
+    assert report.skipped == {}
+
+
+def test_removed_entity_outputs_are_deleted(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    export_pipeline.run_export(out)
+    assert (out / "md" / "characters" / "gamma.md").exists()
+
+    (custom_root / "characters" / "gamma.json").unlink()
+    CacheRegistry.invalidate_all()
+    report = export_pipeline.run_export(out, formats="md")
+
+    assert report.removed == ["md/characters/gamma.md"]
+    assert not (out / "md" / "characters" / "gamma.md").exists()
+    manifest = export_pipeline.load_manifest(out)
+    assert "md/characters/gamma.md" not in manifest["outputs"]
+    # Formats not selected in this run keep their manifest entries.
+    assert "json/characters.json" in manifest["outputs"]
+
+
+def test_missing_output_file_is_regenerated(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    export_pipeline.run_export(out, formats="graph")
+    (out / "graph" / "graph.json").unlink()
+
+    report = export_pipeline.run_export(out, formats="graph")
+    assert report.outputs == {"graph": ["graph/graph.json"]}
+
+
+def test_force_rebuilds_everything(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    export_pipeline.run_export(out, formats="md,bibtex")
+    report = export_pipeline.run_export(out, formats="md,bibtex", force=True)
+
+    assert len(report.outputs["md"]) == 4
+    assert report.outputs["bibtex"] == ["bibtex/citations.bib"]
+    assert report.skipped == {}
+
+
+def test_incompatible_manifest_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / export_pipeline.MANIFEST_NAME).write_text('{"version": -1}', encoding="utf-8")
+    assert export_pipeline.load_manifest(tmp_path)["outputs"] == {}
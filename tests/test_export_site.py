@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bce import export_site, storage
+from bce.cache import CacheRegistry
+from bce.models import Character, Event
+from bce.plugins import Plugin, PluginManager
+
+
+@pytest.fixture
+def custom_root(tmp_path: Path):
+    root = tmp_path / "site_data"
+    storage.configure_data_root(root)
+    try:
+        storage.save_character(Character(id="alpha", canonical_name="Alpha"))
+        storage.save_character(Character(id="beta", canonical_name="Beta"))
+        storage.save_event(Event(id="meal", label="Meal", participants=["alpha"]))
+        yield root
+    finally:
+        storage.reset_data_root()
+
+
+def test_builds_pages_and_indexes(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    report = export_site.build_site(out)
+
+    assert sorted(report.written) == [
+        "characters/alpha.md",
+        "characters/beta.md",
+        "characters/index.md",
+        "events/index.md",
+        "events/meal.md",
+        "index.md",
+    ]
+    assert (out / "characters" / "alpha.md").read_text(encoding="utf-8").startswith("# Alpha")
+    assert "- [Beta](beta.md)" in (out / "characters" / "index.md").read_text(encoding="utf-8")
+    assert "(2)" in (out / "index.md").read_text(encoding="utf-8")
+    assert not list(out.rglob("*.tmp"))
+
+
+def test_rebuild_skips_unchanged_pages(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    export_site.build_site(out)
+    storage.save_character(Character(id="beta", canonical_name="Beta Renamed"))
+
+    report = export_site.build_site(out)
+    assert sorted(report.written) == ["characters/beta.md", "characters/index.md"]
+    assert sorted(report.skipped) == ["characters/alpha.md", "events/meal.md"]
+    assert sorted(report.unchanged) == ["events/index.md", "index.md"]
+
+
+def test_force_renders_but_does_not_rewrite_identical_pages(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    export_site.build_site(out)
+    mtime = (out / "characters" / "alpha.md").stat().st_mtime_ns
+
+    report = export_site.build_site(out, force=True)
+    assert report.written == []
+    assert len(report.unchanged) == 6
+    assert (out / "characters" / "alpha.md").stat().st_mtime_ns == mtime
+
+
+def test_removed_entity_page_is_deleted(custom_root: Path, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    export_site.build_site(out)
+    (custom_root / "characters" / "beta.json").unlink()
+    CacheRegistry.invalidate_all()
+
+    report = export_site.build_site(out)
+    assert report.removed == ["characters/beta.md"]
+    assert not (out / "characters" / "beta.md").exists()
+
+
+def test_loaded_plugins_invalidate_pages(custom_root: Path, tmp_path: Path, monkeypatch) -> None:
+    out = tmp_path / "site"
+    export_site.build_site(out)
+
+    class Extra(Plugin):
+        name = "extra"
+        version = "1.0"
+
+    monkeypatch.setattr(PluginManager, "_loaded_plugins", [Extra()])
+    report = export_site.build_site(out)
+    assert report.skipped == []
+
+
+def test_parallel_build_matches_sequential(tmp_path: Path) -> None:
+    sequential = export_site.build_site(tmp_path / "seq")
+    parallel = export_site.build_site(tmp_path / "par", jobs=2, chunk_size=8)
+
+    assert sorted(parallel.written) == sorted(sequential.written)
+    for rel_path in sequential.written:
+        assert (tmp_path / "par" / rel_path).read_bytes() == (tmp_path / "seq" / rel_path).read_bytes()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from bce import api, queries, storage
+from bce.export_sqlite import export_sqlite
+from bce.models import (
+    Character,
+    Event,
+    EventAccount,
+    Relationship,
+    RelationshipAttestation,
+    SourceProfile,
+    TextualVariant,
+)
+
+
+def _sample_corpus():
+    characters = [
+        Character(
+            id="alpha",
+            canonical_name="Alpha",
+            aliases=["A"],
+            roles=["healer"],
+            tags=["t1"],
+            source_profiles=[
+                SourceProfile(
+                    source_id="mark",
+                    traits={"role": "healer", "home": "Nazareth"},
+                    references=["Mark 1:1", "Mark 1:2"],
+                    variants=[TextualVariant("P46", "reading", "matters")],
+                ),
+                SourceProfile(source_id="custom_source", traits={"role": "teacher"}),
+            ],
+            relationships=[
+                Relationship(
+                    source_id="alpha",
+                    target_id="beta",
+                    type="sibling",
+                    attestation=[RelationshipAttestation("mark", ["Mark 3:1", "Mark 3:2"])],
+                )
+            ],
+        ),
+        Character(id="beta", canonical_name="Beta"),
+    ]
+    events = [
+        Event(
+            id="meal",
+            label="Meal",
+            participants=["alpha", "beta"],
+            accounts=[EventAccount(source_id="mark", reference="Mark 14:1", summary="ate")],
+            parallels=[{"sources": ["mark", "luke"], "references": {"luke": "Luke 22:1"}, "relationship": "parallel"}],
+        )
+    ]
+    return characters, events
+
+
+def test_writes_normalized_tables(tmp_path: Path) -> None:
+    characters, events = _sample_corpus()
+    db = tmp_path / "bce.db"
+    counts = export_sqlite(str(db), characters=characters, events=events)
+
+    assert counts["characters"] == 2
+    assert counts["traits"] == 3
+    assert counts["attestation_references"] == 2
+
+    conn = sqlite3.connect(str(db))
+    try:
+        rows = conn.execute(
+            "SELECT source_id, value FROM trait_values WHERE character_id = 'alpha' AND trait = 'role' "
+            "ORDER BY source_id"
+        ).fetchall()
+        assert rows == [("custom_source", "teacher"), ("mark", "healer")]
+
+        refs = conn.execute(
+            "SELECT reference FROM profile_references ORDER BY position"
+        ).fetchall()
+        assert refs == [("Mark 1:1",), ("Mark 1:2",)]
+
+        rel = conn.execute(
+            "SELECT r.target_id, r.type, a.source_id, COUNT(ar.reference) FROM relationships r "
+            "JOIN relationship_attestations a ON a.relationship_id = r.id "
+            "JOIN attestation_references ar ON ar.attestation_id = a.id GROUP BY a.id"
+        ).fetchall()
+        assert rel == [("beta", "sibling", "mark", 2)]
+
+        parallel = conn.execute(
+            "SELECT source_id, reference FROM parallel_sources ORDER BY source_id"
+        ).fetchall()
+        assert parallel == [("luke", "Luke 22:1"), ("mark", None)]
+
+        # Sources seen only in the data are still present for joins.
+        assert conn.execute("SELECT COUNT(*) FROM sources WHERE id = 'custom_source'").fetchone() == (1,)
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_traits_trait" in indexes
+        assert "idx_accounts_source" in indexes
+    finally:
+        conn.close()
+
+
+def test_replaces_existing_database(tmp_path: Path) -> None:
+    characters, events = _sample_corpus()
+    db = tmp_path / "bce.db"
+    export_sqlite(str(db), characters=characters, events=events)
+    export_sqlite(str(db), characters=characters[1:], events=[])
+
+    conn = sqlite3.connect(str(db))
+    try:
+        assert conn.execute("SELECT id FROM characters").fetchall() == [("beta",)]
+    finally:
+        conn.close()
+    assert not (tmp_path / "bce.db.tmp").exists()
+
+
+def test_bundled_corpus_round_trip(tmp_path: Path) -> None:
+    db = tmp_path / "corpus.db"
+    counts = api.export_sqlite(str(db))
+
+    assert counts["characters"] == len(queries.list_character_ids())
+    assert counts["events"] == len(queries.list_event_ids())
+
+    expected_profiles = sum(len(c.source_profiles) for c in storage.iter_characters())
+    conn = sqlite3.connect(str(db))
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM profiles").fetchone() == (expected_profiles,)
+    finally:
+        conn.close()
@@ -0,0 +1,187 @@
+"""Tests for the CSR graph core in bce.analytics.csr."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import networkx as nx
+
+from bce.analytics import network as graph_network
+from bce.analytics.csr import CSRGraph
+from bce.export_graph import GraphEdge, GraphNode, build_graph_snapshot
+
+
+def _close(a: dict, b: dict, tol: float = 1e-9) -> bool:
+    return set(a) == set(b) and all(abs(a[k] - b[k]) <= tol for k in a)
+
+
+@pytest.fixture(scope="module")
+def corpus_graphs():
+    snapshot = build_graph_snapshot()
+    multi = graph_network.build_networkx_graph(snapshot)
+    return CSRGraph.from_snapshot(snapshot), multi
+
+
+def test_from_snapshot_indexes_nodes_and_edges(corpus_graphs) -> None:
+    csr, multi = corpus_graphs
+
+    assert csr.num_nodes == multi.number_of_nodes()
+    assert csr.num_edges == multi.number_of_edges()
+    assert csr.indptr[-1] == csr.num_edges
+    assert csr.node_ids[csr.index["character:jesus"]] == "character:jesus"
+    assert set(csr.edge_types) == {data["type"] for _, _, data in multi.edges(data=True)}
+    assert csr.nbytes < 16 * (csr.num_nodes + csr.num_edges)
+
+
+def test_streamed_build_matches_snapshot(corpus_graphs) -> None:
+    csr, _ = corpus_graphs
+    streamed = CSRGraph.from_snapshot()
+
+    assert set(streamed.node_ids) == set(csr.node_ids)
+    assert sorted(streamed.edge_ids) == sorted(csr.edge_ids)
+
+
+def test_centralities_match_networkx(corpus_graphs) -> None:
+    csr, multi = corpus_graphs
+    digraph = graph_network._as_simple_digraph(multi)
+    undirected = graph_network._as_simple_graph(multi)
+
+    assert _close(csr.degree_centrality(), nx.degree_centrality(digraph))
+    assert _close(
+        csr.eigenvector_centrality(max_iter=1000),
+        nx.eigenvector_centrality(undirected, max_iter=1000),
+    )
+    pagerank = csr.pagerank()
+    assert sum(pagerank.values()) == pytest.approx(1.0)
+    assert max(pagerank, key=pagerank.get).startswith("source:")
+
+
+def test_pagerank_on_small_graph() -> None:
+    elements = [
+        GraphEdge(id="ab", source="a", target="b", type="link"),
+        GraphEdge(id="bc", source="b", target="c", type="link"),
+        GraphEdge(id="ca", source="c", target="a", type="link"),
+    ]
+    ranks = CSRGraph.from_elements(elements).pagerank()
+
+    assert ranks == pytest.approx({"a": 1 / 3, "b": 1 / 3, "c": 1 / 3})
+
+
+def test_bfs_and_shortest_path(corpus_graphs) -> None:
+    csr, multi = corpus_graphs
+    digraph = graph_network._as_simple_digraph(multi)
+
+    distances = csr.bfs_distances("character:jesus")
+    assert distances == dict(nx.single_source_shortest_path_length(digraph, "character:jesus"))
+
+    path = csr.shortest_path("character:jesus", "event:crucifixion")
+    assert path[0] == "character:jesus" and path[-1] == "event:crucifixion"
+    assert len(path) - 1 == distances["event:crucifixion"]
+
+    with pytest.raises(nx.NetworkXNoPath):
+        csr.shortest_path("source:mark", "character:jesus")
+    with pytest.raises(nx.NodeNotFound):
+        csr.shortest_path("character:nobody", "character:jesus")
+
+
+def test_views_collapse_parallel_edges() -> None:
+    elements = [
+        GraphNode(id="a", label="A", type="character"),
+        GraphNode(id="b", label="B", type="character"),
+        GraphEdge(id="e1", source="a", target="b", type="x"),
+        GraphEdge(id="e2", source="a", target="b", type="y"),
+        GraphEdge(id="e3", source="b", target="a", type="x"),
+    ]
+    csr = CSRGraph.from_elements(elements)
+
+    assert csr.num_edges == 3
+    assert csr.simple().num_edges == 2
+    assert csr.undirected().num_edges == 2
+    assert csr.neighbors("a") == ["b", "b"]
+
+
+def test_networkx_round_trip(corpus_graphs) -> None:
+    csr, multi = corpus_graphs
+    exported = csr.to_networkx()
+
+    assert exported.number_of_nodes() == multi.number_of_nodes()
+    assert exported.number_of_edges() == multi.number_of_edges()
+    assert exported.nodes["character:jesus"]["type"] == "character"
+    assert CSRGraph.from_networkx(exported).num_edges == csr.num_edges
+
+
+def test_analytics_session_uses_csr_core() -> None:
+    session = graph_network.GraphAnalytics(snapshot=build_graph_snapshot())
+
+    assert session.csr is not None
+    metrics = session.compute(["degree", "pagerank"])
+    assert "character:jesus" in metrics["pagerank"]
+    assert session._graph is None
+
+
+def _two_cliques() -> CSRGraph:
+    left = [f"l{i}" for i in range(6)]
+    right = [f"r{i}" for i in range(6)]
+    edges = [
+        GraphEdge(id=f"{a}-{b}", source=a, target=b, type="link")
+        for group in (left, right)
+        for a in group
+        for b in group
+        if a < b
+    ]
+    edges.append(GraphEdge(id="bridge", source="l0", target="r0", type="link"))
+    return CSRGraph.from_elements(edges)
+
+
+def test_betweenness_matches_networkx_and_samples_reproducibly(corpus_graphs) -> None:
+    csr, multi = corpus_graphs
+    digraph = graph_network._as_simple_digraph(multi)
+
+    assert _close(csr.betweenness_centrality(), nx.betweenness_centrality(digraph))
+    assert csr.betweenness_centrality(k=csr.num_nodes) == csr.betweenness_centrality()
+
+    sampled = csr.betweenness_centrality(k=40, seed=3)
+    assert sampled == csr.betweenness_centrality(k=40, seed=3)
+    assert max(sampled, key=sampled.get) == "character:jesus"
+    with pytest.raises(ValueError):
+        csr.betweenness_centrality(k=0)
+
+
+def test_label_propagation_separates_cliques() -> None:
+    communities = _two_cliques().label_propagation_communities(seed=1)
+
+    assert sorted(map(sorted, communities)) == [
+        [f"l{i}" for i in range(6)],
+        [f"r{i}" for i in range(6)],
+    ]
+    assert _two_cliques().label_propagation_communities(seed=1, time_budget=0.0)
+
+
+def test_community_methods_via_session() -> None:
+    session = graph_network.GraphAnalytics(graph=_two_cliques().to_networkx())
+
+    for method in graph_network.COMMUNITY_METHODS:
+        communities = session.metric("communities", community_method=method, seed=2, time_budget=5.0)
+        assert {len(comm) for comm in communities} == {6}, method
+    assert session.metric("communities", community_method="louvain", seed=2, time_budget=5.0) is session.metric(
+        "communities", community_method="louvain", seed=2, time_budget=5.0
+    )
+    with pytest.raises(ValueError, match="Unknown community method"):
+        session.compute("communities", community_method="spectral")
+
+
+def test_louvain_respects_time_budget() -> None:
+    graph = _two_cliques().to_networkx().to_undirected()
+
+    communities = graph_network.louvain_communities(nx.Graph(graph), seed=0, time_budget=0.0)
+    assert sum(len(comm) for comm in communities) == 12
+
+
+def test_pure_python_pagerank_matches_csr(corpus_graphs) -> None:
+    csr, graph = corpus_graphs
+    expected = csr.pagerank()
+    actual = graph_network._pagerank(graph_network._as_simple_digraph(graph))
+
+    assert _close(actual, expected, tol=1e-12)
@@ -0,0 +1,105 @@
+"""Tests for server-side graph layout in bce.analytics.layout."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bce import api, storage
+from bce.analytics import layout
+from bce.analytics.csr import CSRGraph
+from bce.export_graph import GraphEdge, build_graph_snapshot
+from bce.models import Character
+
+
+def test_force_layout_is_bounded_and_deterministic() -> None:
+    csr = CSRGraph.from_snapshot(build_graph_snapshot())
+    first = layout.force_layout(csr, iterations=30)
+
+    assert first.shape == (csr.num_nodes, 2)
+    assert np.abs(first).max() == pytest.approx(1.0)
+    assert np.array_equal(first, layout.force_layout(csr, iterations=30))
+
+
+def test_force_layout_pulls_neighbours_together() -> None:
+    pairs = ("ab", "bc", "ca", "de", "ef", "fd")
+    edges = [GraphEdge(id=pair, source=pair[0], target=pair[1], type="link") for pair in pairs]
+    edges.append(GraphEdge(id="cd", source="c", target="d", type="link"))
+    csr = CSRGraph.from_elements(edges)
+    pos = dict(zip(csr.node_ids, layout.force_layout(csr, iterations=100)))
+
+    def dist(u: str, v: str) -> float:
+        return float(np.linalg.norm(pos[u] - pos[v]))
+
+    assert dist("a", "b") < dist("a", "e")
+    assert dist("d", "f") < dist("b", "f")
+
+
+def test_tiny_graphs() -> None:
+    single = CSRGraph.from_elements([GraphEdge(id="loop", source="a", target="a", type="link")])
+    assert layout.force_layout(single).tolist() == [[0.0, 0.0]]
+    assert layout.force_layout(CSRGraph.from_elements([])).shape == (0, 2)
+
+
+def test_layout_cached_per_corpus_version(tmp_path: Path) -> None:
+    storage.configure_data_root(tmp_path / "layout_data")
+    try:
+        storage.save_character(
+            Character(id="alpha", canonical_name="Alpha", relationships=[{"target_id": "beta", "type": "sibling"}])
+        )
+        storage.save_character(Character(id="beta", canonical_name="Beta"))
+
+        first = layout.get_graph_layout()
+        assert layout.get_graph_layout() is first
+        assert set(first) == {"character:alpha", "character:beta"}
+
+        storage.save_character(Character(id="gamma", canonical_name="Gamma"))
+        assert "character:gamma" in layout.get_graph_layout()
+    finally:
+        storage.reset_data_root()
+
+
+def test_payload_carries_positions() -> None:
+    with_layout = json.loads(api.graph_payload_json())
+    plain = json.loads(api.graph_payload_json(with_layout=False))
+    positions = layout.get_graph_layout()
+
+    for node in with_layout["nodes"]:
+        assert [node["properties"]["x"], node["properties"]["y"]] == list(positions[node["id"]])
+    assert all("x" not in node["properties"] for node in plain["nodes"])
+    assert with_layout["edges"] == plain["edges"]
+    assert api.graph_payload_json() is api.graph_payload_json()
+
+
+def test_neighborhood_positions_come_from_corpus_layout() -> None:
+    result = api.graph_neighborhood("character:peter", positions=True)
+
+    positions = layout.get_graph_layout()
+    assert result["positions"]["character:peter"] == list(positions["character:peter"])
+    assert set(result["positions"]) == set(result["depth"])
+
+
+def test_large_graphs_skip_dense_spectral_start(monkeypatch) -> None:
+    csr = CSRGraph.from_snapshot(build_graph_snapshot())
+    rng = np.random.default_rng(0)
+    monkeypatch.setattr(layout, "_sparse_spectral_vectors", lambda csr, rng: None)
+
+    assert layout._spectral_start(csr, rng, dense_limit=csr.num_nodes - 1) is None
+    assert layout._spectral_start(csr, rng).shape == (csr.num_nodes, 2)
+    # Without a spectral start the layout begins at random and stays bounded.
+    assert np.abs(layout.force_layout(csr, iterations=5, spectral_limit=0)).max() == pytest.approx(1.0)
+
+
+def test_sparse_spectral_start_returns_two_vectors() -> None:
+    pytest.importorskip("scipy")
+    csr = CSRGraph.from_snapshot(build_graph_snapshot())
+
+    sparse = layout._sparse_spectral_vectors(csr, np.random.default_rng(0))
+
+    assert sparse is not None
+    assert sparse.shape == (csr.num_nodes, 2)
+    assert np.all(np.isfinite(sparse))
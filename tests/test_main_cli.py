@@ -122,6 +122,41 @@ class TestEventCommand:
             assert "# " in captured.out, f"No markdown header for {event_id}"
 
 
+class TestExportCommand:
+    """Test 'bce export' command."""
+
+    def test_export_selected_formats(self, tmp_path, capsys):
+        exit_code = main(["export", "--formats", "csv,bibtex", "--out", str(tmp_path)])
+        captured = capsys.readouterr()
+
+        assert exit_code == 0
+        assert (tmp_path / "csv" / "characters.csv").exists()
+        assert (tmp_path / "bibtex" / "citations.bib").exists()
+        assert not (tmp_path / "json").exists()
+        assert "Timings:" in captured.out
+        assert "write:csv" in captured.out
+
+    def test_export_rejects_unknown_format(self, tmp_path, capsys):
+        exit_code = main(["export", "--formats", "pdf", "--out", str(tmp_path)])
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert "Unknown export format" in captured.err
+
+
+class TestExportSqliteCommand:
+    """Test 'bce export-sqlite' command."""
+
+    def test_export_sqlite_writes_database(self, tmp_path, capsys):
+        db = tmp_path / "bce.db"
+        exit_code = main(["export-sqlite", "--out", str(db)])
+        captured = capsys.readouterr()
+
+        assert exit_code == 0
+        assert db.exists()
+        assert "characters:" in captured.out
+
+
 class TestArgumentParsing:
     """Test argument parsing and validation."""
 
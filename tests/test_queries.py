@@ -278,3 +278,44 @@ class TestClearCache:
         # Should still work after multiple clears
         char = queries.get_character("jesus")
         assert char.id == "jesus"
+
+
+class TestCharacterDisplayNames:
+    """Test the corpus-wide display-name table."""
+
+    def test_display_names_cover_all_characters(self):
+        """Every character ID should map to its canonical name."""
+        names = queries.character_display_names()
+
+        assert set(names) == set(queries.list_character_ids())
+        assert names["jesus"] == "Jesus of Nazareth"
+
+    def test_get_character_display_name_falls_back_to_id(self):
+        """Unknown IDs should resolve to themselves."""
+        assert queries.get_character_display_name("jesus") == "Jesus of Nazareth"
+        assert queries.get_character_display_name("nonexistent") == "nonexistent"
+
+    def test_display_names_returns_copy(self):
+        """Mutating the returned table should not affect later lookups."""
+        names = queries.character_display_names()
+        names["jesus"] = "changed"
+
+        assert queries.get_character_display_name("jesus") == "Jesus of Nazareth"
+
+    def test_clear_cache_rebuilds_display_names(self, monkeypatch):
+        """clear_cache should drop the table so it is rebuilt on next use."""
+        queries.character_display_names()
+        queries.clear_cache()
+
+        calls = []
+        original = queries.storage.list_character_ids
+
+        def counting_list_ids():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(queries.storage, "list_character_ids", counting_list_ids)
+        queries.get_character_display_name("jesus")
+        queries.get_character_display_name("paul")
+
+        assert calls == [1]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import pytest
+
+from bce import references
+from bce.references import ScriptureReference
+
+
+def _spans(text):
+    return [str(ref) for ref in references.parse_references(text)]
+
+
+class TestBookLookup:
+    @pytest.mark.parametrize(
+        "name, book_id",
+        [
+            ("Mark", 41),
+            ("mk", 41),
+            ("Mr.", 41),
+            ("Marcos", 41),
+            ("马可福音", 41),
+            ("1 Cor", 46),
+            ("I Corinthians", 46),
+            ("First Corinthians", 46),
+            ("1st Samuel", 9),
+            ("III John", 64),
+            ("Song of Songs", 22),
+            ("Apocalypse", 66),
+            ("Philipp", 50),
+        ],
+    )
+    def test_names_and_abbreviations_in_any_language(self, name, book_id) -> None:
+        book = references.lookup_book(name)
+
+        assert book is not None
+        assert book.id == book_id
+
+    def test_unknown_and_ambiguous_names(self) -> None:
+        assert references.lookup_book("1 Enoch") is None
+        assert references.lookup_book("Cor") is None  # 1 or 2 Corinthians
+
+    def test_all_books_have_chapter_counts(self) -> None:
+        books = references.all_books()
+
+        assert [book.id for book in books] == list(range(1, 67))
+        assert books[0].name == "Genesis" and books[0].chapters == 50
+        assert references.get_book(41).chapters == 16
+        assert references.get_book(57).single_chapter
+
+    def test_shortcuts_expand_to_book_ranges(self) -> None:
+        assert [book.name for book in references.expand_shortcut("Gospels")] == [
+            "Matthew",
+            "Mark",
+            "Luke",
+            "John",
+        ]
+        assert references.expand_shortcut("Paul")[0].name == "Romans"
+        assert references.expand_shortcut("not a shortcut") == []
+
+
+class TestParseReferences:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("John 3:16", ["John 3:16"]),
+            ("Mark 16:1-8", ["Mark 16:1-8"]),
+            ("Mark 14:66-15:5", ["Mark 14:66-15:5"]),
+            ("Matthew 5-7", ["Matthew 5-7"]),
+            ("Matthew 23", ["Matthew 23"]),
+            ("Philemon 24", ["Philemon 1:24"]),
+            ("Jude 3-5", ["Jude 1:3-5"]),
+            ("Mark 14:10-11, 43-50", ["Mark 14:10-11", "Mark 14:43-50"]),
+            ("John 18:28-40; 19:1-16", ["John 18:28-40", "John 19:1-16"]),
+            ("1 Cor 15:3-8", ["1 Corinthians 15:3-8"]),
+            ("Mk 1.9", ["Mark 1:9"]),
+            ("Matt. 5:3–12", ["Matthew 5:3-12"]),
+            ("Marcos 1:9", ["Mark 1:9"]),
+        ],
+    )
+    def test_corpus_forms(self, text, expected) -> None:
+        assert _spans(text) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "N/A", "4Q180 (Ages of Creation)", "Babylonian Talmud Yoma 67b", "1 Enoch 6:7", "Mark abc:1"],
+    )
+    def test_non_references_parse_to_nothing(self, text) -> None:
+        assert references.parse_references(text) == ()
+        assert references.parse_reference(text) is None
+
+    def test_strict_parse_reports_unknown_book(self) -> None:
+        with pytest.raises(references.ReferenceParseError) as exc:
+            references.parse_reference_strict("nonexistent 1:1")
+        assert exc.value.book == "Nonexistent"
+
+        with pytest.raises(references.ReferenceParseError) as exc:
+            references.parse_reference_strict("NotAValidReference")
+        assert exc.value.book is None
+
+    def test_results_are_memoized(self) -> None:
+        first = references.parse_references("Mark 16:1-8")
+
+        assert references.parse_references("Mark 16:1-8") is first
+
+
+class TestOverlap:
+    def test_verse_and_chapter_spans(self) -> None:
+        passion = references.parse_reference("Mark 14:66-15:5")
+
+        assert passion.overlaps(references.parse_reference("Mark 15:1"))
+        assert passion.overlaps(references.parse_reference("Mark 14"))
+        assert not passion.overlaps(references.parse_reference("Mark 15:6"))
+        assert not passion.overlaps(references.parse_reference("Matthew 15:1"))
+
+    def test_whole_chapter_runs_to_chapter_end(self) -> None:
+        chapters = ScriptureReference(40, "Matthew", 5, None, 7, None)
+
+        assert chapters.overlaps(references.parse_reference("Matthew 7:29"))
+        assert not chapters.overlaps(references.parse_reference("Matthew 8:1"))
+
+
+class TestVersification:
+    def test_bundled_table_covers_translated_books(self) -> None:
+        assert references.max_verse(41, 16) == 20
+        assert references.max_verse(1, 50) == 26
+        assert references.max_verse(19, 119) is None  # Psalms: no bundled translation
+        assert references.max_verse(41, 17) is None
+        assert references.max_verse(99, 1) is None
+
+    def test_disagreeing_translations_keep_the_larger_count(self) -> None:
+        table = references.build_versification(["tyndale", "rv_1858"])
+
+        assert table["books"]["64"] == [15]
+        assert table["books"]["19"] == []
+
+    def test_bundled_table_is_current(self) -> None:
+        import json
+
+        with references._VERSIFICATION_PATH.open(encoding="utf-8") as f:
+            bundled = json.load(f)
+
+        assert bundled == references.build_versification(bundled["translations"])
+
+    def test_write_and_reload(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "versification.json"
+        monkeypatch.setattr(references, "_VERSIFICATION_PATH", path)
+        references._versification.cache_clear()
+        try:
+            assert references.max_verse(41, 16) is None
+            references.write_versification(path, ["rv_1858"])
+            assert references.max_verse(41, 16) == 20
+            assert references.max_verse(1, 1) is None
+        finally:
+            monkeypatch.undo()
+            references._versification.cache_clear()
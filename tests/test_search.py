@@ -13,3 +13,10 @@ def test_search_accounts_finds_crucifixion() -> None:
     results = search_all("crucified", scope=["accounts"])
 
     assert any(r["type"] == "event" and r["id"] == "crucifixion" for r in results)
+
+
+def test_search_reference_query_matches_overlapping_accounts() -> None:
+    results = search_all("Mk 15:25", scope=["accounts"])
+
+    assert any(r["id"] == "crucifixion" and r["reference"] == "Mark 15:21-41" for r in results)
+    assert not search_all("Mk 15:99", scope=["accounts"])
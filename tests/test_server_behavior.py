@@ -101,10 +101,10 @@ class TestStatsEndpoint:
         assert data["total_conflicts"] >= 0
         assert data["total_tags"] >= 0
 
-    @patch("bce.server.api.list_character_ids")
-    def test_stats_handles_api_errors(self, mock_list, client):
+    @patch("bce.server.api.get_corpus_stats")
+    def test_stats_handles_api_errors(self, mock_stats, client):
         """Test stats endpoint handles API errors gracefully."""
-        mock_list.side_effect = Exception("Test error")
+        mock_stats.side_effect = Exception("Test error")
         response = client.get("/api/stats")
         assert response.status_code == 500
         assert "Test error" in response.json()["detail"]
@@ -144,6 +144,15 @@ class TestCharacterEndpoints:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    def test_get_character_hydrates_text(self, client):
+        """Test the dossier can carry verse text for its references."""
+        response = client.get("/api/characters/peter", params={"hydrate_text": "tyndale"})
+        assert response.status_code == 200
+        assert response.json()["text_translation"] == "tyndale"
+
+        response = client.get("/api/characters/peter", params={"hydrate_text": "no_such_translation"})
+        assert response.status_code == 404
+
     @patch("bce.server.api.list_character_ids")
     def test_list_characters_handles_errors(self, mock_list, client):
         """Test character listing handles errors."""
@@ -327,7 +336,14 @@ class TestGraphEndpoint:
             assert "type" in edge
             assert "properties" in edge
 
-    @patch("bce.server.api.build_graph_snapshot")
+    def test_graph_nodes_carry_layout(self, client):
+        pytest.importorskip("numpy")
+        nodes = client.get("/api/graph").json()["nodes"]
+        assert all(-1.0 <= node["properties"]["x"] <= 1.0 for node in nodes)
+        plain = client.get("/api/graph?layout=false").json()["nodes"]
+        assert all("x" not in node["properties"] for node in plain)
+
+    @patch("bce.server.api.graph_payload_json")
     def test_graph_handles_errors(self, mock_graph, client):
         """Test graph endpoint handles errors."""
         mock_graph.side_effect = Exception("Graph error")
@@ -335,6 +351,82 @@ class TestGraphEndpoint:
         assert response.status_code == 500
 
 
+class TestGraphNeighborhoodEndpoint:
+    """Test the ego-network graph endpoint."""
+
+    def test_returns_subgraph(self, client):
+        response = client.get("/api/graph/neighborhood?node_id=character:peter&hops=1&limit=15&positions=true")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["center"] == "character:peter"
+        assert 1 < len(data["nodes"]) <= 15
+
+    def test_returns_positions(self, client):
+        pytest.importorskip("numpy")
+        response = client.get("/api/graph/neighborhood?node_id=character:peter&hops=1&limit=15&positions=true")
+        data = response.json()
+        assert set(data["positions"]) == {node["id"] for node in data["nodes"]}
+        assert all(len(xy) == 2 for xy in data["positions"].values())
+
+    def test_edge_type_filter(self, client):
+        response = client.get(
+            "/api/graph/neighborhood?node_id=character:peter&edge_types=character_relationship"
+        )
+        assert response.status_code == 200
+        assert {edge["type"] for edge in response.json()["edges"]} <= {"character_relationship"}
+
+    def test_unknown_node_returns_404(self, client):
+        response = client.get("/api/graph/neighborhood?node_id=character:nobody")
+        assert response.status_code == 404
+
+
+class TestGraphMetricsEndpoint:
+    """Test the batched graph metrics endpoint."""
+
+    def test_returns_requested_metrics(self, client):
+        response = client.get("/api/graph/metrics?metrics=degree,communities&top=5")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"degree", "communities"}
+        assert len(data["degree"]) == 5
+        assert any("character:jesus" in comm for comm in data["communities"])
+
+    def test_unknown_metric_returns_400(self, client):
+        response = client.get("/api/graph/metrics?metrics=pagerankish")
+        assert response.status_code == 400
+
+    def test_sampled_betweenness_and_label_propagation(self, client):
+        response = client.get(
+            "/api/graph/metrics?metrics=betweenness,communities"
+            "&betweenness_k=20&seed=5&community_method=label_propagation&time_budget=2"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["betweenness"]
+        assert sum(len(comm) for comm in data["communities"]) == len(data["betweenness"])
+        assert client.get("/api/graph/metrics?community_method=spectral").status_code == 400
+
+
+class TestSourceDisagreementEndpoint:
+    """Test the source disagreement heatmap endpoint."""
+
+    def test_returns_matrix(self, client):
+        pytest.importorskip("numpy")
+        response = client.get("/api/analytics/source-disagreement?sources=mark,luke&top=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sources"] == ["mark", "luke"]
+        assert len(data["matrix"]) == 2
+        assert len(data["pairs"]) <= 1
+        assert data["by_claim_type"] == {}
+
+    @patch("bce.server.api.source_disagreement_matrix")
+    def test_missing_numpy_returns_501(self, mock_matrix, client):
+        mock_matrix.side_effect = ImportError("numpy is required")
+        response = client.get("/api/analytics/source-disagreement")
+        assert response.status_code == 501
+
+
 class TestConflictEndpoints:
     """Test conflict-related endpoints."""
 
@@ -451,6 +543,17 @@ class TestStaticFilesAndFrontend:
         assert response.status_code == 404
 
 
+class TestBibleCacheEndpoint:
+    @patch("bce.server.api.get_bible_cache_stats")
+    def test_returns_cache_stats(self, mock_stats, client):
+        mock_stats.return_value = {"hits": 3, "misses": 1, "translations": []}
+
+        response = client.get("/api/bibles/cache")
+
+        assert response.status_code == 200
+        assert response.json()["hits"] == 3
+
+
 class TestRunServerFunction:
     """Test the run_server function."""
 
@@ -476,6 +579,15 @@ class TestRunServerFunction:
         assert call_kwargs["port"] == 8000
         assert call_kwargs["reload"] is False
 
+    @patch("bce.server.api.preload_bible_translations", return_value=["tyndale"])
+    @patch("bce.server.uvicorn.run")
+    def test_run_server_preloads_bible_translations(self, mock_run, mock_preload, capsys):
+        """Test run_server warms the configured Bible translations."""
+        server.run_server()
+
+        mock_preload.assert_called_once_with()
+        assert "tyndale" in capsys.readouterr().out
+
     @patch("bce.server.uvicorn.run")
     @patch("builtins.print")
     def test_run_server_prints_startup_messages(self, mock_print, mock_run):
@@ -663,3 +775,22 @@ class TestEdgeCasesAndIntegration:
         assert "openapi" in schema
         assert "info" in schema
         assert schema["info"]["title"] == "Biblical Character Engine API"
+
+
+class TestBibleSearchEndpoint:
+    @patch("bce.server.api.search_verses")
+    def test_passes_paging(self, mock_search, client):
+        mock_search.return_value = {"total": 0, "results": []}
+
+        response = client.get("/api/bibles/search?q=azazel&translation=tyndale&offset=20&limit=10")
+
+        assert response.status_code == 200
+        mock_search.assert_called_once_with("azazel", translation="tyndale", offset=20, limit=10)
+
+    @patch("bce.server.api.search_verses")
+    def test_unknown_translation_is_404(self, mock_search, client):
+        mock_search.side_effect = FileNotFoundError("no such translation")
+
+        response = client.get("/api/bibles/search?q=azazel&translation=nope")
+
+        assert response.status_code == 404
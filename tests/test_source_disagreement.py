@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from bce import api, queries
+from bce.analytics import disagreement
+from bce.models import Character, SourceProfile
+
+
+def _character(char_id: str, profiles) -> Character:
+    return Character(
+        id=char_id,
+        canonical_name=char_id.title(),
+        source_profiles=[SourceProfile(source_id=src, traits=traits) for src, traits in profiles],
+    )
+
+
+def _reference_counts(characters):
+    """Pure-Python pairwise counts used to cross-check the vectorized path."""
+    counts = {}
+    for character in characters:
+        trait_map = {}
+        for profile in character.source_profiles:
+            for trait, value in profile.traits.items():
+                trait_map.setdefault(trait, {})[profile.source_id] = value
+        for per_source in trait_map.values():
+            attested = sorted(src for src, value in per_source.items() if value)
+            for a, b in combinations(attested, 2):
+                shared, agree = counts.get((a, b), (0, 0))
+                counts[(a, b)] = (shared + 1, agree + (per_source[a] == per_source[b]))
+    return counts
+
+
+def test_counts_agreements_and_disagreements() -> None:
+    characters = [
+        _character(
+            "alpha",
+            [
+                ("mark", {"death": "crucified", "home": "Nazareth"}),
+                ("luke", {"death": "crucified", "home": "Bethlehem"}),
+                ("john", {"death": "stoned"}),
+            ],
+        ),
+        _character("beta", [("mark", {"home": "Capernaum"}), ("luke", {"home": "Capernaum", "role": ""})]),
+    ]
+
+    result = disagreement.compute_source_disagreement(characters)
+    matrix = result["overall"]
+    assert matrix.sources == ["john", "luke", "mark"]
+
+    idx = {src: i for i, src in enumerate(matrix.sources)}
+    luke, mark, john = idx["luke"], idx["mark"], idx["john"]
+    assert matrix.co_attested[luke, mark] == 3
+    assert matrix.agreements[luke, mark] == 2
+    assert matrix.disagreements[luke, mark] == 1
+    assert matrix.disagreements[john, mark] == 1
+    assert matrix.disagreements[john, john] == 0
+    assert (matrix.co_attested == matrix.co_attested.T).all()
+    assert result["by_claim_type"] == {}
+
+
+def test_to_dict_is_heatmap_ready() -> None:
+    characters = [
+        _character("alpha", [("mark", {"death": "crucified"}), ("luke", {"death": "stoned"})]),
+        _character("beta", [("paul", {"title": "apostle"})]),
+    ]
+    payload = disagreement.compute_source_disagreement(characters).get("overall").to_dict()
+
+    assert payload["sources"] == ["luke", "mark", "paul"]
+    assert payload["matrix"][0][1] == 1.0
+    assert payload["matrix"][0][2] is None
+    assert payload["pairs"] == [
+        {
+            "source_a": "luke",
+            "source_b": "mark",
+            "co_attested": 1,
+            "agreements": 0,
+            "disagreements": 1,
+            "disagreement_rate": 1.0,
+        }
+    ]
+
+
+def test_sources_argument_restricts_and_orders_columns() -> None:
+    characters = [
+        _character("alpha", [("mark", {"death": "a"}), ("luke", {"death": "b"}), ("john", {"death": "a"})]),
+    ]
+    matrix = disagreement.compute_source_disagreement(characters, sources=["mark", "john"])["overall"]
+    assert matrix.sources == ["mark", "john"]
+    assert matrix.agreements.tolist() == [[1, 1], [1, 1]]
+
+
+def test_claim_type_breakdown_partitions_overall() -> None:
+    result = disagreement.compute_source_disagreement(by_claim_type=True)
+    overall = result["overall"]
+    assert result["by_claim_type"]
+
+    total = sum(m.co_attested for m in result["by_claim_type"].values())
+    assert (total == overall.co_attested).all()
+
+
+def test_matches_reference_on_bundled_corpus() -> None:
+    characters = queries.list_all_characters()
+    matrix = disagreement.compute_source_disagreement(characters)["overall"]
+    idx = {src: i for i, src in enumerate(matrix.sources)}
+
+    expected = _reference_counts(characters)
+    for (a, b), (shared, agree) in expected.items():
+        assert matrix.co_attested[idx[a], idx[b]] == shared
+        assert matrix.agreements[idx[a], idx[b]] == agree
+    assert int(matrix.co_attested.sum() - matrix.co_attested.trace()) == 2 * sum(
+        shared for shared, _ in expected.values()
+    )
+
+
+def test_api_wrapper_returns_serializable_payload() -> None:
+    payload = api.source_disagreement_matrix(by_claim_type=True, top=3)
+    assert len(payload["pairs"]) <= 3
+    assert len(payload["matrix"]) == len(payload["sources"])
+    for nested in payload["by_claim_type"].values():
+        assert nested["sources"] == payload["sources"]
@@ -244,3 +244,114 @@ def test_run_validation_force_true_runs_even_when_disabled(monkeypatch) -> None:
     assert report.errors == ["boom"]
     assert report.warnings == ["warn"]
     assert report.skipped is False
+
+
+def test_validation_engine_loads_each_object_once(monkeypatch) -> None:
+    """The engine shares one loaded corpus across all rules."""
+
+    from bce import queries
+    from bce.validation import ValidationEngine
+
+    calls = {"characters": 0, "events": 0}
+    get_character = queries.get_character
+    get_event = queries.get_event
+
+    def counting_character(char_id):
+        calls["characters"] += 1
+        return get_character(char_id)
+
+    def counting_event(event_id):
+        calls["events"] += 1
+        return get_event(event_id)
+
+    monkeypatch.setattr("bce.validation.queries.get_character", counting_character)
+    monkeypatch.setattr("bce.validation.queries.get_event", counting_event)
+
+    report = ValidationEngine().run()
+
+    assert report.success
+    assert calls["characters"] == len(queries.list_character_ids())
+    assert calls["events"] == len(queries.list_event_ids())
+    assert set(report.timings) == {"load", "characters", "events", "cross_references", "trait_keys"}
+    assert report.to_dict()["timings"] == report.timings
+
+
+def test_validation_engine_parallel_matches_sequential(monkeypatch) -> None:
+    """Running rules on threads reports the same messages in rule order."""
+
+    from bce.validation import ValidationContext, ValidationEngine, ValidationRule
+
+    class Numbered(ValidationRule):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def check(self, ctx, errors, warnings) -> None:
+            errors.append(f"{self.name}: {len(ctx.character_ids)} characters")
+            warnings.append(self.name)
+
+    rules = [Numbered(f"rule_{i}") for i in range(6)]
+    ctx = ValidationContext.load()
+
+    sequential = ValidationEngine(rules, workers=1).run(ctx)
+    parallel = ValidationEngine(rules, workers=4).run(ctx)
+
+    assert parallel.errors == sequential.errors
+    assert parallel.warnings == [f"rule_{i}" for i in range(6)]
+    assert list(parallel.timings) == [f"rule_{i}" for i in range(6)]
+
+
+def test_registered_rules_run_in_validate_all_and_failures_are_reported() -> None:
+    """Custom rules join validate_all; a crashing rule becomes an error."""
+
+    from bce.validation import ValidationRule, list_rules, register_rule, unregister_rule
+
+    class Flaky(ValidationRule):
+        name = "flaky"
+
+        def check(self, ctx, errors, warnings) -> None:
+            raise RuntimeError("boom")
+
+    register_rule(Flaky())
+    try:
+        assert [rule.name for rule in list_rules()][-1] == "flaky"
+        assert validate_all() == ["Validation rule 'flaky' failed: boom"]
+    finally:
+        unregister_rule("flaky")
+
+    assert "flaky" not in [rule.name for rule in list_rules()]
+    assert validate_all() == []
+
+
+def test_validation_rules_must_implement_check() -> None:
+    import pytest
+
+    from bce.validation import ValidationRule
+
+    class Incomplete(ValidationRule):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_validate_trait_keys_loads_characters_only(monkeypatch) -> None:
+    from bce import validation
+
+    def no_events(event_id):
+        raise AssertionError("validate_trait_keys should not load events")
+
+    character = SimpleNamespace(
+        source_profiles=[SimpleNamespace(source_id="mark", traits={"favourite_colour": "blue"})]
+    )
+    monkeypatch.setattr(validation, "_uses_bundled_data", lambda: False)
+    monkeypatch.setattr("bce.validation.queries.list_character_ids", lambda: ["x"])
+    monkeypatch.setattr("bce.validation.queries.get_character", lambda char_id: character)
+    monkeypatch.setattr("bce.validation.queries.list_event_ids", no_events)
+    monkeypatch.setattr("bce.validation.queries.get_event", no_events)
+
+    errors: list = []
+    warnings: list = []
+    validation.validate_trait_keys(errors, warnings)
+
+    assert errors == []
+    assert len(warnings) == 1 and "favourite_colour" in warnings[0]
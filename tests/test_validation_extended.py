@@ -450,3 +450,48 @@ class TestValidateReferenceInContext:
         # Should not crash on None reference
         # No errors should be reported for non-string references
         assert len(errors) == 0 or not any("None" in error for error in errors)
+
+
+class TestValidateReferenceParser:
+    """validate_reference covers every canonical book and the corpus' reference forms."""
+
+    def test_abbreviations_and_other_languages_resolve(self):
+        assert validate_reference("1 Cor 15:3-8")["book"] == "1 Corinthians"
+        result = validate_reference("Marcos 1:9")
+        assert result["valid"] is True
+        assert result["book"] == "Mark"
+        assert result["book_id"] == 41
+
+    def test_old_testament_chapter_bounds(self):
+        assert validate_reference("Leviticus 16:8")["valid"] is True
+        result = validate_reference("Leviticus 28:1")
+        assert result["valid"] is False
+        assert "only 27 chapters" in result["error"]
+
+    def test_cross_chapter_and_multi_part_references(self):
+        result = validate_reference("Mark 14:66-15:5")
+        assert result["valid"] is True
+        assert (result["chapter"], result["end_chapter"]) == (14, 15)
+
+        assert validate_reference("Mark 14:10-11, 43-50")["valid"] is True
+        result = validate_reference("John 18:28-40; 22:1-16")
+        assert result["valid"] is False
+        assert "only 21 chapters" in result["error"]
+
+    def test_whole_chapter_references(self):
+        result = validate_reference("Matthew 5-7")
+        assert result["valid"] is True
+        assert result["verse_start"] is None
+
+        assert validate_reference("Matthew 7-5")["error"] == "Invalid chapter range"
+
+    def test_verse_upper_bounds(self):
+        assert validate_reference("Mark 16:20")["valid"] is True
+        result = validate_reference("Mark 16:21")
+        assert result["valid"] is False
+        assert result["error"] == "Mark 16 has only 20 verses"
+
+        assert validate_reference("Mark 14:66-15:48")["error"] == "Mark 15 has only 47 verses"
+        assert validate_reference("Genesis 50:27")["valid"] is False
+        # Books without a bundled translation are only checked by chapter.
+        assert validate_reference("Isaiah 53:99")["valid"] is True